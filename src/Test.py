@@ -38,6 +38,15 @@ def main():
 	print('=================================================================')
 	myTests.testSciMethDataSmTimeline.runTests()
 	print(' ')
+	print('=================================================================')
+	myTests.testSciMethDataSmTimelineEventStore.runTests()
+	print(' ')
+	print('=================================================================')
+	myTests.testSciMethDataSmTimelineMembership.runTests()
+	print(' ')
+	print('=================================================================')
+	myTests.testSciMethDataSmMeasurement.runTests()
+	print(' ')
 
 
 	
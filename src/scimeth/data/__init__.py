@@ -30,6 +30,10 @@ SciMeth's data model.
 +-------------+--------+------------------------------------------------------+
 | 18-Apr-2020 | FOE    | - Added classes smMeasurement.                       |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added class smTimelineEventStore.                  |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added class smTimelineMembership.                  |
++-------------+--------+------------------------------------------------------+
 
 
 .. seealso:: None
@@ -44,6 +48,8 @@ from .smIdentifiable import smIdentifiable
 from .smMeasurementUnit import smMeasurementUnit
 from .smTimelineEvent import smTimelineEvent
 from .smTimelineCondition import smTimelineCondition
+from .smTimelineEventStore import smTimelineEventStore
+from .smTimelineMembership import smTimelineMembership
 from .smTimeline import smTimeline
 from .smMeasurement import smMeasurement
 
@@ -34,6 +34,37 @@ This module declares the mixin class ***smIdentifiable***
 | 14-Mar-2020 | FOE    | - :meth:`__str__` now now admits parameter           |
 |             |        |   `indentationLevel`.                                |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added protected class method :meth:`_reserveIDs`.  |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Attributes are now declared in `__slots__`, so     |
+|             |        |   that subclasses declaring their own `__slots__`    |
+|             |        |   (e.g. :class:`smTimelineEvent`) have no per        |
+|             |        |   instance `__dict__`.                               |
+|             |        | - Added protected method :meth:`_getAttributes`.     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Ids are now allocated under a lock, so that        |
+|             |        |   objects constructed in parallel threads do not     |
+|             |        |   get the same id. The nextID is now keyed by the    |
+|             |        |   class rather than by its name.                     |
+|             |        | - Added class methods :meth:`resetIDs` and           |
+|             |        |   :meth:`partitionIDs`.                              |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added an optional registry of instances by id per  |
+|             |        |   subclass, holding weak references. Added class     |
+|             |        |   methods :meth:`enableRegistry` and                 |
+|             |        |   :meth:`getInstance`, and protected method          |
+|             |        |   :meth:`_register`.                                 |
+|             |        | - Instances now support weak references.             |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The registry no longer overwrites the entry of a   |
+|             |        |   live instance with another instance with the same  |
+|             |        |   id (e.g. a copy).                                  |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Protected class method `_reserveIDs` is now the    |
+|             |        |   public class method :meth:`reserveIDs`, so that    |
+|             |        |   blocks of ids can be reserved for bulk creation.   |
+|             |        |   It checks its parameter.                           |
++-------------+--------+------------------------------------------------------+
 
 
 .. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
@@ -47,6 +78,8 @@ This module declares the mixin class ***smIdentifiable***
 #import deprecation
 
 #import os
+import threading
+import weakref
 
 
 #from scimeth import __version__
@@ -154,6 +187,33 @@ class smIdentifiable:
 	
 	* https://stackoverflow.com/questions/9575409/calling-parent-class-init-with-multiple-inheritance-whats-the-right-way
 	* https://stackoverflow.com/questions/533631/what-is-a-mixin-and-why-are-they-useful
+	
+	The attributes of this class are declared in `__slots__`. Hence,
+	it cannot be mixed with other base classes also declaring
+	non-empty `__slots__`.
+	
+	:Allocation of ids:
+	
+	New ids are allocated per subclass under a lock, so objects
+	constructed concurrently in several threads never get the same id.
+	A block of consecutive ids can be reserved at once with
+	:meth:`reserveIDs`. Since processes do not share the allocator,
+	a pool of worker processes may call :meth:`partitionIDs` (e.g. in
+	the pool initializer) so that every worker allocates ids from its
+	own disjoint range.
+	
+	:Registry of instances:
+	
+	Optionally, a subclass may keep a registry of its instances by
+	id (see :meth:`enableRegistry`) so that an object can be retrieved
+	from its id in O(1) with :meth:`getInstance`. The registry holds
+	weak references; instances no longer in use are dropped from the
+	registry when garbage collected. Since ids are not necessarily
+	unique (e.g. copies), the registry keeps the first instance
+	registered with each id for as long as it is alive; an instance
+	is not registered if another live instance has already been
+	registered with its id. Copies made with the :mod:`copy` module
+	are not registered.
 
 	
 
@@ -161,8 +221,16 @@ class smIdentifiable:
 	"""
 	
 	#Private class attributes shared by all instances
+	__slots__ = ('__id', '__version', '__weakref__')
 	__nextID = dict() #A static member variable to keep track of the next
 			   #available identifier to use (for each subclass).
+			   #Holds the last id allocated for each subclass.
+	__firstID = 1 #First id to allocate to subclasses with no ids yet
+	__idLimits = dict() #Upper bound (exclusive) of the ids of each
+			   #(sub)class after a call to partitionIDs.
+	__idLock = threading.Lock() #Protects the allocation of ids
+	__registries = dict() #Registry of instances by id (values) for each
+			   #subclass with the registry enabled (keys).
 			   
 	
 	#Class constructor
@@ -173,12 +241,8 @@ class smIdentifiable:
 		
 		self.__version = '0.1'
 		
-		tmpKey = str(self.__class__)
-		try:
-			self.__nextID[tmpKey] = self.__nextID[tmpKey]+1
-		except:
-			self.__nextID[tmpKey] = 1
-		self.__id = self.__nextID[tmpKey]
+		self.__id = self.reserveIDs(1)
+		self._register()
 		
 		return
 
@@ -205,7 +269,12 @@ class smIdentifiable:
 			msg = self.getClassName() + ':id: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
+		registry = smIdentifiable.__registries.get(type(self))
+		if registry is not None and registry.get(self.__id) is self:
+			with smIdentifiable.__idLock:
+				registry.pop(self.__id, None)
 		self.__id = newId
+		self._register()
 		return None
 
 
@@ -244,12 +313,8 @@ class smIdentifiable:
 			raise ValueError(msg)
 			
 		s = '<' + self.getClassName() + ': {\n'
-		#Grab Class attributes (note that this will only pick class attributes
-		#but not instance attributes)
-		#The filter ignores python __ attributes e.g. __repr__
-		iters = dict((name,value) for name,value in self.__dict__.items() if name[:2] != '__')
-		#Update with the instance items
-		iters.update(self.__dict__)
+		#Grab the instance attributes (whether in __slots__ or __dict__)
+		iters = self._getAttributes()
 		#Finally build the string
 		for name,value in iters.items():
 			s = s + indentationLevel*'\t' + name[len(self.getClassName())+3:] \
@@ -257,7 +322,70 @@ class smIdentifiable:
 		return s + indentationLevel*'\t' + '}>'
 
 
+	#Protected methods
+	def _getAttributes(self):
+		'''Gets the instance attributes.
+		
+		Attributes declared in `__slots__` of any class in the
+		hierarchy are included as well as those in the instance
+		`__dict__` (if any). Attributes are keyed by their mangled
+		name, e.g. '_smIdentifiable__id'.
+		
+		:return: The attributes' values indexed by the attributes' names.
+		:rtype: dict
+		'''
+		res = dict()
+		for cls in reversed(type(self).__mro__):
+			slots = cls.__dict__.get('__slots__', ())
+			if isinstance(slots, str):
+				slots = (slots,)
+			for name in slots:
+				if name.startswith('__') and not name.endswith('__'):
+					name = '_' + cls.__name__.lstrip('_') + name
+				if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+					res[name] = getattr(self, name)
+		res.update(getattr(self, '__dict__', dict()))
+		return res
+
+	def _register(self):
+		'''Registers the instance in the registry of its class, if the
+		registry is enabled (see :meth:`enableRegistry`).
+		
+		An existing live entry for the id is never overwritten.
+		'''
+		registry = smIdentifiable.__registries.get(type(self))
+		if registry is not None:
+			with smIdentifiable.__idLock:
+				registry.setdefault(self.__id, self)
+		return
+
 	#Public methods
+	@classmethod
+	def enableRegistry(cls, flagEnable = True):
+		'''Enables (or disables) the registry of instances by id of the
+		class.
+		
+		Only instances constructed, or whose :attr:`id` is set, while
+		the registry is enabled are registered. Disabling the registry
+		discards it. Registries are per class; subclasses have
+		their own registry.
+		
+		:Parameters:
+		
+		:param flagEnable: Optional. True (default) to enable the
+			registry, False to disable it.
+		:type flagEnable: bool
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		with smIdentifiable.__idLock:
+			if not flagEnable:
+				smIdentifiable.__registries.pop(cls, None)
+			elif cls not in smIdentifiable.__registries:
+				smIdentifiable.__registries[cls] = weakref.WeakValueDictionary()
+		return None
+
 	def getClassName(self):
 		'''Gets the class name.
 		
@@ -265,4 +393,127 @@ class smIdentifiable:
 		:rtype: str
 		'''
 		return type(self).__name__
+
+	@classmethod
+	def getInstance(cls, theID):
+		'''Gets the instance of the class with the given id from the
+		registry (see :meth:`enableRegistry`).
+		
+		:Parameters:
+		
+		:param theID: The id.
+		:type theID: int
+		
+		:return: The instance registered with the id, or None if
+			there is no such instance alive.
+		:rtype: :class:`smIdentifiable <scimeth.data.smIdentifiable>`
+		'''
+		registry = smIdentifiable.__registries.get(cls)
+		if registry is None:
+			msg = cls.__name__ + ':getInstance: The registry of instances is not enabled.'
+			raise RuntimeError(msg)
+		return registry.get(theID)
+
+	@classmethod
+	def partitionIDs(cls, worker, partitionSize = 2**32):
+		'''Restricts the ids allocated to the range of a worker.
+		
+		The id space is split in consecutive partitions of
+		`partitionSize` ids. After this call, the ids allocated
+		are those of the partition of the given worker, i.e. from
+		worker*partitionSize+1 to (worker+1)*partitionSize. If the
+		partition is exhausted, an error is raised.
+		
+		Calling this method on
+		:class:`smIdentifiable <scimeth.data.smIdentifiable>` affects all
+		subclasses. Otherwise, it only affects the class.
+		
+		:Parameters:
+		
+		:param worker: The index of the worker (e.g. process), 0 or greater.
+		:type worker: int
+		:param partitionSize: Optional. Number of ids per worker. The
+			default is 2**32.
+		:type partitionSize: int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		if type(worker) is not int or worker < 0:
+			msg = cls.__name__ + ':partitionIDs: Unexpected parameter value for worker.'
+			raise ValueError(msg)
+		if type(partitionSize) is not int or partitionSize < 1:
+			msg = cls.__name__ + ':partitionIDs: Unexpected parameter value for partitionSize.'
+			raise ValueError(msg)
+		cls.resetIDs(worker * partitionSize + 1)
+		with smIdentifiable.__idLock:
+			smIdentifiable.__idLimits[cls] = (worker + 1) * partitionSize + 1
+		return None
+
+	@classmethod
+	def reserveIDs(cls, n):
+		'''Reserves a block of consecutive ids for the class.
+		
+		The reserved ids will not be given to new instances of the
+		class. This permits assigning ids in bulk without
+		constructing the objects, e.g. when creating many objects at
+		once. This method is thread-safe.
+		
+		:Parameters:
+		
+		:param n: Number of ids to reserve. Must be positive or 0.
+		:type n: int
+		
+		:return: The first reserved id. Reserved ids are
+			first, first+1, ..., first+n-1.
+		:rtype: int
+		'''
+		if type(n) is not int or n < 0:
+			msg = cls.__name__ + ':reserveIDs: Unexpected parameter value for n.'
+			raise ValueError(msg)
+		with smIdentifiable.__idLock:
+			first = smIdentifiable.__nextID.get(cls, smIdentifiable.__firstID - 1) + 1
+			limit = smIdentifiable.__idLimits.get(cls, \
+							smIdentifiable.__idLimits.get(smIdentifiable))
+			if limit is not None and first + n > limit:
+				msg = cls.__name__ + ':reserveIDs: The partition of ids is exhausted.'
+				raise RuntimeError(msg)
+			smIdentifiable.__nextID[cls] = first + n - 1
+		return first
+
+	@classmethod
+	def resetIDs(cls, nextID = 1):
+		'''Resets the allocation of ids.
+		
+		New instances will be given ids from `nextID` onwards. Any
+		partition set with :meth:`partitionIDs` is discarded.
+		
+		Calling this method on
+		:class:`smIdentifiable <scimeth.data.smIdentifiable>` affects all
+		subclasses. Otherwise, it only affects the class.
+		
+		.. warning::
+			Existing objects keep their ids, so new objects may get
+			the same ids as existing ones.
+		
+		:Parameters:
+		
+		:param nextID: Optional. The next id to allocate. The default is 1.
+		:type nextID: int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		if type(nextID) is not int:
+			msg = cls.__name__ + ':resetIDs: Unexpected parameter type for nextID.'
+			raise ValueError(msg)
+		with smIdentifiable.__idLock:
+			if cls is smIdentifiable:
+				smIdentifiable.__nextID.clear()
+				smIdentifiable.__idLimits.clear()
+				smIdentifiable.__firstID = nextID
+			else:
+				smIdentifiable.__nextID[cls] = nextID - 1
+				smIdentifiable.__idLimits.pop(cls, None)
+		return None
 	
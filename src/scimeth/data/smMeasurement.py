@@ -26,6 +26,17 @@ This module implements the class :class:` ***smTimelineEvent***
 | 14-Mar-2020 | FOE    | - :meth:`__str__` now now admits parameter           |
 |             |        |   `indentationLevel`.                                |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - :attr:`data` now accepts memory-mapped arrays      |
+|             |        |   (:class:`numpy.memmap`) and other objects exposing |
+|             |        |   the buffer protocol, which are attached without    |
+|             |        |   copying.                                           |
+|             |        | - Added method :meth:`openData`.                     |
+|             |        | - Bug fixing: The :attr:`data` getter now returns    |
+|             |        |   the data, and the constructor now uses its         |
+|             |        |   parameters.                                        |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`getEpochs`.                    |
++-------------+--------+------------------------------------------------------+
 
 .. seealso::
 		
@@ -37,7 +48,7 @@ This module implements the class :class:` ***smTimelineEvent***
 '''
 
 ## Import
-#import warnings
+import warnings
 #import deprecation
 #import os
 import re #Allow using regular expression
@@ -82,6 +93,11 @@ class smMeasurement(smIdentifiable):
 	For instance topographical (2D) or tomographical (3D) data is
 	vectorized.
 	
+	The data tensor can be held in memory or memory-mapped from a file
+	(see :meth:`openData`). Memory-mapped data are only read from disk
+	as they are sliced, so the data tensor may be larger than the
+	available memory.
+	
 	'''
 
     #Private class attributes shared by all instances
@@ -96,9 +112,14 @@ class smMeasurement(smIdentifiable):
 		:Parameters:
 
 		data : (3D) numpy.ndarray. optional
-			The data tensor.
+			The data tensor. Any object accepted by the :attr:`data`
+			setter (e.g. a :class:`numpy.memmap`) can be provided.
+			The default is None.
 		timeline : :class:`smTimeline <scimeth.data.smTimeline>`, optional
-			Description of the condition. The default is None.
+			The measurement timeline. Its length must coincide with the
+			length of the data along the first dimension. If only the
+			`data` is provided, a timeline of the appropriate length is
+			created. The default is None.
 
 		:Returns:
 
@@ -114,6 +135,16 @@ class smMeasurement(smIdentifiable):
 		self.__data = np.zeros((0,0,0),dtype=float) #The data tensor.
 		self.__timeline = smTimeline() #The timeline.
 		
+		if timeline is not None:
+			if type(timeline) is not smTimeline:
+				msg = self.getClassName() + ':__init__: Unexpected parameter type for timeline.'
+				raise ValueError(msg)
+			self.__timeline = timeline
+		if data is not None:
+			if timeline is None:
+				self.__timeline = smTimeline(length = np.shape(data)[0])
+			self.data = data
+		
 		return
 
 	#Properties getters/setters
@@ -128,18 +159,31 @@ class smMeasurement(smIdentifiable):
 		
 		The length of the :attr:`data` along the first dimension
 		must coincide with the :attr:`timeline` :attr:`length`.
-
-		:getter: Gets the data.
+		
+		Besides in memory numpy.ndarray, the data can be a
+		:class:`numpy.memmap` or any other object exposing the buffer
+		protocol. These are attached without copying nor loading them
+		into memory, and slicing them only reads the required samples.
+		
+		:getter: Gets the data. No copy is made.
 		:setter: Sets the data.
 		:type: numpy.ndarray (of dimension 3)
 		'''
-		return self.__tag
+		return self.__data
 
 	@data.setter
 	def data(self,newData): #data setter
-		if type(newData) is not np.ndarray:
-			msg = self.getClassName() + ':data: Unexpected attribute type.'
-			#warnings.warn(msg,SyntaxWarning)
+		if not isinstance(newData, np.ndarray):
+			#Wrap objects exposing the buffer protocol without copying
+			try:
+				newData = np.asarray(memoryview(newData))
+			except TypeError:
+				msg = self.getClassName() + ':data: Unexpected attribute type.'
+				#warnings.warn(msg,SyntaxWarning)
+				raise ValueError(msg)
+		if newData.ndim != 3:
+			msg = self.getClassName() + ':data: Unexpected attribute value. ' \
+				'Data must be a rank 3 tensor.'
 			raise ValueError(msg)
 		if self.timeline.length != np.size(newData,0):
 			msg = self.getClassName() + ':data: Unexpected attribute value. ' \
@@ -215,12 +259,8 @@ class smMeasurement(smIdentifiable):
 			raise ValueError(msg)
 		
 		s = '<' + self.getClassName() + ': {\n'
-		#Grab Class attributes (note that this will only pick class attributes
-		#but not instance attributes)
-		#The filter ignores python __ attributes e.g. __repr__
-		iters = dict((name,value) for name,value in self.__dict__.items() if name[:2] != '__')
-		#Update with the instance items
-		iters.update(self.__dict__)
+		#Grab the instance attributes (whether in __slots__ or __dict__)
+		iters = self._getAttributes()
 		#Finally build the string
 		for name,value in iters.items():
 			#Deal with python namemangling
@@ -259,3 +299,136 @@ class smMeasurement(smIdentifiable):
 		return type(self).__name__
 	
 
+	def getEpochs(self, condition, pre, post, baseline = None, \
+				  flagView = False):
+		'''Extracts the epochs (event-locked windows) of a condition.
+		
+		For every event of the condition, the window of samples
+		[onset - `pre`, onset + `post`) of the :attr:`data` is retrieved.
+		All windows are gathered at once by fancy indexing, so with
+		memory-mapped data only the samples within the windows are read.
+		
+		Events whose window falls outside the :attr:`data` are skipped
+		with a warning.
+		
+		:Parameters:
+		
+		:param condition: The condition or condition id.
+		:type condition: :class:`smTimelineCondition <scimeth.data.smTimelineCondition>`
+			or int
+		:param pre: Number of samples before the events onsets.
+		:type pre: int
+		:param post: Number of samples after the events onsets.
+		:type post: int
+		:param baseline: Optional. A pair (b0, b1) of sample offsets
+			relative to the events onsets. If provided, the mean of the
+			samples [onset + b0, onset + b1) is subtracted from each epoch
+			for every channel and signal. The baseline must lie within
+			the window. The default is None (no baseline correction).
+		:type baseline: tuple of int
+		:param flagView: Optional. If True and the events are equally
+			spaced, the epochs are returned as a read-only strided view
+			of the :attr:`data` rather than a copy. Otherwise, a warning
+			is issued and a copy is returned. Views are never returned
+			with baseline correction. The default is False.
+		:type flagView: bool
+		
+		:return: A tuple (epochs, eventIDs) where epochs is a rank 4
+			tensor (epochs x time x channels x signals) and eventIDs are
+			the ids of the events of each epoch, sorted by onset.
+		:rtype: tuple (numpy.ndarray, numpy.ndarray)
+		'''
+		pre = int(pre)
+		post = int(post)
+		if pre < 0 or post < 0 or pre + post == 0:
+			msg = self.getClassName() + ':getEpochs: Unexpected parameter value for parameters pre and post.'
+			raise ValueError(msg)
+		if baseline is not None:
+			try:
+				b0, b1 = (int(b) for b in baseline)
+			except (TypeError, ValueError):
+				msg = self.getClassName() + ':getEpochs: Unexpected parameter type for parameter baseline.'
+				raise ValueError(msg)
+			if not (-pre <= b0 < b1 <= post):
+				msg = self.getClassName() + ':getEpochs: Unexpected parameter value for parameter baseline. Baseline must lie within the window.'
+				raise ValueError(msg)
+		theIDs = self.timeline.getConditionsEvents(condition, flagOnlyIDs = True)
+		ids, onsets, _ = self.timeline.getEventsInSamples(theIDs)
+		nSamples = np.size(self.data, 0)
+		tmp = (onsets - pre >= 0) & (onsets + post <= nSamples)
+		if not tmp.all():
+			msg = self.getClassName() + ':getEpochs: ' + str(np.count_nonzero(~tmp)) \
+					+ ' epochs fall outside the data and have been skipped.'
+			warnings.warn(msg,SyntaxWarning)
+		ids = ids[tmp]
+		onsets = onsets[tmp]
+		if flagView:
+			steps = np.diff(onsets)
+			if baseline is None and (len(steps) == 0 or (steps == steps[0]).all()):
+				data = self.data
+				stride = data.strides[0] * (int(steps[0]) if len(steps) > 0 else 1)
+				start = onsets[0] - pre if len(onsets) > 0 else 0
+				epochs = np.lib.stride_tricks.as_strided(data[start:], \
+							shape = (len(onsets), pre + post) + data.shape[1:], \
+							strides = (stride,) + data.strides, writeable = False)
+				return epochs, ids
+			msg = self.getClassName() + ':getEpochs: Epochs cannot be returned as a view. Returning a copy.'
+			warnings.warn(msg,SyntaxWarning)
+		idx = onsets[:, None] + np.arange(-pre, post)
+		epochs = self.data[idx]
+		if baseline is not None:
+			epochs = epochs.astype(np.result_type(epochs.dtype, np.float64), copy = False)
+			epochs -= epochs[:, b0+pre:b1+pre].mean(axis = 1, keepdims = True)
+		return epochs, ids
+
+
+	def openData(self, filename, shape = None, dtype = np.float64, \
+				 mode = 'r', offset = 0):
+		'''Memory-maps the data tensor from a file.
+		
+		The data is not loaded into memory; samples are only read from
+		disk as the :attr:`data` is sliced.
+		
+		Files in numpy format (.npy) are opened with :func:`numpy.load`
+		and carry their own shape and dtype. Other files are considered
+		to be raw binary files and are opened with :class:`numpy.memmap`,
+		and hence require the `shape`.
+		
+		The length of the data along the first dimension must coincide
+		with the :attr:`timeline` :attr:`length`.
+		
+		:Parameters:
+		
+		:param filename: The file name.
+		:type filename: str
+		:param shape: Optional. Shape of the (3D) data tensor in raw binary
+			files. Ignored for .npy files.
+		:type shape: tuple of int
+		:param dtype: Optional. Data type in raw binary files. Ignored for
+			.npy files. The default is numpy.float64.
+		:type dtype: numpy.dtype
+		:param mode: Optional. File access mode; 'r' (read only),
+			'r+' (read and write) or 'c' (copy on write). The default is 'r'.
+		:type mode: str
+		:param offset: Optional. Offset in bytes of the data in raw binary
+			files. Ignored for .npy files. The default is 0.
+		:type offset: int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		if mode not in ('r', 'r+', 'c'):
+			msg = self.getClassName() + ':openData: Unexpected parameter value for mode.'
+			raise ValueError(msg)
+		if str(filename).endswith('.npy'):
+			newData = np.load(filename, mmap_mode = mode)
+		else:
+			if shape is None:
+				msg = self.getClassName() + ':openData: Parameter shape is required for raw binary files.'
+				raise ValueError(msg)
+			newData = np.memmap(filename, dtype = dtype, mode = mode, \
+								offset = offset, shape = tuple(shape))
+		self.data = newData
+		return None
+
+
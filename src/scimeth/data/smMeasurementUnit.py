@@ -43,6 +43,15 @@ This module implements the class :class:`smMeasurementUnit`.
 | 14-Mar-2020 | FOE    | - :meth:`__str__` now now admits parameter           |
 |             |        |   `indentationLevel`.                                |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added class method :meth:`getInterned` returning   |
+|             |        |   shared immutable units, and read-only property     |
+|             |        |   :attr:`isInterned`.                                |
+|             |        | - :meth:`isEqual` now returns immediately when       |
+|             |        |   comparing a unit with itself.                      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Bug fixing: The :attr:`id` of interned units can   |
+|             |        |   no longer be changed.                              |
++-------------+--------+------------------------------------------------------+
 
 
 .. seealso:: None
@@ -94,9 +103,22 @@ class smMeasurementUnit(smIdentifiable):
 		variable is part of the International System
 		The default is `False`.
 	:type isInternationalSystem: bool
+	
+	:Interned units:
+	
+	Equal units need not be constructed over and over. The class method
+	:meth:`getInterned` returns a single shared instance for every
+	combination of :attr:`name`, :attr:`acronym`, :attr:`multiplier` and
+	:attr:`isInternationalSystem`. Interned units are immutable; their
+	attributes cannot be set, and copying them (whether with
+	:func:`copy.copy`, :func:`copy.deepcopy` or pickling) yields the
+	same shared instance. Comparing an interned unit with itself in
+	:meth:`isEqual` is immediate.
 	"""
 
 	#Private class attributes shared by all instances
+	__internedUnits = dict() #Interned units (values) indexed by their
+							 #attributes values (keys)
 
 	#Class constructor
 	def __init__(self, name = 'arbitrary', acronym = 'a.u.', multiplier = 0, \
@@ -105,6 +127,7 @@ class smMeasurementUnit(smIdentifiable):
 		super().__init__() 
 		
 		self.__version = '0.1'
+		self.__isInterned = False
 
 		#Initialize private attributes unique to this instance
 		self.name = name #Unit name e.g. Meter, Seconds, Coulomb, etc.
@@ -122,6 +145,25 @@ class smMeasurementUnit(smIdentifiable):
 	# Remember: Sphinx ignores docstrings on property setters so all
 	#documentation for a property must be on the @property method
 
+	@property
+	def id(self): #ID getter
+		"""
+		A unique numerical ID for the object instance.
+		
+		The id of interned units cannot be changed.
+		
+		:getter: Gets the id.
+		:setter: Sets the id.
+		:type: int
+		"""
+		return smIdentifiable.id.fget(self)
+
+	@id.setter
+	def id(self,newId): #ID setter
+		self._checkNotInterned('id')
+		smIdentifiable.id.fset(self,newId)
+		return None
+
 	@property
 	def name(self): #name getter
 		"""
@@ -135,6 +177,7 @@ class smMeasurementUnit(smIdentifiable):
 
 	@name.setter
 	def name(self,newName): #name setter
+		self._checkNotInterned('name')
 		if type(newName) is not str:
 			msg = self.getClassName() + ':name: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
@@ -156,6 +199,7 @@ class smMeasurementUnit(smIdentifiable):
 
 	@acronym.setter
 	def acronym(self,newAcronym): #acronym setter
+		self._checkNotInterned('acronym')
 		if type(newAcronym) is not str:
 			msg = self.getClassName() + ':acronym: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
@@ -178,6 +222,7 @@ class smMeasurementUnit(smIdentifiable):
 
 	@multiplier.setter
 	def multiplier(self,newMultiplier): #multiplier setter
+		self._checkNotInterned('multiplier')
 		if not isinstance(newMultiplier,(int,float)):
 			msg = self.getClassName() + ':multiplier: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
@@ -202,6 +247,7 @@ class smMeasurementUnit(smIdentifiable):
 
 	@isInternationalSystem.setter
 	def isInternationalSystem(self,newValue): #multiplier setter
+		self._checkNotInterned('isInternationalSystem')
 		if (type(newValue) is not bool):
 			msg = self.getClassName() + ':isInternationalSystem: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
@@ -209,6 +255,17 @@ class smMeasurementUnit(smIdentifiable):
 		self.__isInternationalSystem = newValue
 		return None
 
+	@property
+	def isInterned(self): #isInterned getter
+		"""
+		Indicates whether the unit is a shared immutable unit obtained
+		from :meth:`getInterned`. This is a read-only property.
+		
+		:getter: Asks whether the unit is interned.
+		:type: bool
+		"""
+		return self.__isInterned
+
 	@property
 	def version(self): #version getter
 		"""
@@ -248,12 +305,8 @@ class smMeasurementUnit(smIdentifiable):
 			
 		
 		s = '<' + self.getClassName() + ': {\n'
-		#Grab Class attributes (note that this will only pick class attributes
-		#but not instance attributes)
-		#The filter ignores python __ attributes e.g. __repr__
-		iters = dict((name,value) for name,value in self.__dict__.items() if name[:2] != '__')
-		#Update with the instance items
-		iters.update(self.__dict__)
+		#Grab the instance attributes (whether in __slots__ or __dict__)
+		iters = self._getAttributes()
 		#Finally build the string
 		for name,value in iters.items():
 			#Deal with python namemangling
@@ -271,7 +324,33 @@ class smMeasurementUnit(smIdentifiable):
 							'\t= ' + str(value) + ';\n'
 		return s + indentationLevel*'\t' + '}>'
 
+	def __reduce_ex__(self, protocol):
+		'''Supports copying and pickling.
+		
+		Interned units are reduced to a call to :meth:`getInterned`, so
+		that copies of interned units are the shared instance itself.
+		
+		:param protocol: The pickle protocol.
+		:type protocol: int
+		'''
+		if self.__isInterned:
+			return (type(self).getInterned, (self.name, self.acronym, \
+					self.multiplier, self.isInternationalSystem))
+		return super().__reduce_ex__(protocol)
+
 	
+	#Protected methods
+	def _checkNotInterned(self, attributeName):
+		'''Raises an error if the unit is interned.
+		
+		:param attributeName: The attribute being set.
+		:type attributeName: str
+		'''
+		if getattr(self, '_smMeasurementUnit__isInterned', False):
+			msg = self.getClassName() + ':' + attributeName + ': Interned units are immutable.'
+			raise ValueError(msg)
+		return None
+
 	
 	#Public methods
 	def getClassName(self):
@@ -283,6 +362,46 @@ class smMeasurementUnit(smIdentifiable):
 		return type(self).__name__
 	
 
+	@classmethod
+	def getInterned(cls, name = 'arbitrary', acronym = 'a.u.', multiplier = 0, \
+				 isInternationalSystem = False):
+		'''Gets the shared immutable unit with the given attributes.
+		
+		The unit is constructed only the first time it is requested.
+		
+		:Parameters:
+		
+		:param name: Optional. The unit name, e.g. 'seconds'.
+			The default is 'arbitrary'.
+		:type name: str
+		:param acronym: Optional. The unit acronym, e.g. 's'
+			The default is 'a.u.'.
+		:type acronym: str
+		:param multiplier: Optional. The unit multiplier in base 10.
+			The default is 0.
+		:type multiplier: float
+		:param isInternationalSystem: Optional. A flag indicating whether
+			the variable is part of the International System.
+			The default is `False`.
+		:type isInternationalSystem: bool
+		
+		:return: The interned unit.
+		:rtype: :class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`
+		'''
+		key = (cls, name, acronym, multiplier, isInternationalSystem)
+		try:
+			return smMeasurementUnit.__internedUnits[key]
+		except KeyError:
+			pass
+		except TypeError: #Unhashable values. Let the constructor complain.
+			key = None
+		theUnit = cls(name = name, acronym = acronym, multiplier = multiplier, \
+					  isInternationalSystem = isInternationalSystem)
+		theUnit.__isInterned = True
+		smMeasurementUnit.__internedUnits[key] = theUnit
+		return theUnit
+
+
 
 	def isEqual(self,obj2):
 		'''
@@ -306,6 +425,8 @@ class smMeasurementUnit(smIdentifiable):
 		False otherwise.
 
 		'''
+		if self is obj2:
+			return True
 		res = True
 		
 		res = res & (str(self.__class__) == str(obj2.__class__))
@@ -97,6 +97,140 @@ This module implements the class :class:`smTimelineEvent <scimeth.data.smTimelin
 |             |        |   https://english.stackexchange.com/questions/59463/ |
 |             |        |   antonym-to-assign                                  |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Events are now kept in a columnar                  |
+|             |        |   :class:`smTimelineEventStore                       |
+|             |        |   <scimeth.data.smTimelineEventStore>` rather than   |
+|             |        |   a set of :class:`smTimelineEvent                   |
+|             |        |   <scimeth.data.smTimelineEvent>`. Event objects are |
+|             |        |   only materialised upon request.                    |
+|             |        | - Bug fixing: Methods :meth:`_trimEvents`,           |
+|             |        |   :meth:`_shiftEvents`, :meth:`removeEvents`,        |
+|             |        |   :meth:`clearEvents` and :meth:`dissociateEvents`   |
+|             |        |   now operate on the timeline events rather than on  |
+|             |        |   copies.                                            |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Conditions are now kept in a dictionary indexed by |
+|             |        |   the conditions' ids, and events are looked up by   |
+|             |        |   id through the event store index. Retrieving k     |
+|             |        |   conditions or events by id is now O(k).            |
+|             |        | - Bug fixing: Method :meth:`getConditions` now       |
+|             |        |   returns conditions (and not events) when no ids    |
+|             |        |   are given, and accepts lists of ids.               |
+|             |        | - Bug fixing: Methods :meth:`addConditions`,         |
+|             |        |   :meth:`removeConditions` and                       |
+|             |        |   :meth:`clearConditions` and the :attr:`conditions` |
+|             |        |   setter now keep the conditionsEventsMap and the    |
+|             |        |   overlapStatus consistent.                          |
+|             |        | - Method :meth:`setEvents` now refuses new ids that  |
+|             |        |   already exist in the timeline.                     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Getters of :attr:`timestamps`,                     |
+|             |        |   :attr:`overlapStatus` and :attr:`startTime` no     |
+|             |        |   longer deepcopy; they return read-only views or    |
+|             |        |   immutable objects.                                 |
+|             |        | - Added read-only properties :attr:`eventsView` and  |
+|             |        |   :attr:`conditionsView`, and method :meth:`copy`.   |
+|             |        | - Internal methods no longer read the attributes     |
+|             |        |   through the (copying) getters.                     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Overlap conflicts are now found with a sweep over  |
+|             |        |   the events sorted by onset rather than comparing   |
+|             |        |   every pair of events of every pair of conditions.  |
+|             |        | - Added method :meth:`getOverlapConflicts`.          |
+|             |        |   :meth:`_checkOverlapConflicts` now reports all the |
+|             |        |   conflicts found.                                   |
+|             |        | - Bug fixing: Pairs in :attr:`overlapStatus` are now |
+|             |        |   kept as sorted tuples so that they can be held in  |
+|             |        |   a set. Pairs may be given as lists or tuples.      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added methods :meth:`getEventsInWindow` and        |
+|             |        |   :meth:`getActiveConditionsAt` for time queries     |
+|             |        |   resolved over an interval index of the events.     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Methods :meth:`toSeconds` and :meth:`toSamples`    |
+|             |        |   now convert all events at once over the event      |
+|             |        |   store columns. Times are taken from the            |
+|             |        |   :attr:`timestamps`, snapping to the nearest        |
+|             |        |   timestamp in non-uniformly sampled timelines.      |
+|             |        | - Added protected methods :meth:`_samplesToTimes`    |
+|             |        |   and :meth:`_timesToSamples`.                       |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Uniformly sampled timelines no longer hold the     |
+|             |        |   timestamps array. Timestamps are implicit, i.e.    |
+|             |        |   given by :attr:`init`, :attr:`samplingRate`,       |
+|             |        |   :attr:`length` and :attr:`timeMultiplier`, and     |
+|             |        |   computed on demand. An explicit array is only kept |
+|             |        |   for non-uniform timestamps.                        |
+|             |        | - Added protected method :meth:`_getTimestamps`.     |
+|             |        | - Bug fixing: Setting a :attr:`samplingRate` of 0 no |
+|             |        |   longer attempts a division by zero.                |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`getEventsInSamples`.           |
+|             |        | - Method :meth:`getConditionsEvents` now accepts     |
+|             |        |   parameter `flagOnlyIDs`.                           |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added methods :meth:`save` and :meth:`load` using  |
+|             |        |   a compact versioned binary file format.            |
+|             |        | - Bug fixing: :meth:`isEqual` no longer refers to    |
+|             |        |   non existing attributes.                           |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The associations between conditions and events are |
+|             |        |   now kept in a sparse                               |
+|             |        |   :class:`smTimelineMembership` rather than in a     |
+|             |        |   dictionary of sets.                                |
+|             |        | - Added method :meth:`getEventsConditions`.          |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`addEventColumns` for bulk      |
+|             |        |   insertion of events in columnar form.              |
+|             |        | - :meth:`addEvents` no longer creates a throwaway    |
+|             |        |   event to check the class of the new events.        |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The :attr:`unit` is now an interned unit and it is |
+|             |        |   no longer copied by the getter.                    |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - :meth:`sortTimelineEventsById` and                 |
+|             |        |   :meth:`sortTimelineEventsByOnset` now use a stable |
+|             |        |   multi-key sort (see `scimeth.utils.multikey_sort`) |
+|             |        |   rather than `quick_sort`.                          |
+|             |        | - Bug fixing: :meth:`sortTimelineEventsByOnset` is   |
+|             |        |   now a static method.                               |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Overlap validation is now incremental. Adding,     |
+|             |        |   associating or updating a few events only checks   |
+|             |        |   those events against their neighbouring events.    |
+|             |        | - Added method :meth:`wouldConflict` (dry-run check) |
+|             |        |   and protected method                               |
+|             |        |   :meth:`_getLocalOverlapConflicts`.                 |
+|             |        | - :meth:`allowOverlap` no longer looks for conflicts |
+|             |        |   as allowing overlap cannot introduce any.          |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`getBoxcar` to render the       |
+|             |        |   conditions as a (design) matrix of boxcars.        |
+|             |        | - Bug fixing: :meth:`getConditionsEvents` now        |
+|             |        |   accepts its default value (all conditions).        |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`getRegressors` to convolve the |
+|             |        |   boxcars with a haemodynamic response function      |
+|             |        |   (HRF) by FFT, and static method                    |
+|             |        |   :meth:`getHRFKernel` with a cache of kernels.      |
+|             |        | - Added protected static method :meth:`_fftConvolve` |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Bug fixing: :meth:`load` no longer unpickles the   |
+|             |        |   events' information unless allowPickle is True.    |
+|             |        |   :meth:`save` writes it as JSON in the header (file |
+|             |        |   format version 2), and only pickles it when        |
+|             |        |   allowed.                                           |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Rejected edits in setEvents, associateEvents,      |
+|             |        |   forbidOverlap and overlapStatus are rolled back    |
+|             |        |   before the error is raised.                        |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The FFTs of the HRF kernels are kept in their own  |
+|             |        |   cache, separate from the kernels. Both caches are  |
+|             |        |   bounded and drop the least recently used entries.  |
+|             |        |   Kernels from user-supplied functions are not       |
+|             |        |   cached.                                            |
++-------------+--------+------------------------------------------------------+
 
 
 
@@ -120,6 +254,11 @@ import warnings
 #import os
 import copy
 import re #Allow using regular expression
+import types
+import json
+import pickle
+import struct
+import collections
 
 import numpy as np
 import math #Needed to calculate log
@@ -132,11 +271,13 @@ import datetime
 
 #from scimeth import __version__
 #from scimeth import data as scimeth
-from scimeth.utils import partition, quick_sort
+from scimeth.utils import multikey_sort
 from .smIdentifiable import smIdentifiable
 from .smMeasurementUnit import smMeasurementUnit
 from .smTimelineEvent import smTimelineEvent
 from .smTimelineCondition import smTimelineCondition
+from .smTimelineEventStore import smTimelineEventStore
+from .smTimelineMembership import smTimelineMembership
 
 
 
@@ -202,6 +343,12 @@ class smTimeline(smIdentifiable):
 	internally expressed in :attr:`unit`, whether 'Sample' or 'Second'.
 	The :attr:`unit` can be set during object construction, or changed
 	later using :meth:`toSeconds` and :meth:`toSamples`.
+	
+	Timestamps of uniformly sampled timelines are implicit; only
+	:attr:`init`, :attr:`samplingRate`, :attr:`length` and
+	:attr:`timeMultiplier` are kept and the :attr:`timestamps` are
+	computed when requested. An explicit array of timestamps is only
+	kept once non-uniform timestamps are set.
 
 	:Class invariants:
 	
@@ -224,7 +371,28 @@ class smTimeline(smIdentifiable):
 	'''
 
 	#Private class attributes shared by all instances
-	
+	__FILEMAGIC = b'SMTLINE\x00' #Magic number of the binary file format
+	__FILEVERSION = 2 #Version of the binary file format
+	__FILEALIGNMENT = 64 #Arrays in the binary files are aligned to
+						#multiples of this number of bytes
+	__LOCALOVERLAPFRACTION = 0.1 #Overlap is checked locally when at
+						#most this fraction of the events are modified
+	__SWEEPCHUNKSIZE = 2**18 #Maximum number of overlapping pairs of
+						#events held at once when sweeping for conflicts
+	__HRFDEFAULTS = {'peakDelay'            : 6.0, #Canonical (double gamma)
+					 'undershootDelay'      : 16.0, #HRF parameters in seconds
+					 'peakDispersion'       : 1.0,
+					 'undershootDispersion' : 1.0,
+					 'ratio'                : 6.0, #Peak to undershoot ratio
+					 'kernelLength'         : 32.0}
+	__HRFKERNELCACHESIZE = 64 #Maximum number of cached HRF kernels
+	__HRFFFTCACHESIZE = 16 #Maximum number of cached FFTs of HRF kernels
+	__hrfKernels = collections.OrderedDict() #Cache of canonical HRF
+						#kernels by sampling rate and kernel parameters
+						#(least recently used first)
+	__hrfKernelFFTs = collections.OrderedDict() #Cache of FFTs of HRF
+						#kernels by kernel key and FFT length
+						#(least recently used first)
 
 	#Class constructor
 	def __init__(self, startTime = datetime.datetime.now(),
@@ -377,13 +545,13 @@ class smTimeline(smIdentifiable):
 
 		self.startTime = startTime #Absolute initial time.
 		#Temporal measurement unit.
-		self.__unit = smMeasurementUnit(name = 'Sample', acronym = 'sample',\
+		self.__unit = smMeasurementUnit.getInterned(name = 'Sample', acronym = 'sample',\
 								 multiplier = 0, \
 								 isInternationalSystem = False)
 		if unit == 'Sample':
 			pass
 		elif unit == 'Second':
-			self.__unit = smMeasurementUnit(name = 'Second', acronym = 's',\
+			self.__unit = smMeasurementUnit.getInterned(name = 'Second', acronym = 's',\
 								 multiplier = timeMultiplier, \
 								 isInternationalSystem = True)
 		else:
@@ -394,12 +562,15 @@ class smTimeline(smIdentifiable):
 		#Do not remove. Explicitly create the properties before the first call to setter.
 		self.__samplingRate = samplingRate
 		self.__timeMultiplier = timeMultiplier
-		self.__timestamps = np.linspace(init, end, length, dtype=None)
-		self.__conditions = set() #List of conditions
-		self.__events = set()
-		self.__conditionEventsMap = dict() #Pairing between conditions (keys)
-										 #and list of associated events IDs (values)
-										 #as a dictionary
+		#Timestamps are implicit (None) while uniformly sampled. They are
+		#then given by init, samplingRate, length and timeMultiplier.
+		self.__timestamps = None
+		self.__init = float(init)
+		self.__length = int(length)
+		self.__conditions = dict() #Conditions (values) indexed by id (keys)
+		self.__events = smTimelineEventStore() #Events kept in columnar form
+		self.__membership = smTimelineMembership() #Sparse pairing between
+										 #conditions and events IDs
 		self.__overlapStatus = set() #Set of pairwise conditions overlapping status.
 									#Pairs in this set are allowed to overlap.
 									#A condition may or may not be allowed to
@@ -455,10 +626,13 @@ class smTimeline(smIdentifiable):
 		Otherwise, an error is raised. Ensure that you remove all conflicts
 		before setting the overlap between the conditions.
 		
+		The getter returns a read-only (frozen) set; no copy is made.
+		
 		:getter: Gets the overlapping status.
 		:setter: Sets the overlapping status.
 		:type: set of conditions id pairs.
-			Each pair is a list of length 2 of int.
+			Each pair is a tuple of length 2 of int sorted by id. When
+			setting, pairs can also be given as lists.
 			Ids of conditions not declared in the timeline will be discarded.
 			A list can also be provided, but duplicates will be ignored.
 		
@@ -466,37 +640,20 @@ class smTimeline(smIdentifiable):
 			:attr:`OVERLAP`, :attr:`NON_OVERLAP`
 		
 		'''
-		return copy.deepcopy(self.__overlapStatus)
+		return frozenset(self.__overlapStatus)
 
 	@overlapStatus.setter
 	def overlapStatus(self,newOverlap): #overlapStatus setter
-		if type(newOverlap) is list:
-			newOverlap = set(newOverlap)
-		if type(newOverlap) is not set:
-			msg = self.getClassName() + ':allowOverlap: Unexpected attribute type.'
-			#warnings.warn(msg,SyntaxWarning)
-			raise ValueError(msg)
-		#Check that it is a set of pairs
-		condid = [cond.id for cond in self.conditions];
-		for elem in newOverlap:
-			if not (type(elem) is list and len(elem)==2 \
-				   and type(elem[0]) is int and type(elem[1]) is int):
-				msg = self.getClassName() + ':allowOverlap: Unexpected attribute value. At least one element is not a pair of conditions ids.'
-				#warnings.warn(msg,SyntaxWarning)
-				raise ValueError(msg)
-			#Discard those pairs which do contain the ID of a non contained condition
-			if elem[0] not in condid or elem[1] not in condid:
-				msg = self.getClassName() + ':allowOverlap: Inexistent id found. Ignoring entry ' + str(elem) + '.'
-				warnings.warn(msg,SyntaxWarning)
-				newOverlap.remove(elem)
-			#Sort the pair by id
-			elem.sort()
+		newOverlap = self._parseOverlapPairs(newOverlap, 'overlapStatus')
 		#At this point, newOverlap contains for sure only a set of pairs of
 		#existing IDs.
+		oldOverlap = self.__overlapStatus
 		try:
-			self.__overlapStatus = copy.deepcopy(newOverlap)
+			self.__overlapStatus = newOverlap
 			self._checkOverlapConflicts()
-		except:
+		except ValueError:
+			#Undo the change
+			self.__overlapStatus = oldOverlap
 			raise
 		return None
 
@@ -517,12 +674,16 @@ class smTimeline(smIdentifiable):
 		:type: set of :class:`smTimelineCondition <scimeth.data.smTimelineCondition>`.
 			A list may also be provided, but duplicates (same ID) will be ignored.
 		
+		The getter returns copies of the conditions. For a zero-copy
+		read access use :attr:`conditionsView`.
+		
 		.. seealso: :meth:`addConditions`, :meth:`setConditions`,
 			:meth:`removeConditions`, :meth:`clearConditions`,
 			:meth:`allowOverlap`, :meth:`forbidOverlap`,
+			:attr:`conditionsView`
 		
 		'''
-		return copy.deepcopy(self.__conditions)
+		return copy.deepcopy(set(self.__conditions.values()))
 
 	@conditions.setter
 	def conditions(self,newConditions): #conditions setter
@@ -542,24 +703,42 @@ class smTimeline(smIdentifiable):
 				raise ValueError(msg)
 			tmpID.append(cond.id)
 		#Check for duplicate ids
-		if len(set(tmpID)) == len(tmpID):
-			#Without duplicates
-			self.__conditions = copy.deepcopy(newConditions)
-		else:
-			#With duplicates
+		if len(set(tmpID)) != len(tmpID):
 			msg = self.getClassName() + ':conditions: At least one repeated condition. Repeated conditions will be added only once.'
 			warnings.warn(msg,SyntaxWarning)
-			tmpID = set(tmpID)
-			for cond in newConditions:
-				if cond.id in tmpID:
-					self.__conditions.append(copy.deepcopy(cond))
-					self.__conditionsEventsMap[cond.id] = set()
-					tmpID.remove(cond.id)
+		self.__conditions = dict()
+		self.__membership.clear()
+		for cond in newConditions:
+			if cond.id not in self.__conditions:
+				self.__conditions[cond.id] = copy.deepcopy(cond)
+		#Discard overlapping pairs of conditions no longer in the timeline
+		self.__overlapStatus = set([pair for pair in self.__overlapStatus \
+									if pair[0] in self.__conditions \
+									and pair[1] in self.__conditions])
 		return None
 
 
 
 
+	@property
+	def conditionsView(self): #conditionsView getter
+		'''
+		Read-only mapping of the conditions indexed by their ids.
+		This is a read-only property.
+		
+		No copy is made; the mapping is a proxy over the conditions held
+		by the timeline, so it always reflects the current conditions.
+		The conditions themselves must **not** be modified through this
+		view; use :meth:`setConditions` instead, or :attr:`conditions`
+		to get copies.
+		
+		:getter: Gets the read-only mapping of conditions.
+		:type: :class:`types.MappingProxyType` of int to
+			:class:`smTimelineCondition <scimeth.data.smTimelineCondition>`
+		'''
+		return types.MappingProxyType(self.__conditions)
+
+
 	@property
 	def duration(self): #duration getter
 		'''
@@ -583,7 +762,7 @@ class smTimeline(smIdentifiable):
 		:getter: Gets the duration.
 		:type: float
 		'''
-		return self.__timestamps[-1] - self.__timestamps[0]
+		return self.end - self.init
 
 
 
@@ -631,7 +810,10 @@ class smTimeline(smIdentifiable):
 		:setter: Sets the end. Must be greater than :attr:`init`
 		:type: float
 		'''
-		return self.__timestamps[-1]
+		if self.__timestamps is not None:
+			return self.__timestamps[-1]
+		return self.__init + \
+			(self.__length-1) / (self.__samplingRate * 10**self.__timeMultiplier)
 
 	@end.setter
 	def end(self,newEnd): #end setter
@@ -639,17 +821,17 @@ class smTimeline(smIdentifiable):
 			msg = self.getClassName() + ':end: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		if newEnd<(self.timestamps[0]+np.spacing(1) * self.length):
+		if newEnd<(self.init+np.spacing(1) * self.length):
 			msg = self.getClassName() + ':end: Unexpected attribute value.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
 		if self.samplingRate <= 0: #Non-uniformly space
 			#No change in length, but amend timestamps if necessary
 			#Generate the worst possible end for each timestamps 
-			latestTimestamps = newEnd * np.ones(len(self.timestamps)) \
-				- np.flip(np.spacing(1) * np.arange(0,len(self.timestamps),1))
+			latestTimestamps = newEnd * np.ones(len(self.__timestamps)) \
+				- np.flip(np.spacing(1) * np.arange(0,len(self.__timestamps),1))
 			#Find timestamps beyond their latest possible values
-			idx = np.argwhere(self.timestamps > latestTimestamps);
+			idx = np.argwhere(self.__timestamps > latestTimestamps);
 			#Substitute the offending timestamps
 			self.__timestamps[idx] = latestTimestamps[idx]
 			assert (self.__timestamps>=0).all(), \
@@ -657,9 +839,11 @@ class smTimeline(smIdentifiable):
 					   + 'smaller than the minimum numeric representation ' \
 					   + '(np.spacing(1)) times the :attr:`length`.'
 		else: #Uniformly space
-			#Reestimate timestamps and samplingRate
-			self.__timestamps = np.linspace(self.init, newEnd, self.length, dtype=None)
-			self.__samplingRate = (self.length-1) /((newEnd-self.init) * 10**self.timeMultiplier)
+			#Reestimate samplingRate. Timestamps become implicit.
+			self.__init = self.init
+			self.__length = self.length
+			self.__timestamps = None
+			self.__samplingRate = (self.__length-1) /((newEnd-self.__init) * 10**self.__timeMultiplier)
 
 		#Finally, remove or crop events as needed.
 		self._trimEvents()
@@ -675,13 +859,42 @@ class smTimeline(smIdentifiable):
 		
 		To clear the set of events, refer to :meth:`clearEvents`
 		
+		Events are internally kept in columnar form (see
+		:class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`).
+		The returned :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+		objects are built upon each call, so changes to them do not
+		affect the timeline.
+		
 		.. seealso:: :meth:`addEvents`, :meth:`removeEvents`
 					  and :meth:`clearEvents`
 		
+		For a zero-copy read access use :attr:`eventsView`.
+		
 		:getter: Gets the set of events.
-		:type: list of :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`.
+		:type: set of :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`.
+		'''
+		return set(self.__events.materialise())
+
+
+	@property
+	def eventsView(self): #eventsView getter
+		'''
+		Read-only columnar view of the events. This is a read-only property.
+		
+		No event objects are built and no data is copied. The view is a
+		mapping from the column names ('ids', 'onsets', 'durations',
+		'ends', 'units', 'multipliers' and 'infos') to read-only numpy
+		arrays, where the i-th element of every column corresponds to
+		the same event. Units are coded as in
+		:class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`.
+		
+		The view reflects the events at the time of the call. Request a
+		new view after modifying the events of the timeline.
+		
+		:getter: Gets the read-only view of the events.
+		:type: :class:`types.MappingProxyType` of str to :class:`numpy.ndarray`
 		'''
-		return copy.deepcopy(self.__events)
+		return self.__events.getView()
 
 
 	@property
@@ -721,7 +934,9 @@ class smTimeline(smIdentifiable):
 		:setter: Sets the init.
 		:type: float
 		'''
-		return self.__timestamps[0]
+		if self.__timestamps is not None:
+			return self.__timestamps[0]
+		return self.__init
 
 	@init.setter
 	def init(self,newInit): #end setter
@@ -734,8 +949,11 @@ class smTimeline(smIdentifiable):
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
 
-		shift = newInit - self.__timestamps[0]
-		self.__timestamps = self.__timestamps + shift
+		shift = newInit - self.init
+		if self.__timestamps is not None:
+			self.__timestamps = self.__timestamps + shift
+		else:
+			self.__init = float(newInit)
 		#Finally, shift and trim events
 		self._shiftEvents(shift)
 
@@ -750,7 +968,7 @@ class smTimeline(smIdentifiable):
 		:setter: Sets the startTime.
 		:type: :class:`datetime.datetime`
 		'''
-		return copy.deepcopy(self.__startTime)
+		return self.__startTime #datetime objects are immutable
 
 	@startTime.setter
 	def startTime(self,newInitTime): #startTime setter
@@ -813,7 +1031,9 @@ class smTimeline(smIdentifiable):
 		:setter: Sets the length. newLength must be positive (>=0).
 		:type: int
 		'''
-		return len(self.__timestamps)
+		if self.__timestamps is not None:
+			return len(self.__timestamps)
+		return self.__length
 
 	@length.setter
 	def length(self,newLength): #length setter
@@ -825,7 +1045,11 @@ class smTimeline(smIdentifiable):
 			msg = self.getClassName() + ':length: Unexpected attribute value.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		if newLength < self.length:
+		if self.__timestamps is None:
+			#Implicit timestamps; new timestamps are equispaced according
+			#to the samplingRate, and hence just set the new length.
+			self.__length = newLength
+		elif newLength < self.length:
 			#Just crop
 			self.__timestamps = np.resize(self.__timestamps,newLength)
 		elif newLength > self.length:
@@ -837,7 +1061,7 @@ class smTimeline(smIdentifiable):
 			if self.samplingRate > 0: #Uniformly spaced
 				tmpSamplingRate = self.samplingRate
 			else: #Non-uniformly spaced
-				tmpSamplingRate = 1/np.average(np.diff(self.timestamps,n=1) * 10**self.timeMultiplier)
+				tmpSamplingRate = 1/np.average(np.diff(self.__timestamps,n=1) * 10**self.__timeMultiplier)
 			self.__timestamps[currLength:] = currEnd + \
 				(1/tmpSamplingRate) * np.arange(1, 1+newLength-currLength, 1, \
 						dtype=None) #Timestamps in [seconds] (scaled by timestampsMultiplier)
@@ -897,11 +1121,15 @@ class smTimeline(smIdentifiable):
 			msg = self.getClassName() + ':samplingRate: Unexpected attribute type.'
 			warnings.warn(msg,SyntaxWarning)
 		newSamplingRate = float(newSamplingRate)
-		if newSamplingRate>=0: #Uniformly spaced
+		if newSamplingRate>0: #Uniformly spaced
+			#Timestamps become implicit, keeping init and length
+			self.__init = self.init
+			self.__length = self.length
+			self.__timestamps = None
 			self.__samplingRate = newSamplingRate
-			newEnd = self.init + (self.length-1) / (newSamplingRate * 10**self.timeMultiplier)
-			self.__timestamps = np.linspace(self.init, newEnd, self.length, dtype=None)
 		else:
+			#Non-uniformly spaced. Keep the current timestamps explicitly.
+			self.__timestamps = self._getTimestamps()
 			self.__samplingRate = -1
 		return None
 
@@ -932,7 +1160,10 @@ class smTimeline(smIdentifiable):
 		newMultiplier = float(newMultiplier)
 		#Adjust end and timestamps
 		currMultiplier = self.__timeMultiplier
-		self.__timestamps = self.timestamps / 10**(newMultiplier-currMultiplier)
+		if self.__timestamps is not None:
+			self.__timestamps = self.__timestamps / 10**(newMultiplier-currMultiplier)
+		else:
+			self.__init = self.__init / 10**(newMultiplier-currMultiplier)
 		#...and set the new timeMultiplier
 		self.__timeMultiplier = newMultiplier
 		return None
@@ -948,11 +1179,23 @@ class smTimeline(smIdentifiable):
 		
 		Timestamps will be automatically sorted, and duplicates eliminated.
 		
+		In uniformly sampled timelines, timestamps are not stored but
+		computed from :attr:`init`, :attr:`samplingRate`, :attr:`length`
+		and :attr:`timeMultiplier` upon each call. Setting timestamps
+		which are not equally spaced makes the timeline keep them
+		explicitly.
+		
+		The getter returns a read-only array; when timestamps are held
+		explicitly, it is a view and no copy is made.
+		Use :meth:`numpy.ndarray.copy` if you need to modify them.
+		
 		:getter: Gets the list of timestamps.
 		:setter: Sets the list of timestamps.
 		:type: :class:`np.array`
 		'''
-		return copy.deepcopy(self.__timestamps)
+		tmp = self._getTimestamps().view()
+		tmp.flags.writeable = False
+		return tmp
 
 	@timestamps.setter
 	def timestamps(self,newTimestamps): #timeMultiplier setter
@@ -976,13 +1219,24 @@ class smTimeline(smIdentifiable):
 			msg = self.getClassName() + ':timestamps: Some elements of array timestamps may not be numeric.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		self.__timestamps = np.unique(newTimestamps)
+		newTimestamps = np.unique(newTimestamps)
 		#Estimate new sampling rate
-		tmpSamplingRate = 1/np.average(np.diff(self.__timestamps,n=1) * 10**self.timeMultiplier)
-		if (np.diff(self.__timestamps,n=1) < (1.5/tmpSamplingRate)).all():
+		tmpSamplingRate = 1/np.average(np.diff(newTimestamps,n=1) * 10**self.__timeMultiplier)
+		tmpStep = 1/(tmpSamplingRate * 10**self.__timeMultiplier)
+		if len(newTimestamps) > 1 and np.allclose(newTimestamps, \
+				newTimestamps[0] + tmpStep * np.arange(len(newTimestamps)), \
+				rtol = 0, atol = 1e-9 * tmpStep):
+			#Equally spaced; timestamps can be kept implicitly
+			self.__timestamps = None
+			self.__init = float(newTimestamps[0])
+			self.__length = len(newTimestamps)
 			self.__samplingRate = tmpSamplingRate
 		else:
-			self.__samplingRate = -1 #Non-uniformly spaced
+			self.__timestamps = newTimestamps
+			if (np.diff(self.__timestamps,n=1) < (1.5/tmpSamplingRate)).all():
+				self.__samplingRate = tmpSamplingRate
+			else:
+				self.__samplingRate = -1 #Non-uniformly spaced
 		#and remove or crop events as needed.
 		self._trimEvents()
 		return None
@@ -999,10 +1253,14 @@ class smTimeline(smIdentifiable):
 		the user can used :meth:`toSeconds` and :meth:`toSamples`
 		to change the attr:`unit`.
 		
+		The unit is an interned (shared and immutable)
+		:class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`, so
+		no copy is made.
+		
 		:getter: Gets the time measurement unit.
 		:type: :class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`
 		'''
-		return copy.deepcopy(self.__unit)
+		return self.__unit
 
 
 	@property
@@ -1039,12 +1297,8 @@ class smTimeline(smIdentifiable):
 			raise ValueError(msg)
 			
 		s = '<' + self.getClassName() + ': {\n'
-		#Grab Class attributes (note that this will only pick class attributes
-		#but not instance attributes)
-		#The filter ignores python __ attributes e.g. __repr__
-		iters = dict((name,value) for name,value in self.__dict__.items() if name[:2] != '__')
-		#Update with the instance items
-		iters.update(self.__dict__)
+		#Grab the instance attributes (whether in __slots__ or __dict__)
+		iters = self._getAttributes()
 		#Finally build the string
 		for name,value in iters.items():
 			#Deal with python namemangling
@@ -1074,33 +1328,423 @@ class smTimeline(smIdentifiable):
 		return s + indentationLevel*'\t' + '}>'
 
 	#Protected methods
-	def _checkOverlapConflicts(self):
+	def _checkOverlapConflicts(self, eventIDs = None):
 		'''
 		Check for any existing conflicts between events in non-overlapping
 		:class:`smTimelineConditions <scimeth.data.smTimelineConditions>`.
 		
-		If any conflict is found an error is raised.
-		'''
-		#Get the list of non-overlapping pairs by complementing the
-		#list of overlapping conditions.
-		fullPairings = set(itertools.combinations(self.getConditionsID(), 2))
-		nonOverlapping = fullPairings - self.overlapStatus
-		
-		#Check conflicts among non-overlapping pairs
-		for elem in nonOverlapping:
-			cond1events = self.getConditionsEvents(theConditions = elem[0])
-			cond2events = self.getConditionsEvents(theConditions = elem[1])
-			for ev1 in cond1events:
-				for ev2 in cond2events:
-					if ev1.hasOverlap(ev2):
-						msg = self.getClassName() + ':allowOverlap: Conditions ' \
-								+ elem[0] + ' and ' + elem[1] + \
-								' have conflicting events. Resolve conflict before allowing overlap.'
-						#warnings.warn(msg,SyntaxWarning)
-						raise ValueError(msg)
+		If any conflict is found an error is raised. The error message
+		lists all the conflicts found.
+		
+		If only a few events have been modified, the check can be
+		restricted to them; each of these events is only compared with
+		the events overlapping with it. Otherwise, all the events are
+		checked.
+		
+		.. seealso:: :meth:`getOverlapConflicts`
+		
+		:Parameters:
+		
+		:param eventIDs: Optional. The ids of the modified events. If
+			None (default), all events are checked.
+		:type eventIDs: iterable of int
+		'''
+		store = self.__events
+		if eventIDs is not None:
+			eventIDs = np.asarray(list(eventIDs), dtype = np.int64)
+		if eventIDs is None \
+				or len(eventIDs) > smTimeline.__LOCALOVERLAPFRACTION * len(store):
+			conflicts = self.getOverlapConflicts()
+		else:
+			positions = store.getPositions(eventIDs)
+			ids = store.ids[positions]
+			scale = 10.0**store.multipliers[positions]
+			evIDs, condIDs = self.__membership.getEventPairs(ids)
+			conditions = dict([(evid, list()) for evid in ids.tolist()])
+			for evid, condid in zip(evIDs.tolist(), condIDs.tolist()):
+				conditions[evid].append(condid)
+			conflicts = self._getLocalOverlapConflicts(ids, \
+							store.units[positions], \
+							store.onsets[positions] * scale, \
+							store.ends[positions] * scale, \
+							[conditions[evid] for evid in ids.tolist()])
+		if len(conflicts) > 0:
+			#Group the conflicting events by pair of conditions
+			conflictsByPair = dict()
+			for cond1, cond2, ev1, ev2 in conflicts:
+				conflictsByPair.setdefault((cond1, cond2), list()).append((ev1, ev2))
+			msg = self.getClassName() + ':_checkOverlapConflicts: ' \
+					+ str(len(conflicts)) + ' conflicting pairs of events found.'
+			for pair, evPairs in conflictsByPair.items():
+				msg = msg + ' Conditions ' + str(pair[0]) + ' and ' \
+						+ str(pair[1]) + ' have conflicting events ' \
+						+ ', '.join([str(x) for x in evPairs]) + '.'
+			msg = msg + ' Resolve conflicts or allow overlap between the conditions.'
+			raise ValueError(msg)
 		return None
 
 
+	@staticmethod
+	def _fftConvolve(signals, kernel, kernelKey = None):
+		'''
+		Convolves each column of a matrix with a kernel using the FFT.
+		
+		The output is truncated to the length of the signals (i.e. the
+		convolution is causal).
+		
+		:Parameters:
+		
+		:param signals: The signals (samples x nSignals).
+		:type signals: numpy.ndarray
+		:param kernel: The kernel.
+		:type kernel: numpy.ndarray
+		:param kernelKey: Optional. The key of the kernel in the cache of
+			HRF kernels (see :meth:`getHRFKernel`). If given, the FFT of
+			the kernel is also cached; only the FFTs most recently used
+			are kept. The default is None.
+		:type kernelKey: tuple
+		
+		:return: The convolved signals (samples x nSignals).
+		:rtype: numpy.ndarray
+		'''
+		nSamples = signals.shape[0]
+		if nSamples == 0 or len(kernel) == 0 or signals.shape[1] == 0:
+			return np.zeros(signals.shape, dtype = np.float64)
+		#Smallest power of 2 avoiding circular wrap-around
+		nfft = 1 << int(nSamples + len(kernel) - 2).bit_length()
+		cache = smTimeline.__hrfKernelFFTs
+		key = None if kernelKey is None else (kernelKey, nfft)
+		if key in cache:
+			cache.move_to_end(key)
+			kernelFFT = cache[key]
+		else:
+			kernelFFT = np.fft.rfft(kernel, nfft)
+			if key is not None:
+				cache[key] = kernelFFT
+				if len(cache) > smTimeline.__HRFFFTCACHESIZE:
+					cache.popitem(last = False)
+		res = np.fft.irfft(np.fft.rfft(signals, nfft, axis = 0) \
+						   * kernelFFT[:, None], nfft, axis = 0)
+		return res[:nSamples]
+
+
+	@staticmethod
+	def _getHRFKernel(samplingRate, hrf = None, hrfParameters = None):
+		'''
+		Gets a cached HRF kernel and its key in the cache.
+		
+		See :meth:`getHRFKernel` for the parameters.
+		
+		:return: A tuple (kernel, key). Kernels built from a
+			user-supplied function are not cached and their key is None.
+		:rtype: tuple (numpy.ndarray, tuple)
+		'''
+		if not (isinstance(samplingRate, (int, float, np.number)) and samplingRate > 0):
+			msg = 'smTimeline:getHRFKernel: Unexpected parameter value for samplingRate. Sampling rate must be strictly positive.'
+			raise ValueError(msg)
+		if hrfParameters is None:
+			hrfParameters = dict()
+		if type(hrfParameters) is not dict:
+			msg = 'smTimeline:getHRFKernel: Unexpected parameter type for hrfParameters.'
+			raise ValueError(msg)
+		params = dict(smTimeline.__HRFDEFAULTS)
+		for name, value in hrfParameters.items():
+			if name not in params:
+				msg = 'smTimeline:getHRFKernel: Unexpected HRF parameter ' + str(name) + '.'
+				raise ValueError(msg)
+			params[name] = float(value)
+		if hrf is not None:
+			if not callable(hrf):
+				msg = 'smTimeline:getHRFKernel: Unexpected parameter type for hrf.'
+				raise ValueError(msg)
+			#Functions may not be hashable, and caching them would
+			#keep them alive; these kernels are not cached.
+			t = np.arange(0, params['kernelLength'], 1 / samplingRate)
+			kernel = np.asarray(hrf(t), dtype = np.float64).ravel()
+			if kernel.shape != t.shape:
+				msg = 'smTimeline:getHRFKernel: Unexpected HRF. The function must return one value per time.'
+				raise ValueError(msg)
+			kernel.flags.writeable = False
+			return kernel, None
+		key = (float(samplingRate),) + tuple(sorted(params.items()))
+		cache = smTimeline.__hrfKernels
+		if key in cache:
+			cache.move_to_end(key)
+		else:
+			t = np.arange(0, params['kernelLength'], 1 / samplingRate)
+			def gammaPdf(x, delay, dispersion):
+				#Gamma pdf with shape delay/dispersion and scale dispersion
+				shape = delay / dispersion
+				res = np.zeros(len(x))
+				tmp = x > 0
+				res[tmp] = np.exp((shape - 1) * np.log(x[tmp]) - x[tmp] / dispersion \
+								  - math.lgamma(shape) - shape * math.log(dispersion))
+				return res
+			kernel = gammaPdf(t, params['peakDelay'], params['peakDispersion']) \
+					- gammaPdf(t, params['undershootDelay'], \
+							   params['undershootDispersion']) / params['ratio']
+			kernel = kernel / kernel.sum()
+			kernel.flags.writeable = False
+			cache[key] = kernel
+			if len(cache) > smTimeline.__HRFKERNELCACHESIZE:
+				cache.popitem(last = False)
+		return cache[key], key
+
+
+	def _getLocalOverlapConflicts(self, ids, units, starts, ends, conditions):
+		'''
+		Finds the conflicts of a few (candidate) events with the
+		events in the timeline and among themselves.
+		
+		Candidate events replace any event with the same id in the
+		timeline. The events overlapping with each candidate are
+		retrieved from the interval index of the event store, so the
+		cost for each candidate is O(log n + k), where k is the number of
+		events overlapping with it.
+		
+		See :meth:`getOverlapConflicts` for the definition of conflict.
+		
+		:Parameters:
+		
+		:param ids: The candidate events' ids.
+		:type ids: numpy.ndarray of int
+		:param units: The candidate events' unit codes (see
+			:class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`).
+		:type units: numpy.ndarray of int
+		:param starts: The candidate events' onsets with a neutral multiplier.
+		:type starts: numpy.ndarray of float
+		:param ends: The candidate events' ends with a neutral multiplier.
+		:type ends: numpy.ndarray of float
+		:param conditions: The ids of the existing conditions to which
+			each candidate event is (or would be) associated.
+		:type conditions: list of lists of int
+		
+		:return: The list of conflicts as in :meth:`getOverlapConflicts`.
+		:rtype: list of tuple
+		'''
+		store = self.__events
+		allowed = self.__overlapStatus
+		ids = [int(x) for x in ids]
+		candidateIDs = set(ids)
+		conflicts = set()
+		
+		def addConflicts(ev1, conds1, ev2, conds2):
+			for cond1 in conds1:
+				for cond2 in conds2:
+					if cond1 == cond2 or (min(cond1, cond2), max(cond1, cond2)) in allowed:
+						continue
+					if cond1 < cond2:
+						conflicts.add((cond1, cond2, ev1, ev2))
+					else:
+						conflicts.add((cond2, cond1, ev2, ev1))
+		
+		#Conflicts of the candidates with themselves and their neighbours
+		neighbours = list()
+		for k, evid in enumerate(ids):
+			addConflicts(evid, conditions[k], evid, conditions[k])
+			if len(conditions[k]) == 0:
+				neighbours.append(list())
+				continue
+			positions = store.getPositionsInWindow(starts[k], ends[k], units[k])
+			neighbours.append([x for x in store.ids[positions].tolist() \
+							   if x not in candidateIDs])
+		evIDs, condIDs = self.__membership.getEventPairs( \
+							list(set(itertools.chain(*neighbours))))
+		neighbourConditions = dict()
+		for evid, condid in zip(evIDs.tolist(), condIDs.tolist()):
+			neighbourConditions.setdefault(evid, list()).append(condid)
+		for k, evid in enumerate(ids):
+			for other in neighbours[k]:
+				addConflicts(evid, conditions[k], other, \
+							 neighbourConditions.get(other, list()))
+		#Conflicts among the candidates; sweep in order of unit and onset
+		order = np.lexsort((starts, units)).tolist()
+		for i, k in enumerate(order):
+			for l in order[i+1:]:
+				if units[l] != units[k] or starts[l] > ends[k]:
+					break
+				addConflicts(ids[k], conditions[k], ids[l], conditions[l])
+		return sorted(conflicts)
+
+
+	def _getTimestamps(self):
+		'''
+		Gets the timestamps.
+		
+		If the timestamps are implicit (uniformly sampled timeline), they
+		are computed from :attr:`init`, :attr:`samplingRate`,
+		:attr:`length` and :attr:`timeMultiplier`. Otherwise, the
+		(writeable) array of timestamps held by the timeline is returned.
+		
+		:return: The timestamps in [second * 10^:attr:`timeMultiplier`].
+		:rtype: numpy.ndarray of float
+		'''
+		if self.__timestamps is not None:
+			return self.__timestamps
+		return self.__init + np.arange(self.__length) / \
+				(self.__samplingRate * 10**self.__timeMultiplier)
+
+
+	def _getPositionsInWindow(self, t0, t1, unit, methodName):
+		'''
+		Gets the positions in the event store of the events active within
+		a time window.
+		
+		Events expressed in a unit other than the one of the window are
+		also considered; the window is translated to their unit using the
+		:attr:`timestamps`.
+		
+		:Parameters:
+		
+		:param t0: Start of the window.
+		:type t0: float
+		:param t1: End of the window.
+		:type t1: float
+		:param unit: Unit of the window; either 'Sample' or 'Second'. If
+			None, the timeline :attr:`unit` is used.
+		:type unit: str
+		:param methodName: Name of the calling method for the messages.
+		:type methodName: str
+		
+		:return: The positions of the active events, in increasing order.
+		:rtype: numpy.ndarray of int
+		'''
+		if unit is None:
+			unit = self.__unit.name
+		if unit not in ('Sample', 'Second'):
+			msg = self.getClassName() + ':' + methodName + ': Unexpected parameter value for unit. Unit must be either ''Sample'' or ''Second''.'
+			raise ValueError(msg)
+		if not (isinstance(t0,(int,float,np.number)) and isinstance(t1,(int,float,np.number))):
+			msg = self.getClassName() + ':' + methodName + ': Unexpected parameter type. Times must be numeric.'
+			raise ValueError(msg)
+		store = self.__events
+		window = np.array([t0, t1], dtype = float)
+		#Window in samples and in [second * 10^timeMultiplier].
+		if self.__timestamps is None: #Implicit timestamps
+			step = 1 / (self.__samplingRate * 10**self.__timeMultiplier)
+			if unit == 'Sample':
+				windowSamples = window
+				windowSeconds = self.__init + window * step
+			else:
+				windowSeconds = window
+				windowSamples = (window - self.__init) / step
+		else:
+			#Out of range times are mapped to -inf/+inf.
+			samples = np.arange(len(self.__timestamps))
+			if unit == 'Sample':
+				windowSamples = window
+				windowSeconds = np.interp(window, samples, self.__timestamps, \
+										  left = -np.inf, right = np.inf)
+			else:
+				windowSeconds = window
+				windowSamples = np.interp(window, self.__timestamps, samples, \
+										  left = -np.inf, right = np.inf)
+		res = np.concatenate(( \
+			store.getPositionsInWindow(windowSamples[0], windowSamples[1], \
+									   store.SAMPLE, 0), \
+			store.getPositionsInWindow(windowSeconds[0], windowSeconds[1], \
+									   store.SECOND, self.__timeMultiplier)))
+		res.sort()
+		return res
+
+
+	def _parseOverlapPairs(self, thePairs, methodName):
+		'''
+		Validates a collection of pairs of conditions' ids.
+		
+		:Parameters:
+		
+		:param thePairs: Collection of pairs of conditions' ids. Each pair
+			can be a tuple or a list of two int.
+		:type thePairs: set or list
+		:param methodName: Name of the calling method for the messages.
+		:type methodName: str
+		
+		:return: The set of pairs, as tuples sorted by id. Pairs with
+			ids of conditions not declared in the timeline are discarded
+			with a warning.
+		:rtype: set of tuple
+		'''
+		if type(thePairs) not in (set, frozenset, list):
+			msg = self.getClassName() + ':' + methodName + ': Unexpected attribute type.'
+			#warnings.warn(msg,SyntaxWarning)
+			raise ValueError(msg)
+		res = set()
+		for elem in thePairs:
+			if not (type(elem) in (list, tuple) and len(elem)==2 \
+				   and type(elem[0]) is int and type(elem[1]) is int):
+				msg = self.getClassName() + ':' + methodName + ': Unexpected attribute value. At least one element is not a pair of conditions ids.'
+				#warnings.warn(msg,SyntaxWarning)
+				raise ValueError(msg)
+			#Discard those pairs which do contain the ID of a non contained condition
+			if elem[0] not in self.__conditions or elem[1] not in self.__conditions:
+				msg = self.getClassName() + ':' + methodName + ': Inexistent id found. Ignoring entry ' + str(elem) + '.'
+				warnings.warn(msg,SyntaxWarning)
+				continue
+			#Sort the pair by id
+			res.add(tuple(sorted(elem)))
+		return res
+
+
+	def _samplesToTimes(self, samples):
+		'''
+		Converts (possibly fractional) sample indexes to times in
+		[second * 10^:attr:`timeMultiplier`].
+		
+		With implicit timestamps, times are computed from
+		:attr:`init` and :attr:`samplingRate` (extrapolating beyond the
+		:attr:`length` if needed). Otherwise, times
+		are linearly interpolated between the :attr:`timestamps`, and
+		indexes out of range are clipped to the first or last timestamp.
+		
+		:Parameters:
+		
+		:param samples: The sample indexes.
+		:type samples: numpy.ndarray
+		
+		:return: The times.
+		:rtype: numpy.ndarray of float
+		'''
+		samples = np.asarray(samples, dtype = float)
+		if self.__timestamps is None: #Implicit timestamps
+			return self.__init + \
+				samples / (self.__samplingRate * 10**self.__timeMultiplier)
+		return np.interp(samples, np.arange(len(self.__timestamps)), \
+						 self.__timestamps)
+
+
+	def _timesToSamples(self, times):
+		'''
+		Converts times in [second * 10^:attr:`timeMultiplier`] to the
+		index of the closest timestamp.
+		
+		With implicit timestamps, indexes are computed from
+		:attr:`init` and :attr:`samplingRate`. Otherwise, the closest of
+		the :attr:`timestamps` is found by binary
+		search. In both cases, indexes are clipped to [0, :attr:`length`].
+		
+		:Parameters:
+		
+		:param times: The times.
+		:type times: numpy.ndarray
+		
+		:return: The sample indexes.
+		:rtype: numpy.ndarray of float
+		'''
+		times = np.asarray(times, dtype = float)
+		if self.__timestamps is None: #Implicit timestamps
+			res = np.rint((times - self.__init) * \
+						  self.__samplingRate * 10**self.__timeMultiplier)
+			return np.clip(res, 0, self.__length)
+		tstamps = self.__timestamps
+		idx = np.clip(np.searchsorted(tstamps, times), 1, max(len(tstamps)-1, 1))
+		#Choose between the timestamps to the left and to the right
+		left = tstamps[idx-1]
+		right = tstamps[np.minimum(idx, len(tstamps)-1)]
+		idx = np.where(times - left <= right - times, idx-1, idx)
+		return idx.astype(float)
+
+
 	def _shiftEvents(self,shift):
 		'''
 		Shift :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
@@ -1110,9 +1754,14 @@ class smTimeline(smIdentifiable):
 		Events are trimmed after shfiting (see :meth:`_trimEvents`)
 		
 		'''
+		store = self.__events
+		if len(store) > 0:
+			if self.__unit.name == 'Second':
+				#The shift is in [second * 10^timeMultiplier], but each event
+				#may be expressed with its own multiplier.
+				shift = shift * 10**(self.__timeMultiplier - store.multipliers)
+			store.setColumns(np.arange(len(store)), onsets = store.onsets + shift)
 		#Remove or crop events as needed.
-		for ev in self.events:
-			ev.onset = ev.onset + shift
 		self._trimEvents()
 		return
 
@@ -1137,34 +1786,34 @@ class smTimeline(smIdentifiable):
 		  :attr:`init` (if the timeline :attr:`unit` is in 'Second')
 		
 		'''
-		#Remove or crop events as needed.
-		if self.unit.name == 'Sample':
-			for ev in self.events:
-				if ev.onset > self.length or ev.end < 0: #Remove
-					#Delete from conditions
-					for cond in self.conditionEventsMap.iterkeys():
-						if ev.id in self.conditionEventsMap[cond]:
-							self.conditionEventsMap[cond].remove(ev.id)
-					#and remove from the list of events
-					self.events.remove(ev)
-				if ev.end > self.length: #Crop
-					ev.end = self.length
-				if ev.init < 0: #Crop
-					ev.init = 0
+		store = self.__events
+		if len(store) == 0:
+			return
+		#Bounds in the events' units
+		if self.__unit.name == 'Sample':
+			lowerBound = np.zeros(len(store))
+			upperBound = self.length * np.ones(len(store))
 		else: #Units in 'Second'
-			for ev in self.events:
-				if ev.onset > self.end or ev.end < self.init: #Remove
-					#Delete from conditions
-					for cond in self.conditionEventsMap.iterkeys():
-						if ev.id in self.conditionEventsMap[cond]:
-							self.conditionEventsMap[cond].remove(ev.id)
-					#and remove from the list of events
-					self.events.remove(ev)
-				if ev.end > self.end: #Crop
-					ev.end = self.end
-				if ev.init < self.init: #Crop
-					ev.init = self.init
-					
+			#Timestamps are in [second * 10^timeMultiplier], but each event
+			#may be expressed with its own multiplier.
+			scale = 10**(self.__timeMultiplier - store.multipliers)
+			lowerBound = self.init * scale
+			upperBound = self.end * scale
+		#Remove events (and their associations to conditions)
+		toRemove = (store.onsets > upperBound) | (store.ends < lowerBound)
+		if toRemove.any():
+			self.__membership.removeEvents(store.ids[toRemove])
+			store.remove(np.flatnonzero(toRemove))
+			lowerBound = lowerBound[~toRemove]
+			upperBound = upperBound[~toRemove]
+		#Crop events
+		newEnds   = np.minimum(store.ends, upperBound)
+		newOnsets = np.maximum(store.onsets, lowerBound)
+		toCrop = (newEnds != store.ends) | (newOnsets != store.onsets)
+		if toCrop.any():
+			positions = np.flatnonzero(toCrop)
+			store.setColumns(positions, onsets = newOnsets[positions], \
+							 durations = newEnds[positions] - newOnsets[positions])
 		return
 
 	
@@ -1219,27 +1868,18 @@ class smTimeline(smIdentifiable):
 				#warnings.warn(msg,SyntaxWarning)
 				raise ValueError(msg)
 	
-		#Merge sets of conditions excluding repeated conditions if any
-			#Note that attempting a direct merge of sets:
-			#   self.conditions.union(newConditions)
-			#will only capture conditions that are the SAME object, but this is
-			#insufficient since two different objects may still have the
-			#same id.
-		#Remove duplicate events with the same id
-		seenIDs  = set([cond.id  for cond in self.conditions])
-		seenTags = set([cond.tag for cond in self.conditions])
+		#Merge conditions excluding repeated conditions if any
+			#Conditions are indexed by id, so two different objects
+			#with the same id are detected as duplicates.
+		seenTags = set([cond.tag for cond in self.__conditions.values()])
 		flagSeenID  = False
 		flagSeenTag = False
-		#Python does not allow iterate over a set while changing its size,
-		#so just create a copy for iterating over it, but still remove
-		#from the original
-		newConditions = copy.deepcopy(newConditions)
+		acceptedConditions = dict()
 		for cond in newConditions:
-			if cond.id in seenIDs:
-				newConditions.remove(cond)
+			if cond.id in self.__conditions or cond.id in acceptedConditions:
 				flagSeenID = True
-			else:
-				seenIDs.add(cond.id)
+				continue
+			acceptedConditions[cond.id] = copy.deepcopy(cond)
 			if cond.tag in seenTags:
 				flagSeenTag = True
 			else:
@@ -1256,19 +1896,127 @@ class smTimeline(smIdentifiable):
 					'practice to keep them distinct.'
 				warnings.warn(msg,SyntaxWarning)
 		#Update the remaining conditions
-		self.__conditions = self.__conditions.union(newConditions)
-		#Ensure there is the associated entry in the conditionEventsMap
-		for cond in newConditions:
-			try:
-				self.__conditionEventsMap[cond.id] #If there is no such entry, it will raise a KeyError
-			except:
-				self.__conditionEventsMap[cond.id] = set()
+		self.__conditions.update(acceptedConditions)
 		#In principle, there is no need to declare the condition neither
 		#in the overlappingStatus.
 		return None
 		
 
 
+	def addEventColumns(self, onsets, durations = None, ends = None, \
+						unit = 'Sample', unitMultiplier = 0, ids = None, \
+						conditions = None, infos = None):
+		'''Add a batch of events given in columnar form.
+		
+		This is the bulk counterpart of :meth:`addEvents`. The events are
+		inserted in a single vectorized step without building
+		:class:`smTimelineEvent <scimeth.data.smTimelineEvent>` objects.
+		
+		Durations may be given either through `durations` or `ends`.
+		If neither is provided, events are instantaneous. As with
+		:class:`smTimelineEvent <scimeth.data.smTimelineEvent>`, onsets
+		and durations in 'Sample' are rounded.
+		
+		If no ids are provided, a block of new ids is reserved for the
+		events. Otherwise, events whose id is repeated within the batch
+		or already exists in the timeline are discarded with a warning.
+		
+		Optionally, each event can be associated to one condition. If
+		the new associations conflict with the overlapping status of the
+		conditions, no event is added.
+		
+		:Parameters:
+		
+		:param onsets: The events' onsets.
+		:type onsets: array-like of float
+		:param durations: Optional. The events' durations.
+		:type durations: array-like of float
+		:param ends: Optional. The events' ends. Ignored if `durations`
+			are given.
+		:type ends: array-like of float
+		:param unit: Optional. Temporal unit of all the events; either
+			'Second' or 'Sample'. The default is 'Sample'.
+		:type unit: str
+		:param unitMultiplier: Optional. Unit multiplier of all the events
+			if `unit` is 'Second'. The default is 0.
+		:type unitMultiplier: float
+		:param ids: Optional. The events' ids.
+		:type ids: array-like of int
+		:param conditions: Optional. The condition id to which each event
+			is associated. Events with an id not corresponding to any
+			condition in the timeline (e.g. -1) are not associated.
+		:type conditions: array-like of int
+		:param infos: Optional. The events' information.
+		:type infos: sequence of object
+		
+		:return: The ids of the added events.
+		:rtype: numpy.ndarray of int
+		
+		.. seealso:: :meth:`addEvents`
+		'''
+		store = self.__events
+		onsets = np.asarray(onsets, dtype = np.float64).ravel()
+		nNew = len(onsets)
+		if durations is not None:
+			durations = np.asarray(durations, dtype = np.float64).ravel()
+		elif ends is not None:
+			durations = np.asarray(ends, dtype = np.float64).ravel() - onsets
+		else:
+			durations = np.zeros(nNew)
+		if len(durations) != nNew \
+				or (ids is not None and len(ids) != nNew) \
+				or (conditions is not None and len(conditions) != nNew) \
+				or (infos is not None and len(infos) != nNew):
+			msg = self.getClassName() + ':addEventColumns: Unexpected parameter value. All columns must have the same length.'
+			raise ValueError(msg)
+		if unit == 'Sample':
+			unitCode = store.SAMPLE
+			unitMultiplier = 0
+			onsets = np.rint(onsets)
+			durations = np.rint(durations)
+		elif unit == 'Second':
+			unitCode = store.SECOND
+		else:
+			msg = self.getClassName() + ':addEventColumns: Unexpected parameter value for unit.'
+			raise ValueError(msg)
+		if (onsets < 0).any() or (durations < 0).any():
+			msg = self.getClassName() + ':addEventColumns: Unexpected parameter value. Onsets and durations must be positive or 0.'
+			raise ValueError(msg)
+
+		if ids is None:
+			ids = np.arange(nNew, dtype = np.int64) + smTimelineEvent.reserveIDs(nNew)
+			accepted = np.ones(nNew, dtype = bool)
+		else:
+			ids = np.asarray(ids, dtype = np.int64).ravel()
+			#Keep the first occurrence of every id not in the timeline
+			_, first = np.unique(ids, return_index = True)
+			accepted = np.zeros(nNew, dtype = bool)
+			accepted[first] = True
+			accepted &= ~np.isin(ids, store.ids)
+			if not accepted.all():
+				msg = self.getClassName() + ':addEventColumns: At least one new event has a repeated id. Events with duplicate ids will be discarded.'
+				warnings.warn(msg,SyntaxWarning)
+		ids = ids[accepted]
+		if infos is not None:
+			infos = [info for info, flag in zip(infos, accepted) if flag]
+		store.addColumns(ids, onsets[accepted], durations[accepted], \
+						 np.full(len(ids), unitCode, dtype = np.int8), \
+						 np.full(len(ids), unitMultiplier, dtype = np.float64), infos)
+
+		if conditions is not None:
+			conditions = np.asarray(conditions, dtype = np.int64).ravel()[accepted]
+			toAssociate = np.isin(conditions, list(self.__conditions))
+			self.__membership.addPairs(conditions[toAssociate], ids[toAssociate])
+			try:
+				self._checkOverlapConflicts(ids[toAssociate])
+			except ValueError:
+				#Undo the insertion
+				self.__membership.removeEvents(ids)
+				store.remove(np.arange(len(store)-len(ids), len(store)))
+				raise
+		return ids
+
+
 	def addEvents(self,newEvents):
 		'''Add a collection of
 		:class:`smTimelineEvents <scimeth.data.smTimelineEvent>` to the
@@ -1291,8 +2039,7 @@ class smTimeline(smIdentifiable):
 		.. seealso:: :meth:`assignEvents`
 		
 		'''
-		tmp = smTimelineEvent()
-		if str(newEvents.__class__) == str(tmp.__class__):
+		if isinstance(newEvents, smTimelineEvent):
 			newEvents = {newEvents}
 		if (type(newEvents) is list):
 			#msg = self.getClassName() + ':addEvents: Converting list to set. Duplicate events will be discarded.'
@@ -1304,7 +2051,7 @@ class smTimeline(smIdentifiable):
 			raise ValueError(msg)
 		#Check all are events
 		for ev in newEvents:
-			if str(ev.__class__) != str(tmp.__class__):
+			if not isinstance(ev, smTimelineEvent):
 				msg = self.getClassName() + ':addEvents: Unexpected attribute type. At least one element of `newEvents` is not a `smTimelineEvent`.'
 				#warnings.warn(msg,SyntaxWarning)
 				raise ValueError(msg)
@@ -1316,23 +2063,22 @@ class smTimeline(smIdentifiable):
 			#insufficient since two different objects may still have the
 			#same id.
 		#Remove duplicate events with the same id
-		seenIDs = set([ev.id for ev in self.events])
+		seenIDs = set()
 		flagSeenID = False
-		#Python does not allow iterate over a set while changing its size,
-		#so just create a copy for iterating over it, but still remove
-		#from the original
-		newEvents = copy.deepcopy(newEvents)
+		acceptedEvents = list()
 		for ev in newEvents:
-			if ev.id in seenIDs:
-				newEvents.remove(ev)
+			if ev.id in seenIDs or self.__events.hasID(ev.id):
 				flagSeenID = True
 			else:
 				seenIDs.add(ev.id)
+				acceptedEvents.append(ev)
 		if flagSeenID is True:
 				msg = self.getClassName() + ':addEvents: At least one new event has a repeated id. Events with duplicate ids will be discarded.'
 				warnings.warn(msg,SyntaxWarning)
-		#Finally, update the remaining events
-		self.__events = self.events.union(newEvents)
+		#Finally, update the remaining events.
+		#Note that the store copies the values of the events, so there is
+		#no need to deepcopy the new events.
+		self.__events.addEvents(acceptedEvents)
 		return None
 		
 
@@ -1355,40 +2101,15 @@ class smTimeline(smIdentifiable):
 		:Parameters:
 		
 		:param newOverlap: Set of pairs of conditions' ids.
-		:type newOverlap: set of pairs. Each pair is a list of ids.
+		:type newOverlap: set of pairs. Each pair is a tuple (or list) of ids.
 			A list can also be provided, but duplicates will be ignored.
 		'''
-		if type(newOverlap) is list:
-			newOverlap = set(newOverlap)
-		if type(newOverlap) is not set:
-			msg = self.getClassName() + ':allowOverlap: Unexpected attribute type.'
-			#warnings.warn(msg,SyntaxWarning)
-			raise ValueError(msg)
-		#Check that it is a set of pairs
-		condid = [cond.id for cond in self.conditions];
-		newOverlap = copy.deepcopy(newOverlap)
-		for elem in newOverlap:
-			if not (type(elem) is list and len(elem)==2 \
-				   and type(elem[0]) is int and type(elem[1]) is int):
-				msg = self.getClassName() + ':allowOverlap: Unexpected attribute value. At least one element is not a pair of conditions ids.'
-				#warnings.warn(msg,SyntaxWarning)
-				raise ValueError(msg)
-			#Discard those pairs which do contain the ID of a non contained condition
-			if elem[0] not in condid or elem[1] not in condid:
-				msg = self.getClassName() + ':allowOverlap: Inexistent id found. Ignoring entry ' + str(elem) + '.'
-				warnings.warn(msg,SyntaxWarning)
-				newOverlap.remove(elem)
-			#Sort the pair by id
-			elem.sort()
+		newOverlap = self._parseOverlapPairs(newOverlap, 'allowOverlap')
 
 		#At this point, newOverlap contains for sure only a set of pairs of
 		#existing IDs.
-		try:
-			self.__overlapStatus = self.__overlapStatus.union(newOverlap)
-			self._checkOverlapConflicts()
-		except:
-			raise
-
+		#Allowing overlap cannot introduce new conflicts; no need to check.
+		self.__overlapStatus = self.__overlapStatus.union(newOverlap)
 		return None
 
 	def associateEvents(self,eventsIDSet = set(), conditionsIDSet = set()):
@@ -1442,18 +2163,19 @@ class smTimeline(smIdentifiable):
 				#warnings.warn(msg,SyntaxWarning)
 				raise ValueError(msg)
 		#Discard entries not already in the timeline
-		eventsIDSet     = copy.deepcopy(eventsIDSet)
-		conditionsIDSet = copy.deepcopy(conditionsIDSet)
-		eventsIDs = set([ev.id for ev in self.events])
-		existingEvents = set(eventsIDSet).intersection(eventsIDs)
-		conditionsIDs  = set([cond.id for cond in self.conditions])
-		existingConditions = set(conditionsIDSet).intersection(conditionsIDs)
+		existingEvents = set([oid for oid in eventsIDSet if self.__events.hasID(oid)])
+		existingConditions = set(conditionsIDSet).intersection(self.__conditions)
 		#Now is a matter of pairing the existingEvents with those in existingConditions
+		oldEvents, oldConditions = self.__membership.getEventPairs(existingEvents)
 		try:
-			for condid in existingConditions:
-				self.__conditionEventsMap[condid] = self.__conditionEventsMap[condid].union(existingEvents)
-			self._checkOverlapConflicts()
-		except:
+			self.__membership.associate(existingConditions, existingEvents)
+			if len(existingConditions) > 0:
+				self._checkOverlapConflicts(existingEvents)
+		except ValueError:
+			#Undo the association; restore the previous pairs
+			self.__membership.dissociate(existingConditions, existingEvents)
+			toRestore = np.isin(oldConditions, list(existingConditions))
+			self.__membership.addPairs(oldConditions[toRestore], oldEvents[toRestore])
 			raise
 		return None
 		
@@ -1466,10 +2188,10 @@ class smTimeline(smIdentifiable):
 		:class:`smTimeline <scimeth.data.smTimeline>`.
 		'''
 		#Reset the list of conditions
-		self.__conditions = set()
+		self.__conditions = dict()
 		#and clear associations with conditions.
-		self.__conditionEventsMap = dict()
-		self.__overlappingStatus = set()
+		self.__membership.clear()
+		self.__overlapStatus = set()
 		return None
 
 	
@@ -1479,13 +2201,25 @@ class smTimeline(smIdentifiable):
 		:class:`smTimeline <scimeth.data.smTimeline>`.
 		'''
 		#Reset the list of events
-		self.__events = set()
+		self.__events.clear()
 		#and clear associations with conditions.
-		for k in self.conditionEventsMap.iterkeys():
-			self.conditionEventsMap[k] = set()
+		self.__membership.clear()
 		return None
 
 
+	def copy(self):
+		'''Gets a deep copy of the
+		:class:`smTimeline <scimeth.data.smTimeline>`.
+		
+		Getters and views of the timeline avoid copying wherever possible.
+		Use this method when an independent duplicate is needed.
+		
+		:return: A copy of the timeline.
+		:rtype: :class:`smTimeline <scimeth.data.smTimeline>`
+		'''
+		return copy.deepcopy(self)
+
+
 	def dissociateEvents(self,eventsIDSet = set(), conditionsIDSet = set()):
 		'''
 		Unlinks :class:`smTimelineEvents <scimeth.data.smTimelineEvent>` from
@@ -1537,15 +2271,10 @@ class smTimeline(smIdentifiable):
 				#warnings.warn(msg,SyntaxWarning)
 				raise ValueError(msg)
 		#Discard entries not already in the timeline
-		eventsIDSet     = copy.deepcopy(eventsIDSet)
-		conditionsIDSet = copy.deepcopy(conditionsIDSet)
-		eventsIDs = set([ev.id for ev in self.events])
-		existingEvents = set(eventsIDSet).intersection(eventsIDs)
-		conditionsIDs  = set([cond.id for cond in self.conditions])
-		existingConditions = set(conditionsIDSet).intersection(conditionsIDs)
+		existingEvents = set([oid for oid in eventsIDSet if self.__events.hasID(oid)])
+		existingConditions = set(conditionsIDSet).intersection(self.__conditions)
 		#Now is a matter of pairing the existingEvents with those in existingConditions
-		for condid in existingConditions:
-			self.__conditionEventsMap[condid] = self.__conditionEventsMap[condid].remove(existingEvents)
+		self.__membership.dissociate(existingConditions, existingEvents)
 		return None
 		
 
@@ -1577,43 +2306,157 @@ class smTimeline(smIdentifiable):
 		:Parameters:
 		
 		:param forbidOverlap: Set of pairs of conditions' ids.
-		:type forbidOverlap: set of pairs. Each pair is a list of ids.
+		:type forbidOverlap: set of pairs. Each pair is a tuple (or list) of ids.
 			A list can also be provided, but duplicates will be ignored.
 		'''
-		if type(forbidOverlap) is list:
-			forbidOverlap = set(forbidOverlap)
-		if type(forbidOverlap) is not set:
-			msg = self.getClassName() + ':forbidOverlap: Unexpected attribute type.'
-			#warnings.warn(msg,SyntaxWarning)
-			raise ValueError(msg)
-		#Check that it is a set of pairs
-		condid = [cond.id for cond in self.conditions];
-		forbidOverlap = copy.deepcopy(forbidOverlap)
-		for elem in forbidOverlap:
-			if not (type(elem) is list and len(elem)==2 \
-				   and type(elem[0]) is int and type(elem[1]) is int):
-				msg = self.getClassName() + ':forbidOverlap: Unexpected attribute value. At least one element is not a pair of conditions ids.'
-				#warnings.warn(msg,SyntaxWarning)
-				raise ValueError(msg)
-			#Discard those pairs which do contain the ID of a non contained condition
-			if elem[0] not in condid or elem[1] not in condid:
-				msg = self.getClassName() + ':forbidOverlap: Inexistent id found. Ignoring entry ' + str(elem) + '.'
-				warnings.warn(msg,SyntaxWarning)
-				forbidOverlap.remove(elem)
-			#Sort the pair by id
-			elem.sort()
+		forbidOverlap = self._parseOverlapPairs(forbidOverlap, 'forbidOverlap')
 			
 		#At this point, forbidOverlap contains for sure only a set of pairs of
 		#existing IDs to be removed from the list of overlapping pairs.
+		oldOverlap = self.__overlapStatus
 		try:
 			self.__overlapStatus = self.__overlapStatus.difference(forbidOverlap)
 			self._checkOverlapConflicts()
-		except:
+		except ValueError:
+			#Undo the change
+			self.__overlapStatus = oldOverlap
 			raise
 
 		return None
 
 
+	def getBoxcar(self, theConditions = None, flagSparse = False, \
+				  flagWeightByInfo = False):
+		'''Renders the conditions as boxcar functions over the timestamps.
+		
+		The result is a (length x nConditions) matrix, e.g. the design
+		matrix of a GLM, whose j-th column is the boxcar of the j-th
+		condition; 1 at the samples covered by the events of the
+		condition and 0 elsewhere. An event covers the samples from
+		its onset up to (but excluding) its end, and at least the
+		onset sample. Events in 'Second' are mapped to samples as in
+		:meth:`getEventsInSamples`. Samples covered by several events of
+		the same condition add up.
+		
+		The boxcars are built at once from the onset and offset
+		impulses of all events (i.e. a cumulative sum), or from their
+		ranges of samples when a sparse matrix is requested, without
+		looping over the events.
+		
+		:Parameters:
+		
+		:param theConditions: Optional. List of
+			:class:`smTimelineConditions <sm.data.smTimelineCondition>`
+			or conditions' id. The columns follow this order. If None
+			(default), all conditions sorted by id.
+		:type theConditions: list
+		:param flagSparse: Optional. If True, a
+			:class:`scipy.sparse.csc_matrix` is returned. This requires
+			scipy. The default is False.
+		:type flagSparse: bool
+		:param flagWeightByInfo: Optional. If True, the boxcar of each
+			event takes the (numerical) value of its :attr:`info`
+			instead of 1. Events with no info have weight 1. The default
+			is False.
+		:type flagWeightByInfo: bool
+		
+		:return: A tuple (boxcar, conditionsIDs) with the matrix of
+			boxcars and the ids of the conditions in the columns.
+		:rtype: tuple (numpy.ndarray or scipy.sparse.csc_matrix, list of int)
+		'''
+		if theConditions is None:
+			theConditions = sorted(self.__conditions)
+		if isinstance(theConditions, (smTimelineCondition, int)):
+			theConditions = [theConditions]
+		if type(theConditions) is not list:
+			msg = self.getClassName() + ':getBoxcar: Unexpected parameter type for parameter theConditions.'
+			raise ValueError(msg)
+		condIDs = list()
+		for elem in theConditions:
+			if isinstance(elem, smTimelineCondition):
+				elem = elem.id
+			if type(elem) is not int or elem not in self.__conditions:
+				msg = self.getClassName() + ':getBoxcar: Unexpected parameter value for parameter theConditions. At least one element is not a condition of the timeline.'
+				raise ValueError(msg)
+			condIDs.append(elem)
+		nSamples = self.length
+		nConditions = len(condIDs)
+		
+		#Gather the (condition, event) pairs with the column of the
+		#condition and the onset and offset samples of the event
+		memberConditions, memberEvents = self.__membership.getPairs(condIDs)
+		order = np.argsort(condIDs)
+		cols = order[np.searchsorted(np.asarray(condIDs)[order], memberConditions)]
+		evIDs, onsets, ends = self.getEventsInSamples(np.unique(memberEvents))
+		order = np.argsort(evIDs)
+		idx = order[np.searchsorted(evIDs[order], memberEvents)]
+		onsets = np.clip(onsets[idx], 0, nSamples)
+		offsets = np.clip(np.maximum(ends[idx], onsets + 1), 0, nSamples)
+		if flagWeightByInfo:
+			store = self.__events
+			positions = store.getPositions(memberEvents)
+			#Positions are in increasing order; locate each member event
+			posIDs = store.ids[positions]
+			order = np.argsort(posIDs)
+			infos = store.infos[positions[order[np.searchsorted(posIDs[order], memberEvents)]]]
+			try:
+				weights = np.array([1.0 if info is None else float(info) \
+									for info in infos], dtype = np.float64)
+			except (TypeError, ValueError):
+				msg = self.getClassName() + ':getBoxcar: Unexpected event info. The info of the events must be numerical to weight the boxcars.'
+				raise ValueError(msg)
+		else:
+			weights = np.ones(len(memberEvents), dtype = np.float64)
+		
+		if flagSparse:
+			import scipy.sparse #Only needed for sparse outputs
+			#Concatenate the ranges [onset, offset) without looping
+			lengths = offsets - onsets
+			starts = np.cumsum(lengths) - lengths
+			rows = np.repeat(onsets - starts, lengths) + np.arange(lengths.sum())
+			boxcar = scipy.sparse.csc_matrix((np.repeat(weights, lengths), \
+							(rows, np.repeat(cols, lengths))), \
+							shape = (nSamples, nConditions))
+		else:
+			impulses = np.zeros((nSamples + 1, nConditions), dtype = np.float64)
+			np.add.at(impulses, (onsets, cols), weights)
+			np.add.at(impulses, (offsets, cols), -weights)
+			boxcar = np.cumsum(impulses[:-1], axis = 0)
+		return boxcar, condIDs
+
+
+	def getActiveConditionsAt(self, t, unit = None, flagOnlyIDs = False):
+		'''Retrieve the
+		:class:`smTimelineConditions <scimeth.data.smTimelineCondition>`
+		which have at least one associated event active at a given time.
+		
+		An event is active at time `t` if onset <= `t` <= end.
+		
+		:Parameters:
+		
+		:param t: The time in samples, or in [second * 10^:attr:`timeMultiplier`].
+		:type t: float
+		:param unit: Optional. Unit in which `t` is expressed; either
+			'Sample' or 'Second'. The default is the timeline :attr:`unit`.
+		:type unit: str
+		:param flagOnlyIDs: Optional. If True, only the conditions' ids are
+			retrieved. The default is False.
+		:type flagOnlyIDs: bool
+		
+		:returns: set of :class:`smTimelineConditions <scimeth.data.smTimelineCondition>`
+			or set of int if `flagOnlyIDs` is True.
+		:rtype: set
+		
+		.. seealso:: :meth:`getEventsInWindow`
+		'''
+		positions = self._getPositionsInWindow(t, t, unit, 'getActiveConditionsAt')
+		condIDs = set(self.__membership.getConditions( \
+								self.__events.ids[positions]).tolist())
+		if flagOnlyIDs:
+			return condIDs
+		return self.getConditions(condIDs)
+
+
 	def getConditions(self,idSet = None):
 		'''Retrieve the set of
 		:class:`smTimelineConditions <scimeth.data.smTimelineCondition>`
@@ -1621,7 +2464,7 @@ class smTimeline(smIdentifiable):
 		
 		:Parameters:
 		
-		:param idSet: Set of conditions' IDs. If empty, all conditions
+		:param idSet: Set of conditions' IDs. If None, all conditions
 			will be retrieved.
 		:param idSet: set.
 			A list may also be provided, but only one copy of the conditions
@@ -1631,18 +2474,19 @@ class smTimeline(smIdentifiable):
 		:rtype: set
 		'''
 		if idSet is None:
-			return self.events
-		if idSet is list:
+			return self.conditions
+		if type(idSet) is list:
 			idSet = set(idSet)
+		if type(idSet) is not set:
+			msg = self.getClassName() + ':getConditions: Unexpected parameter type for parameter idSet.'
+			raise ValueError(msg)
 		theConditions = set()
-		for id in idSet:
-			for cond in self.conditions:
-				if type(cond) is not int:
-					msg = self.getClassName() + ':getConditions: Unexpected id type. Ignoring element.'
-					warnings.warn(msg,SyntaxWarning)
-				elif cond.id == id:
-					theConditions.add(cond)
-					break
+		for oid in idSet:
+			if type(oid) is not int:
+				msg = self.getClassName() + ':getConditions: Unexpected id type. Ignoring element.'
+				warnings.warn(msg,SyntaxWarning)
+			elif oid in self.__conditions:
+				theConditions.add(self.__conditions[oid])
 		return copy.deepcopy(theConditions)
 
 
@@ -1652,29 +2496,37 @@ class smTimeline(smIdentifiable):
 		:return: The set of id from the conditions
 		:rtype: set
 		'''
-		return set([cond.id for cond in self.conditions])
+		return set(self.__conditions.keys())
 
-	def getConditionsEvents(self, theConditions = None):
+	def getConditionsEvents(self, theConditions = None, flagOnlyIDs = False):
 		'''Get the set of events associated to the conditions.
 		
 		Unrecognised conditions will be ignored.
 		
 		:Parameters:
 		
-		:param theConditions: Set of
+		:param theConditions: Optional. Set of
 			:class:`smTimelineConditions <sm.data.smTimelineCondition>`
-			or conditions' id
+			or conditions' id. If None (default), all conditions are
+			considered.
 		:type theConditions: set
 			A list may also be provided but duplicates will be ignored.
-			A single condition can be provided.
+			A single condition or condition id can be provided.
+		:param flagOnlyIDs: Optional. If True, only the events' ids are
+			retrieved and no event objects are built. The default is False.
+		:type flagOnlyIDs: bool
 			
 		:return: The set of 
 			:class:`smTimelineEvents <sm.data.smTimelineEvent>` of the 
 			:class:`smTimelineConditions <sm.data.smTimelineCondition>`
+			or set of int if `flagOnlyIDs` is True.
 		:rtype: set
 		'''
 		tmp = smTimelineCondition()
-		if str(theConditions.__class__) == str(tmp.__class__): #if only one condition is passed.
+		if theConditions is None:
+			theConditions = set(self.__conditions)
+		if str(theConditions.__class__) == str(tmp.__class__) \
+			or type(theConditions) is int: #if only one condition is passed.
 			theConditions = {theConditions}
 		if type(theConditions) is list:
 			theConditions = set(theConditions)
@@ -1694,15 +2546,14 @@ class smTimeline(smIdentifiable):
 				#warnings.warn(msg,SyntaxWarning)
 				raise ValueError(msg)
 		#Discard those which may not be declared
-		condid = set([cond.id for cond in self.__conditions])
-		theConditionsIDs = theConditionsIDs.intersection(condid)
+		theConditionsIDs = theConditionsIDs.intersection(self.__conditions)
 		if len(theConditionsIDs) != len(theConditions):
 			msg = self.getClassName() + ':getConditionsEvents: Duplicate conditions found. Ignoring duplicate conditions.'
 			warnings.warn(msg,SyntaxWarning)
-		#Collect the events id from the conditionEventsMap
-		theEventsIDs = set()
-		for condid in theConditionsIDs:
-			theEventsIDs = theEventsIDs.union(self.__conditionEventsMap[condid])
+		#Collect the events id from the membership
+		theEventsIDs = set(self.__membership.getEvents(theConditionsIDs).tolist())
+		if flagOnlyIDs:
+			return theEventsIDs
 		#Finally retrieve the events
 		return self.getEvents(theEventsIDs)
 
@@ -1723,6 +2574,8 @@ class smTimeline(smIdentifiable):
 		:returns: set of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
 		:rtype: set
 		'''
+		if idSet is None:
+			return self.events
 		if type(idSet) is list:
 			idSet = set(idSet)
 		if type(idSet) is not set:
@@ -1730,27 +2583,151 @@ class smTimeline(smIdentifiable):
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
 		flagNotID = False
-		theEvents = set()
+		theIDs = set()
 		for oid in idSet:
 			if type(oid) is not int:
 				flagNotID = True
 			else:
-				flagFound = False
-				for ev in self.__events:
-					if ev.id == oid:
-						theEvents.add(ev)
-						flagFound = True
-						break
-				if not flagFound:
-					msg = self.getClassName() + ':getEvents: Id ' + str(oid) + \
-							' not found. Ignoring unrecognized events ids.'
-					warnings.warn(msg,SyntaxWarning)
+				theIDs.add(oid)
+		positions = self.__events.getPositions(theIDs)
+		if len(positions) != len(theIDs):
+			foundIDs = set(self.__events.ids[positions].tolist())
+			for oid in theIDs.difference(foundIDs):
+				msg = self.getClassName() + ':getEvents: Id ' + str(oid) + \
+						' not found. Ignoring unrecognized events ids.'
+				warnings.warn(msg,SyntaxWarning)
 		if flagNotID:
 			msg = self.getClassName() + ':getEvents: Unexpected parameter value for parameter idSet. At least one element is not an ID. Ignoring non ID elements.'
 			warnings.warn(msg,SyntaxWarning)
-			
-		return copy.deepcopy(theEvents)
 		
+		#Events are materialised anew, so there is no need to deepcopy them.
+		return set(self.__events.materialise(positions))
+
+
+	def getEventsConditions(self, theEvents, flagOnlyIDs = False):
+		'''Get the set of conditions associated to the events.
+		
+		This is the reverse lookup of :meth:`getConditionsEvents`.
+		Unrecognised events will be ignored.
+		
+		:Parameters:
+		
+		:param theEvents: Set of
+			:class:`smTimelineEvents <sm.data.smTimelineEvent>`
+			or events' id
+		:type theEvents: set
+			A list may also be provided. A single event or event id
+			can be provided.
+		:param flagOnlyIDs: Optional. If True, only the conditions' ids
+			are retrieved. The default is False.
+		:type flagOnlyIDs: bool
+		
+		:return: The set of 
+			:class:`smTimelineConditions <sm.data.smTimelineCondition>`
+			associated to any of the events or set of int if `flagOnlyIDs`
+			is True.
+		:rtype: set
+		'''
+		if isinstance(theEvents, smTimelineEvent) or type(theEvents) is int:
+			theEvents = {theEvents}
+		if type(theEvents) not in (set, list):
+			msg = self.getClassName() + ':getEventsConditions: Unexpected parameter type for parameter theEvents.'
+			raise ValueError(msg)
+		theEventsIDs = list()
+		for elem in theEvents:
+			if isinstance(elem, smTimelineEvent):
+				theEventsIDs.append(elem.id)
+			elif type(elem) is int:
+				theEventsIDs.append(elem)
+			else:
+				msg = self.getClassName() + ':getEventsConditions: Unexpected parameter value for parameter theEvents. At least one element is not an event or event id.'
+				raise ValueError(msg)
+		condIDs = set(self.__membership.getConditions(theEventsIDs).tolist())
+		if flagOnlyIDs:
+			return condIDs
+		return self.getConditions(condIDs)
+		
+
+	def getEventsInSamples(self, idSet = None):
+		'''Get the onsets and ends of events as sample indexes.
+		
+		Events in 'Second' are mapped to the index of the closest
+		timestamp (see :meth:`toSamples`), and events in 'Sample' are
+		rounded to the closest integer sample. Events are not modified.
+		
+		:Parameters:
+		
+		:param idSet: Optional. Set of events' IDs. If None, all events
+			are considered. Unrecognised ids are ignored.
+		:type idSet: set of int
+			A list may also be provided.
+		
+		:return: A tuple (ids, onsets, ends) of arrays with the events'
+			ids, onsets and ends in samples, sorted by onset.
+		:rtype: tuple of numpy.ndarray of int
+		'''
+		store = self.__events
+		if idSet is None:
+			positions = np.arange(len(store))
+		else:
+			positions = store.getPositions(idSet)
+		ids = store.ids[positions]
+		onsets = store.onsets[positions].copy()
+		ends = store.ends[positions].copy()
+		units = store.units[positions]
+		multipliers = store.multipliers[positions]
+		tmp = units == store.SAMPLE
+		onsets[tmp] = np.rint(onsets[tmp] * 10.0**multipliers[tmp])
+		ends[tmp] = np.rint(ends[tmp] * 10.0**multipliers[tmp])
+		tmp = ~tmp
+		scale = 10.0**(multipliers[tmp] - self.__timeMultiplier)
+		onsets[tmp] = self._timesToSamples(onsets[tmp] * scale)
+		ends[tmp] = self._timesToSamples(ends[tmp] * scale)
+		order = np.argsort(onsets, kind = 'stable')
+		return ids[order], onsets[order].astype(np.int64), ends[order].astype(np.int64)
+
+
+	def getEventsInWindow(self, t0, t1, unit = None, flagOnlyIDs = False):
+		'''Retrieve the set of
+		:class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+		active within a time window.
+		
+		An event is active within the window if its interval [onset, end]
+		intersects [`t0`, `t1`]. Events expressed in a unit other than
+		`unit` are also considered by translating the window with
+		the :attr:`timestamps`.
+		
+		Queries are resolved with binary searches over an interval index
+		of the events which is only rebuilt after the events are modified,
+		so repeated queries do not iterate over all events.
+		
+		:Parameters:
+		
+		:param t0: Start of the window in samples, or in
+			[second * 10^:attr:`timeMultiplier`].
+		:type t0: float
+		:param t1: End of the window in samples, or in
+			[second * 10^:attr:`timeMultiplier`].
+		:type t1: float
+		:param unit: Optional. Unit in which `t0` and `t1` are expressed;
+			either 'Sample' or 'Second'. The default is the timeline
+			:attr:`unit`.
+		:type unit: str
+		:param flagOnlyIDs: Optional. If True, only the events' ids are
+			retrieved and no event objects are built. The default is False.
+		:type flagOnlyIDs: bool
+		
+		:returns: set of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+			or set of int if `flagOnlyIDs` is True.
+		:rtype: set
+		
+		.. seealso:: :meth:`getActiveConditionsAt`
+		'''
+		positions = self._getPositionsInWindow(t0, t1, unit, 'getEventsInWindow')
+		if flagOnlyIDs:
+			return set(self.__events.ids[positions].tolist())
+		return set(self.__events.materialise(positions))
+
 
 	def getEventsID(self):
 		'''Get the set of events' id.
@@ -1758,7 +2735,209 @@ class smTimeline(smIdentifiable):
 		:return: The set of id from the events
 		:rtype: set
 		'''
-		return set([ev.id for ev in self.events])
+		return set(self.__events.ids.tolist())
+
+
+	@staticmethod
+	def getHRFKernel(samplingRate, hrf = None, hrfParameters = None):
+		'''Gets a haemodynamic response function (HRF) sampled at a given
+		sampling rate.
+		
+		The canonical HRF is the difference of two gamma functions (as
+		in SPM), normalised to unit sum, with parameters (in seconds):
+		
+		 * 'peakDelay' (6) and 'peakDispersion' (1) of the response,
+		 * 'undershootDelay' (16) and 'undershootDispersion' (1) of the
+		   undershoot,
+		 * 'ratio' (6) of the response to the undershoot, and
+		 * 'kernelLength' (32); the duration of the kernel.
+		
+		Canonical kernels are cached per sampling rate and kernel
+		parameters, so they are computed only once; only the kernels
+		most recently used are kept. Kernels are read-only. Kernels
+		from a user-supplied function are not cached.
+		
+		:Parameters:
+		
+		:param samplingRate: The sampling rate in Hz.
+		:type samplingRate: float
+		:param hrf: Optional. A function of the time in seconds
+			returning the HRF; it must accept a numpy.ndarray. If None
+			(default), the canonical HRF is used.
+		:type hrf: callable
+		:param hrfParameters: Optional. Parameters of the canonical HRF
+			overriding the defaults. For a user-supplied function only
+			'kernelLength' is used.
+		:type hrfParameters: dict
+		
+		:return: The kernel.
+		:rtype: numpy.ndarray
+		'''
+		kernel, _ = smTimeline._getHRFKernel(samplingRate, hrf, hrfParameters)
+		return kernel
+
+
+	def getOverlapConflicts(self):
+		'''Finds all pairs of overlapping events across non-overlapping
+		:class:`smTimelineConditions <scimeth.data.smTimelineCondition>`.
+		
+		Two events are in conflict if they are associated to two different
+		conditions which are not allowed to overlap (see
+		:attr:`overlapStatus`), and the events overlap, i.e. their
+		closed intervals [onset, end] intersect. An event associated to
+		two non-overlapping conditions is in conflict with itself.
+		Events are only compared with events expressed in the same unit.
+		
+		The events are swept in order of onset so the cost is
+		O(E log E + K) where E is the number of events associations and
+		K the number of overlapping pairs, rather than the product of the
+		number of events of every pair of conditions. The overlapping
+		pairs are generated and filtered in chunks, so the memory
+		depends on the number of conflicts rather than on K.
+		
+		:return: The list of conflicts. Each conflict is a tuple
+			(condition1 id, condition2 id, event1 id, event2 id) where
+			event1 is associated to condition1, event2 is associated to
+			condition2, and condition1 id < condition2 id. The list is sorted.
+		:rtype: list of tuple
+		'''
+		store = self.__events
+		condIDs = sorted(self.__conditions.keys())
+		nConditions = len(condIDs)
+		if nConditions < 2 or len(store) == 0:
+			return list()
+		condIdx = dict([(condid, k) for k, condid in enumerate(condIDs)])
+		#Matrix of forbidden pairs of conditions (by index)
+		forbidden = ~np.eye(nConditions, dtype = bool)
+		for pair in self.__overlapStatus:
+			forbidden[condIdx[pair[0]], condIdx[pair[1]]] = False
+			forbidden[condIdx[pair[1]], condIdx[pair[0]]] = False
+		#Gather the associations between events and conditions involved
+		#in at least one forbidden pair.
+		involved = [condid for condid in condIDs if forbidden[condIdx[condid]].any()]
+		memberConditions, memberEvents = self.__membership.getPairs(involved)
+		if len(memberEvents) == 0:
+			return list()
+		memberConditions = np.searchsorted(condIDs, memberConditions)
+		#Locate the events in the store
+		positions = store.getPositions(memberEvents)
+		posIDs = store.ids[positions]
+		order = np.argsort(posIDs)
+		idx = np.searchsorted(posIDs[order], memberEvents)
+		idx[idx == len(posIDs)] = 0
+		found = posIDs[order][idx] == memberEvents
+		memberEvents = memberEvents[found]
+		memberConditions = memberConditions[found]
+		memberPositions = positions[order][idx[found]]
+		#Intervals with a neutral multiplier
+		scale = 10.0**store.multipliers[memberPositions]
+		starts = store.onsets[memberPositions] * scale
+		ends = store.ends[memberPositions] * scale
+		units = store.units[memberPositions]
+		#Sort by unit and onset
+		order = np.lexsort((starts, units))
+		starts, ends, units = starts[order], ends[order], units[order]
+		memberEvents = memberEvents[order]
+		memberConditions = memberConditions[order]
+		#Sweep. Every overlapping pair is found from the interval with
+		#the earliest onset; the intervals overlapping with the i-th
+		#interval and starting after it are those from i+1 to the last
+		#one starting no later than the i-th end.
+		chunkSize = smTimeline.__SWEEPCHUNKSIZE
+		first = list()
+		second = list()
+		for unitCode in np.unique(units):
+			lo, hi = np.searchsorted(units, [unitCode, unitCode+1])
+			idx = np.arange(lo, hi)
+			last = lo + np.searchsorted(starts[lo:hi], ends[lo:hi], side = 'right')
+			counts = last - idx - 1
+			cumCounts = np.cumsum(counts)
+			#Chunks of consecutive intervals with at most chunkSize
+			#overlapping pairs. An interval overlapping with more than
+			#chunkSize intervals is split on its own.
+			start = 0
+			while start < len(idx):
+				base = cumCounts[start-1] if start > 0 else 0
+				stop = max(int(np.searchsorted(cumCounts, base + chunkSize, side = 'right')), start+1)
+				chunkCounts = counts[start:stop]
+				if chunkCounts.sum() > chunkSize:
+					i0 = idx[start]
+					for offset in range(0, int(chunkCounts[0]), chunkSize):
+						j = np.arange(i0 + 1 + offset, min(i0 + 1 + offset + chunkSize, last[start]))
+						i = np.full(len(j), i0)
+						inConflict = forbidden[memberConditions[i], memberConditions[j]]
+						first.append(i[inConflict])
+						second.append(j[inConflict])
+				else:
+					i = np.repeat(idx[start:stop], chunkCounts)
+					j = i + 1 + np.arange(chunkCounts.sum()) \
+							- np.repeat(np.cumsum(chunkCounts) - chunkCounts, chunkCounts)
+					inConflict = forbidden[memberConditions[i], memberConditions[j]]
+					first.append(i[inConflict])
+					second.append(j[inConflict])
+				start = stop
+		if len(first) == 0:
+			return list()
+		first = np.concatenate(first)
+		second = np.concatenate(second)
+		conflicts = list()
+		for i, j in zip(first.tolist(), second.tolist()):
+			cond1 = condIDs[memberConditions[i]]
+			cond2 = condIDs[memberConditions[j]]
+			ev1 = int(memberEvents[i])
+			ev2 = int(memberEvents[j])
+			if cond1 > cond2:
+				cond1, cond2, ev1, ev2 = cond2, cond1, ev2, ev1
+			conflicts.append((cond1, cond2, ev1, ev2))
+		conflicts.sort()
+		return conflicts
+
+
+	def getRegressors(self, theConditions = None, hrf = None, \
+					  hrfParameters = None, flagWeightByInfo = False):
+		'''Gets the conditions' regressors, i.e. the boxcars of the
+		conditions convolved with a haemodynamic response function (HRF).
+		
+		The boxcars (see :meth:`getBoxcar`) are convolved at once with
+		the FFT. The HRF is sampled at the :attr:`samplingRate` of the
+		timeline, and kernels are cached (see :meth:`getHRFKernel`).
+		The timeline must be uniformly sampled.
+		
+		:Parameters:
+		
+		:param theConditions: Optional. List of
+			:class:`smTimelineConditions <sm.data.smTimelineCondition>`
+			or conditions' id. The columns follow this order. If None
+			(default), all conditions sorted by id.
+		:type theConditions: list
+		:param hrf: Optional. The HRF; either a function of the time in
+			seconds (see :meth:`getHRFKernel`), or an already sampled
+			kernel. If None (default), the canonical HRF is used.
+		:type hrf: callable or numpy.ndarray
+		:param hrfParameters: Optional. Parameters of the HRF (see
+			:meth:`getHRFKernel`).
+		:type hrfParameters: dict
+		:param flagWeightByInfo: Optional. Weight the boxcars by the
+			events' info (see :meth:`getBoxcar`). The default is False.
+		:type flagWeightByInfo: bool
+		
+		:return: A tuple (regressors, conditionsIDs) with the
+			(length x nConditions) matrix of regressors and the ids of
+			the conditions in the columns.
+		:rtype: tuple (numpy.ndarray, list of int)
+		'''
+		if isinstance(hrf, np.ndarray):
+			kernel = np.asarray(hrf, dtype = np.float64).ravel()
+			key = None
+		else:
+			if self.__samplingRate <= 0:
+				msg = self.getClassName() + ':getRegressors: The timeline is not uniformly sampled. Provide a sampled kernel as hrf.'
+				raise ValueError(msg)
+			kernel, key = smTimeline._getHRFKernel(self.__samplingRate, \
+									hrf, hrfParameters)
+		boxcar, condIDs = self.getBoxcar(theConditions, \
+									flagWeightByInfo = flagWeightByInfo)
+		return smTimeline._fftConvolve(boxcar, kernel, key), condIDs
 
 
 	def isEqual(self,obj2):
@@ -1791,18 +2970,124 @@ class smTimeline(smIdentifiable):
 		
 
 		res = res & (self.id == obj2.id)
-		res = res & (self.startTime == obj2.startTime).all
+		res = res & (self.startTime == obj2.startTime)
 		res = res & (self.samplingRate == obj2.samplingRate)
+		res = res & (self.timeMultiplier == obj2.timeMultiplier)
 		res = res & (self.unit.isEqual(obj2.unit))
 		
-		res = res & (self.timestamps == obj2.timestamps).all
+		res = res & bool(np.array_equal(self.timestamps, obj2.timestamps))
+
+		otherConditions = obj2._smTimeline__conditions
+		res = res & (self.__conditions.keys() == otherConditions.keys())
+		if not res:
+			return res
+		res = res & all(cond.isEqual(otherConditions[condid]) \
+						for condid, cond in self.__conditions.items())
+		res = res & (self.__events.isEqual(obj2._smTimeline__events))
+		res = res & (self.__overlapStatus == obj2._smTimeline__overlapStatus)
+		res = res & (self.__membership.isEqual(obj2._smTimeline__membership))
+		
+		return res
 
 
-		res = res & (self.conditions == obj2.conditions)
-		res = res & (self.events == obj2.events)
-		res = res & (self.overlappingStatus == obj2.overlappingStatus).all
-		res = res & (self.conditionEventsMap == obj2.conditionEventsMap )
+	@staticmethod
+	def load(filename, flagMemoryMap = False, allowPickle = False):
+		'''Loads a timeline from a file written by :meth:`save`.
+		
+		Arrays are read with bulk I/O. Optionally, the timestamps and
+		the events' columns can be memory-mapped rather than read. They
+		are mapped in copy-on-write mode, so that subsequent changes to
+		the timeline are never written back to the file.
 		
+		Files whose events' information was pickled (see :meth:`save`)
+		are rejected unless allowPickle is True. Unpickling data can
+		execute arbitrary code; only allow it for trusted files.
+		
+		:Parameters:
+		
+		:param filename: The file name.
+		:type filename: str
+		:param flagMemoryMap: Optional. If True, the timestamps and the
+			events' columns are memory-mapped. The default is False.
+		:type flagMemoryMap: bool
+		:param allowPickle: Optional. If True, pickled events'
+			information is loaded. The default is False.
+		:type allowPickle: bool
+		
+		:return: The loaded timeline.
+		:rtype: :class:`smTimeline <scimeth.data.smTimeline>`
+		'''
+		fileMagic = smTimeline.__FILEMAGIC
+		with open(filename, 'rb') as f:
+			prefix = f.read(len(fileMagic) + 8)
+			if len(prefix) != len(fileMagic) + 8 \
+					or prefix[:len(fileMagic)] != fileMagic:
+				msg = 'smTimeline:load: Unexpected file format.'
+				raise ValueError(msg)
+			fileVersion, headerLength = struct.unpack('<II', prefix[len(fileMagic):])
+			if fileVersion > smTimeline.__FILEVERSION:
+				msg = 'smTimeline:load: Unsupported file format version ' \
+						+ str(fileVersion) + '.'
+				raise ValueError(msg)
+			header = json.loads(f.read(headerLength).decode('utf-8'))
+			alignment = smTimeline.__FILEALIGNMENT
+			dataStart = len(fileMagic) + 8 + headerLength
+			dataStart = -(-dataStart // alignment) * alignment
+			arrays = dict()
+			for name, item in header['arrays'].items():
+				dtype = np.dtype(item['dtype'])
+				shape = tuple(item['shape'])
+				count = int(np.prod(shape))
+				if flagMemoryMap and count > 0 and name in header['mappable']:
+					arrays[name] = np.memmap(filename, dtype = dtype, mode = 'c', \
+											 offset = dataStart + item['offset'], \
+											 shape = shape)
+				else:
+					f.seek(dataStart + item['offset'])
+					arrays[name] = np.fromfile(f, dtype = dtype, \
+											   count = count).reshape(shape)
+
+		res = smTimeline(unit = header['unit'], \
+						 startTime = datetime.datetime.fromisoformat(header['startTime']))
+		res.id = header['id']
+		res.__samplingRate = header['samplingRate']
+		res.__timeMultiplier = header['timeMultiplier']
+		if header['unit'] == 'Second':
+			res.__unit = smMeasurementUnit.getInterned(name = 'Second', acronym = 's',\
+								 multiplier = header['timeMultiplier'], \
+								 isInternationalSystem = True)
+		res.__init = header['init']
+		res.__length = header['length']
+		res.__timestamps = arrays.get('timestamps', None)
+		#Conditions
+		for condid, (tag, description) in zip(arrays['conditionIDs'].tolist(), \
+											  header['conditions']):
+			cond = smTimelineCondition(tag = tag, description = description)
+			cond.id = condid
+			res.__conditions[condid] = cond
+		#Events
+		infos = None
+		if 'infos' in arrays:
+			if not allowPickle:
+				msg = 'smTimeline:load: The events\' information is pickled. ' \
+						+ 'Set allowPickle to True to load it from trusted files only.'
+				raise ValueError(msg)
+			infos = pickle.loads(arrays['infos'].tobytes())
+		elif 'infos' in header:
+			infos = header['infos']
+		if infos is not None:
+			if type(infos) is not list or len(infos) != len(arrays['eventIDs']):
+				msg = 'smTimeline:load: Unexpected events\' information.'
+				raise ValueError(msg)
+			tmp = np.empty(len(infos), dtype = object)
+			tmp[:] = infos
+			infos = tmp
+		res.__events.attachColumns(arrays['eventIDs'], arrays['eventOnsets'], \
+					arrays['eventDurations'], arrays['eventEnds'], \
+					arrays['eventUnits'], arrays['eventMultipliers'], infos)
+		#Membership and overlap pairs
+		res.__membership.setPairs(arrays['membership'][:, 0], arrays['membership'][:, 1])
+		res.__overlapStatus = set(tuple(pair) for pair in arrays['overlap'].tolist())
 		return res
 
 
@@ -1823,11 +3108,11 @@ class smTimeline(smIdentifiable):
 		if type(theConditions) is list:
 			theConditions = set(theConditions)
 		if type(theConditions) is not set:
-			msg = self.getClassName() + ':removeEvents: Unexpected parameter type.'
+			msg = self.getClassName() + ':removeConditions: Unexpected parameter type.'
 			raise ValueError(msg)
 		
 		#Collect the ids
-		tmp = smTimelineEvent()
+		tmp = smTimelineCondition()
 		tmpIDs = set()
 		for cond in theConditions:
 			if type(cond) is int:
@@ -1839,15 +3124,14 @@ class smTimeline(smIdentifiable):
 				warnings.warn(msg,SyntaxWarning)
 		
 		#Remove conditions
-			#A simple substraction of sets won't work, as it will
-			#only remove objects that are equal the SAME, and not
-			#different objects with the same id.
-		#self.conditions = self.conditions - theConditions
-		for cond in self.conditions:
-			if cond.id in tmpIDs:
-				self.conditions.remove(cond)
-				#and clear its entry in the conditionsEventsMap
-				del self.conditionEventsMap[cond.id]
+		for condid in tmpIDs:
+			if self.__conditions.pop(condid, None) is not None:
+				#and clear its associations to events
+				self.__membership.removeConditions([condid])
+		#and any overlapping pair in which they participate
+		self.__overlapStatus = set([pair for pair in self.__overlapStatus \
+									if pair[0] not in tmpIDs \
+									and pair[1] not in tmpIDs])
 		return None
 
 
@@ -1882,19 +3166,113 @@ class smTimeline(smIdentifiable):
 				warnings.warn(msg,SyntaxWarning)
 
 		#Remove events
-			#A simple substraction of sets won't work, as it will
-			#only remove objects that are equal the SAME, and not
-			#different objects with the same id.
-		#self.events = self.events - theEvents
-		for ev in self.events:
-			if ev.id in tmpIDs:
-				self.events.remove(ev)
+		self.__events.remove(self.__events.getPositions(tmpIDs))
 		#and clear associations with conditions.
-		for k in self.conditionEventsMap.iterkeys():
-			self.conditionEventsMap[k] = self.conditionEventsMap[k].difference(tmpIDs)
+		self.__membership.removeEvents(tmpIDs)
 		return None
 	
 
+	def save(self, filename, allowPickle = False):
+		'''Saves the timeline to a file.
+		
+		The file format is compact and versioned. It consists of a
+		magic number, the format version and a JSON header with the
+		scalar attributes, the conditions' tags and descriptions and a
+		table of contents of the arrays, followed by the contiguous
+		arrays; the (explicit) timestamps, the events' columns, the
+		conditions' ids, the condition-event membership as (condition id,
+		event id) pairs and the overlap pairs. Arrays are aligned in the
+		file so that they can be memory-mapped on :meth:`load`.
+		
+		The events' information is only saved if at least one event has
+		information. It is saved as JSON in the header, and thus it must
+		be made of JSON types (e.g. str, numbers, lists and dicts with
+		str keys) that survive the round trip unchanged. Otherwise, it is
+		only saved (pickled) if allowPickle is True, and the file can only
+		be loaded with allowPickle set to True as well.
+		
+		:Parameters:
+		
+		:param filename: The file name.
+		:type filename: str
+		:param allowPickle: Optional. If True, events' information which
+			cannot be saved as JSON is pickled. Otherwise (default), an
+			error is raised.
+		:type allowPickle: bool
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		store = self.__events
+		arrays = dict()
+		if self.__timestamps is not None:
+			arrays['timestamps'] = np.asarray(self.__timestamps, dtype = np.float64)
+		arrays['eventIDs']         = store.ids
+		arrays['eventOnsets']      = store.onsets
+		arrays['eventDurations']   = store.durations
+		arrays['eventEnds']        = store.ends
+		arrays['eventUnits']       = store.units
+		arrays['eventMultipliers'] = store.multipliers
+		infos = None
+		if any(info is not None for info in store.infos):
+			infos = store.infos.tolist()
+			try:
+				flagJSON = json.loads(json.dumps(infos)) == infos
+			except (TypeError, ValueError):
+				flagJSON = False
+			if not flagJSON:
+				if not allowPickle:
+					msg = self.getClassName() + ':save: The events\' information ' \
+							+ 'cannot be saved as JSON. Set allowPickle to True to pickle it.'
+					raise ValueError(msg)
+				arrays['infos'] = np.frombuffer(pickle.dumps(infos), dtype = np.uint8)
+				infos = None
+		condIDs = sorted(self.__conditions)
+		arrays['conditionIDs'] = np.array(condIDs, dtype = np.int64)
+		arrays['membership'] = np.column_stack((self.__membership.conditionIDs, \
+										self.__membership.eventIDs))
+		arrays['overlap'] = np.array(sorted(self.__overlapStatus), \
+									 dtype = np.int64).reshape(-1, 2)
+
+		header = {'id': self.id,
+				  'startTime': self.startTime.isoformat(),
+				  'unit': self.__unit.name,
+				  'samplingRate': self.__samplingRate,
+				  'timeMultiplier': self.__timeMultiplier,
+				  'init': self.__init,
+				  'length': self.__length,
+				  'conditions': [(self.__conditions[condid].tag, \
+								  self.__conditions[condid].description) \
+								 for condid in condIDs],
+				  'mappable': ['timestamps', 'eventIDs', 'eventOnsets', \
+							   'eventDurations', 'eventEnds', 'eventUnits', \
+							   'eventMultipliers'],
+				  'arrays': dict()}
+		if infos is not None:
+			header['infos'] = infos
+		#Offsets are relative to the (aligned) end of the header
+		alignment = self.__FILEALIGNMENT
+		offset = 0
+		for name, arr in arrays.items():
+			offset = -(-offset // alignment) * alignment
+			header['arrays'][name] = {'dtype': arr.dtype.str, \
+									  'shape': list(arr.shape), \
+									  'offset': offset}
+			offset += arr.nbytes
+		headerBytes = json.dumps(header).encode('utf-8')
+		dataStart = len(self.__FILEMAGIC) + 8 + len(headerBytes)
+		dataStart = -(-dataStart // alignment) * alignment
+
+		with open(filename, 'wb') as f:
+			f.write(self.__FILEMAGIC)
+			f.write(struct.pack('<II', self.__FILEVERSION, len(headerBytes)))
+			f.write(headerBytes)
+			for name, arr in arrays.items():
+				f.write(b'\x00' * (dataStart + header['arrays'][name]['offset'] - f.tell()))
+				np.ascontiguousarray(arr).tofile(f)
+		return None
+
+
 	def setConditions(self,conditionsIDSet,newConditions):
 		'''
 		Updates a (sub-)set of existing conditions.
@@ -1968,38 +3346,30 @@ class smTimeline(smIdentifiable):
 				raise ValueError(msg)
 		
 		newConditions = copy.deepcopy(newConditions)
-		tmpCondIds = self.getConditionsID()
 		for idx, elem in enumerate(conditionsIDSet):
-			if elem in tmpCondIds: #Check that the condition exist
-				for cond in self.__conditions:
-					if elem == cond.id: #condition found
-						#Check that the new id
-						#does not conflict other existing IDs in the timeline.
-						reducedCondIds = copy.deepcopy(tmpCondIds)
-						reducedCondIds.remove(cond.id)
-						if newConditions[idx].id in reducedCondIds:
-							msg = self.getClassName() + ':setConditions: New ' \
-								+ 'id ' + str(newConditions[idx].id) \
-								+ ' already exist in smTimeline.'
-							warnings.warn(msg,RuntimeWarning)
-						else:
-							#Substitute the condition
-							self.__conditions.remove(cond)
-							self.__conditions.add(newConditions[idx])
-							if cond.id != newConditions[idx].id:
-								#Change the entry in the conditionsEventsMap
-								#Note that dictionary keys cannot be changed. One can
-								#only copy to a new copy a remove the old one.
-								self.__conditionEventsMap[newConditions[idx].id] = \
-									 self.__conditionEventsMap[cond.id]
-								del self.__conditionEventsMap[cond.id]
-								#and update the overlapStatus
-								for pair in self.__overlapStatus:
-									if pair[0] == cond.id:
-										pair[0] == newConditions[idx].id
-									if pair[1] == cond.id:
-										pair[1] == newConditions[idx].id
-						break
+			if elem in self.__conditions: #Check that the condition exist
+				newId = newConditions[idx].id
+				#Check that the new id
+				#does not conflict other existing IDs in the timeline.
+				if newId != elem and newId in self.__conditions:
+					msg = self.getClassName() + ':setConditions: New ' \
+						+ 'id ' + str(newId) \
+						+ ' already exist in smTimeline.'
+					warnings.warn(msg,RuntimeWarning)
+					continue
+				#Substitute the condition
+				del self.__conditions[elem]
+				self.__conditions[newId] = newConditions[idx]
+				if elem != newId:
+					#Change the id in the associations to events
+					self.__membership.renameCondition(elem, newId)
+					#and update the overlapStatus
+					tmpOverlap = set()
+					for pair in self.__overlapStatus:
+						tmpPair = [newId if x == elem else x for x in pair]
+						tmpPair.sort()
+						tmpOverlap.add(tuple(tmpPair))
+					self.__overlapStatus = tmpOverlap
 			else:
 				msg = self.getClassName() + ':setConditions: Id ' \
 							+ str(elem) + ' not found in smTimeline.'
@@ -2018,7 +3388,7 @@ class smTimeline(smIdentifiable):
 		**IMPORTANT**: This method does **NOT** alter the conditions.
 		
 		If any updated event violates the overlapping status, an
-		error is raised.
+		error is raised and the timeline is left unchanged.
 		
 		
 		:Parameters:
@@ -2072,25 +3442,41 @@ class smTimeline(smIdentifiable):
 					+ 'is not a ''smTimelineEvent''.'
 				raise ValueError(msg)
 		
-		newEvents = copy.deepcopy(newEvents)
-		tmpEvIds = self.getEventsID()
+		store = self.__events
+		updatedIDs = set()
+		replaced = list() #(position, old id, new id, old columns) to undo
 		try:
 			for idx, elem in enumerate(eventsIDSet):
-				if elem in tmpEvIds:
-					for ev in self.__events:
-						if elem == ev.id:
-							#Substitute the condition
-							self.__events.remove(ev)
-							self.__events.add(newEvents[idx])
-							if ev.id != newEvents[idx].id:
-								#Update the entries in the conditionsEventsMap
-								for key, values in self.__conditionEventsMap.items():
-									#Substitute the id in the values and update the dictionary
-									values.remove(ev.id)
-									values.add(newEvents[idx].id)
-									self.__conditionEventsMap[key] = values
-			self._checkOverlapConflicts()
+				if store.hasID(elem):
+					newId = newEvents[idx].id
+					if newId != elem and store.hasID(newId):
+						msg = self.getClassName() + ':setEvents: New ' \
+							+ 'id ' + str(newId) \
+							+ ' already exist in smTimeline.'
+						warnings.warn(msg,RuntimeWarning)
+						continue
+					#Substitute the event
+					positions = store.getPositions([elem])
+					pos = int(positions[0])
+					replaced.append((pos, elem, newId, \
+							(store.onsets[pos], store.durations[pos], \
+							 store.units[pos], store.multipliers[pos], \
+							 store.infos[pos])))
+					store.setEvents(positions, [newEvents[idx]])
+					if elem != newId:
+						#Update the id in the associations to conditions
+						self.__membership.renameEvent(elem, newId)
+					updatedIDs.add(newId)
+			self._checkOverlapConflicts(updatedIDs)
 		except:
+			#Undo the substitutions in reverse order
+			for pos, elem, newId, (onset, duration, unit, multiplier, info) \
+					in reversed(replaced):
+				if elem != newId:
+					self.__membership.renameEvent(newId, elem)
+				store.setColumns([pos], ids = [elem], onsets = [onset], \
+								 durations = [duration], units = [unit], \
+								 multipliers = [multiplier], infos = [info])
 			raise
 		return None
 
@@ -2120,10 +3506,9 @@ class smTimeline(smIdentifiable):
 		The sorted list of :class:`smTimelineEvents <scimeth.data.smTimelineEvents>`.
 
 		'''
-		#Sort in inverse order, first by id, then by end and finally
-		#by onset
-		return quick_sort(theEvents, 0, len(theEvents) - 1, lambda x, y: x.id < y.id)
+		return multikey_sort(theEvents, ['id'])
 
+	@staticmethod
 	def sortTimelineEventsByOnset(theEvents):
 		'''
 		Sort a list of :class:`smTimelineEvents <scimeth.data.smTimelineEvents>`
@@ -2149,39 +3534,47 @@ class smTimeline(smIdentifiable):
 		The sorted list of :class:`smTimelineEvents <scimeth.data.smTimelineEvents>`.
 
 		'''
-		#Sort in inverse order, first by id, then by end and finally
-		#by onset
-		theEvents = quick_sort(theEvents, 0, len(theEvents) - 1, lambda x, y: x.id < y.id)
-		theEvents = quick_sort(theEvents, 0, len(theEvents) - 1, lambda x, y: x.end < y.end)
-		return quick_sort(theEvents, 0, len(theEvents) - 1, lambda x, y: x.onset < y.onset)
+		#Stable lexicographic sort; by onset, then by end and finally by id
+		return multikey_sort(theEvents, ['onset', 'end', 'id'])
 
 
 	def toSeconds(self):
 		'''
 		The events units are updated to [second * 10^:attr:`timeMultiplier`].
 		
-		* If :attr:`unit` is in 'Sample', then:
+		* Events in 'Sample' are converted using the :attr:`timestamps`:
 		
 		  * Events :attr:`onset` take the value of the onset-th :attr:`timestamps`.
 		  * Events :attr:`end` take the value of the (onset+end)-th
 		    :attr:`timestamps` minus the new onset.
 		
-		* If :attr:`unit` is in 'Second', then the events unit multiplier
-		  is updated to :attr:`timeMultiplier` (the same scale as the timestamps),
-		  and the events :attr:`onset` and :attr:`duration` are scaled
+		* Events in 'Second' have their unit multiplier updated to
+		  :attr:`timeMultiplier` (the same scale as the timestamps),
+		  and their :attr:`onset` and :attr:`duration` are scaled
 		  accordingly.
 		
-		'''
-		if self.unit.name == 'Sample':
-			for ev in self.events:
-				ev.toSeconds(samplingRate = self.samplingRate, \
-							newMultiplier = self.unit.multiplier)
-		else: #Seconds
-			for ev in self.events:
-				ev.unit.multiplier = self.timeMultiplier - ev.unit.multiplier
-		
-		self.__unit = smMeasurementUnit(name='Second',acronym='s', \
-								 multiplier = self.timeMultiplier, \
+		All events are converted at once over the event store columns.
+		
+		'''
+		store = self.__events
+		if len(store) > 0:
+			positions = np.flatnonzero(store.units == store.SAMPLE)
+			scale = 10.0**store.multipliers[positions]
+			newOnsets = self._samplesToTimes(store.onsets[positions] * scale)
+			newEnds = self._samplesToTimes(store.ends[positions] * scale)
+			store.setColumns(positions, onsets = newOnsets, \
+							 durations = newEnds - newOnsets, \
+							 units = store.SECOND, \
+							 multipliers = self.__timeMultiplier)
+			positions = np.flatnonzero(store.units == store.SECOND)
+			scale = 10.0**(store.multipliers[positions] - self.__timeMultiplier)
+			store.setColumns(positions, \
+							 onsets = store.onsets[positions] * scale, \
+							 durations = store.durations[positions] * scale, \
+							 multipliers = self.__timeMultiplier)
+		
+		self.__unit = smMeasurementUnit.getInterned(name='Second',acronym='s', \
+								 multiplier = self.__timeMultiplier, \
 								 isInternationalSystem = True)
 
 		
@@ -2192,21 +3585,88 @@ class smTimeline(smIdentifiable):
 		'''
 		The events units are updated to [samples].
 		
-		* If :attr:`unit` is already in 'Sample', then nothing is change.
-		* If :attr:`unit` is in 'Second':
+		* Events in 'Sample' are kept; only their unit multiplier is set to 0.
+		* Events in 'Second':
 		
 		  * Events :attr:`onset` take the value of the index to the 
 		    :attr:`timestamps` closest to the current onset.
 		  * Events :attr:`end` take the value of the difference
 		    of indexes in the :attr:`timestamps` between the event end
 		    and onset.
-
-		'''
-		if self.unit.name == 'Second':
-			for ev in self.events:
-				ev.toSamples(samplingRate = self.samplingRate)
-		self.__unit = smMeasurementUnit(name='Sample',acronym='sample', \
+		
+		All events are converted at once over the event store columns.
+
+		'''
+		store = self.__events
+		if len(store) > 0:
+			positions = np.flatnonzero(store.units == store.SECOND)
+			scale = 10.0**(store.multipliers[positions] - self.__timeMultiplier)
+			newOnsets = self._timesToSamples(store.onsets[positions] * scale)
+			newEnds = self._timesToSamples(store.ends[positions] * scale)
+			store.setColumns(positions, onsets = newOnsets, \
+							 durations = newEnds - newOnsets, \
+							 units = store.SAMPLE, multipliers = 0)
+			positions = np.flatnonzero(store.multipliers != 0)
+			scale = 10.0**store.multipliers[positions]
+			store.setColumns(positions, \
+							 onsets = store.onsets[positions] * scale, \
+							 durations = store.durations[positions] * scale, \
+							 multipliers = 0)
+		self.__unit = smMeasurementUnit.getInterned(name='Sample',acronym='sample', \
 								 multiplier = 0, \
 								 isInternationalSystem = False)
 		return
 
+
+	def wouldConflict(self, newEvents, conditionsIDSet = None):
+		'''
+		Checks whether adding or updating some events would conflict
+		with the overlapping status of the conditions (dry-run).
+		
+		The timeline is not modified. Each given event is considered to
+		replace the event with the same id in the timeline, if any, and
+		it is compared only with the events overlapping with it (see
+		:meth:`_getLocalOverlapConflicts`).
+		
+		:Parameters:
+		
+		:param newEvents: The new or updated events.
+		:type newEvents: list of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+			A single event can also be provided.
+		:param conditionsIDSet: Optional. The conditions' ids to which the
+			events would be associated. If None (default), each event keeps
+			its current associations, i.e. a new event is associated to no
+			condition. Ids of conditions not in the timeline are ignored.
+		:type conditionsIDSet: set of int
+		
+		:return: The list of conflicts that the edit would produce, as in
+			:meth:`getOverlapConflicts`. The list is empty if the edit does
+			not introduce any conflict.
+		:rtype: list of tuple
+		'''
+		if isinstance(newEvents, smTimelineEvent):
+			newEvents = [newEvents]
+		if type(newEvents) not in (list, set):
+			msg = self.getClassName() + ':wouldConflict: Unexpected parameter type for newEvents.'
+			raise ValueError(msg)
+		for ev in newEvents:
+			if not isinstance(ev, smTimelineEvent):
+				msg = self.getClassName() + ':wouldConflict: Unexpected parameter value. At least one element of ''newEvents'' is not a ''smTimelineEvent''.'
+				raise ValueError(msg)
+		#Gather the values of the events as the event store would hold them
+		candidates = smTimelineEventStore()
+		candidates.addEvents(newEvents)
+		ids = candidates.ids
+		if conditionsIDSet is None:
+			evIDs, condIDs = self.__membership.getEventPairs(ids)
+			tmp = dict([(evid, list()) for evid in ids.tolist()])
+			for evid, condid in zip(evIDs.tolist(), condIDs.tolist()):
+				tmp[evid].append(condid)
+			conditions = [tmp[evid] for evid in ids.tolist()]
+		else:
+			tmp = sorted(set(conditionsIDSet).intersection(self.__conditions))
+			conditions = [tmp] * len(ids)
+		scale = 10.0**candidates.multipliers
+		return self._getLocalOverlapConflicts(ids, candidates.units, \
+							candidates.onsets * scale, candidates.ends * scale, \
+							conditions)
@@ -202,12 +202,8 @@ class smTimelineCondition(smIdentifiable):
 			raise ValueError(msg)
 			
 		s = '<' + self.getClassName() + ': {\n'
-		#Grab Class attributes (note that this will only pick class attributes
-		#but not instance attributes)
-		#The filter ignores python __ attributes e.g. __repr__
-		iters = dict((name,value) for name,value in self.__dict__.items() if name[:2] != '__')
-		#Update with the instance items
-		iters.update(self.__dict__)
+		#Grab the instance attributes (whether in __slots__ or __dict__)
+		iters = self._getAttributes()
 		#Finally build the string
 		for name,value in iters.items():
 			#Deal with python namemangling
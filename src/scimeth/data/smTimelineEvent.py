@@ -50,6 +50,25 @@ This module implements the class :class:` ***smTimelineEvent***
 | 14-Mar-2020 | FOE    | - :meth:`__str__` now now admits parameter           |
 |             |        |   `indentationLevel`.                                |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Attributes are now declared in `__slots__`.        |
+|             |        | - Events now share (flyweight) their                 |
+|             |        |   :class:`smMeasurementUnit` with all other events   |
+|             |        |   in the same unit and multiplier.                   |
+|             |        | - Added protected class methods :meth:`_fromValues`  |
+|             |        |   and :meth:`_getSharedUnit`.                        |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Events now use interned units (see                 |
+|             |        |   :meth:`smMeasurementUnit.getInterned`) and the     |
+|             |        |   :attr:`unit` getter no longer copies the unit.     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Events built by :meth:`_fromValues` are also       |
+|             |        |   registered if the registry of instances is enabled |
+|             |        |   (see :meth:`smIdentifiable.enableRegistry`).       |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Events built with :meth:`_fromValues` (e.g.        |
+|             |        |   materialised by the timeline) are no longer        |
+|             |        |   registered.                                        |
++-------------+--------+------------------------------------------------------+
 
 
 .. seealso::
@@ -109,6 +128,11 @@ class smTimelineEvent(smIdentifiable):
 	:class:`smTimelineEvent <scimeth.data.smTimelineEvent>` are
 	:class:`smIdentifiable <scimeth.data.smIdentifiable>`.
 	
+	Events are lightweight; their attributes are declared in
+	`__slots__` and all events in the same unit and multiplier share
+	a single immutable (interned)
+	:class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`.
+	
 
 	:Class invariants:
 	
@@ -118,7 +142,8 @@ class smTimelineEvent(smIdentifiable):
 	'''
 
 	#Private class attributes shared by all instances
-	
+	__slots__ = ('__version', '__unit', '__onset', '__duration', \
+				 '__info', '__description')
 
 	#Class constructor
 	def __init__(self, unit = 'Sample', onset = None, duration = None, end = None,
@@ -199,9 +224,7 @@ class smTimelineEvent(smIdentifiable):
 		self.__version = '0.1'
 		
 		#Initialize private attributes unique to this instance
-		self.__unit = smMeasurementUnit(name='Sample',acronym='samples', \
-												  multiplier=0, \
-												  isInternationalSystem=False) #A smMeasurementUnit. Either samples or seconds.
+		self.__unit = self._getSharedUnit('Sample', 0) #A smMeasurementUnit. Either samples or seconds.
 		if type(unit) is not str:
 			msg = self.getClassName() + ':unit: Unexpected attribute type.'
 			#warnings.warn(msg,SyntaxWarning)
@@ -209,9 +232,7 @@ class smTimelineEvent(smIdentifiable):
 		if unit == 'Sample':
 			pass
 		elif unit == 'Second':
-			self.__unit = smMeasurementUnit(name='Second',acronym='s', \
-												  multiplier=unitMultiplier, \
-												  isInternationalSystem=True)
+			self.__unit = self._getSharedUnit('Second', unitMultiplier)
 		else:
 			msg = self.getClassName() + ':unit: Unexpected attribute value.'
 			#warnings.warn(msg,SyntaxWarning)
@@ -276,7 +297,7 @@ class smTimelineEvent(smIdentifiable):
 			msg = self.getClassName() + ':duration: Unexpected attribute value.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		if self.unit.name == 'Second':
+		if self.__unit.name == 'Second':
 			self.__duration = newDuration
 		else: #Sample
 			self.__duration = float(round(newDuration))
@@ -305,7 +326,7 @@ class smTimelineEvent(smIdentifiable):
 			msg = self.getClassName() + ':end: Unexpected attribute value.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		if self.unit.name == 'Second':
+		if self.__unit.name == 'Second':
 			self.__duration = newEnd - self.onset
 		else: #Sample
 			self.__duration = round(newEnd) - self.onset
@@ -338,7 +359,7 @@ class smTimelineEvent(smIdentifiable):
 			msg = self.getClassName() + ':onset: Unexpected attribute value.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		if self.unit.name == 'Second':
+		if self.__unit.name == 'Second':
 			self.__onset = newOnset
 		else: #Sample
 			self.__onset = round(newOnset)
@@ -355,10 +376,14 @@ class smTimelineEvent(smIdentifiable):
 		the user can used :meth:`toSeconds` and :meth:`toSamples`
 		to change the attr:`unit`.
 		
+		The unit is an interned (shared and immutable)
+		:class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`, so
+		no copy is made.
+		
 		:getter: Gets the time measurement unit.
 		:type: :class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`
 		'''
-		return copy.deepcopy(self.__unit)
+		return self.__unit
 
 	@property
 	def info(self): #info getter
@@ -415,12 +440,8 @@ class smTimelineEvent(smIdentifiable):
 			raise ValueError(msg)
 			
 		s = '<' + self.getClassName() + ': {\n'
-		#Grab Class attributes (note that this will only pick class attributes
-		#but not instance attributes)
-		#The filter ignores python __ attributes e.g. __repr__
-		iters = dict((name,value) for name,value in self.__dict__.items() if name[:2] != '__')
-		#Update with the instance items
-		iters.update(self.__dict__)
+		#Grab the instance attributes (whether in __slots__ or __dict__)
+		iters = self._getAttributes()
 		#Finally build the string
 		for name,value in iters.items():
 			#Deal with python namemangling
@@ -446,6 +467,74 @@ class smTimelineEvent(smIdentifiable):
 
 
 
+	#Protected methods
+	@classmethod
+	def _fromValues(cls, theID, unit, unitMultiplier, onset, duration, info = None):
+		'''Builds an event from already validated values.
+		
+		This is a fast constructor for containers holding the events'
+		values (e.g. :class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`).
+		Contrary to the class constructor, no checks are made, no new
+		:attr:`id` is drawn and the event is not registered (see
+		:meth:`enableRegistry`); the events built are transient copies
+		of the values held by the container.
+		
+		:Parameters:
+		
+		:param theID: The event id.
+		:type theID: int
+		:param unit: Temporal unit; either 'Second' or 'Sample'.
+		:type unit: str
+		:param unitMultiplier: The unit multiplier.
+		:type unitMultiplier: float
+		:param onset: The event onset.
+		:type onset: float
+		:param duration: The event duration.
+		:type duration: float
+		:param info: Optional. Information associated to the event.
+			It is deep copied. The default is `None`.
+		:type info: Object
+		
+		:return: A new event.
+		:rtype: :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+		'''
+		ev = cls.__new__(cls)
+		ev._smIdentifiable__id = theID
+		ev._smIdentifiable__version = '0.1'
+		ev.__version = '0.1'
+		ev.__unit = cls._getSharedUnit(unit, unitMultiplier)
+		if unit == 'Sample':
+			onset = round(onset)
+			duration = float(round(duration))
+		ev.__onset = onset
+		ev.__duration = duration
+		ev.__info = None if info is None else copy.deepcopy(info)
+		return ev
+
+	@classmethod
+	def _getSharedUnit(cls, unit, unitMultiplier):
+		'''Gets the interned unit shared by all events in a unit and
+		multiplier.
+		
+		:Parameters:
+		
+		:param unit: Temporal unit; either 'Second' or 'Sample'.
+		:type unit: str
+		:param unitMultiplier: The unit multiplier.
+		:type unitMultiplier: float
+		
+		:return: The shared unit.
+		:rtype: :class:`smMeasurementUnit <scimeth.data.smMeasurementUnit>`
+		'''
+		if unit == 'Sample':
+			return smMeasurementUnit.getInterned(name = 'Sample', \
+							acronym = 'samples', multiplier = unitMultiplier, \
+							isInternationalSystem = False)
+		return smMeasurementUnit.getInterned(name = 'Second', \
+							acronym = 's', multiplier = unitMultiplier, \
+							isInternationalSystem = True)
+
+
 	#Public methods
 	def getClassName(self):
 		'''Gets the class name.
@@ -488,13 +577,14 @@ class smTimelineEvent(smIdentifiable):
 			msg = self.getClassName() + ':hasOverlap: Unexpected events unit for parameter ev2. Events units must be either ''Sample'' or ''Second''.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		if self.unit.name != ev.unit.name:
+		evUnit = ev._smTimelineEvent__unit
+		if self.__unit.name != evUnit.name:
 			msg = self.getClassName() + ':hasOverlap: Both events must share the same unit.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
 		#(whether in samples or seconds), ensure the same (neutral) multiplier
-		tmp1 = [x * 10**self.unit.multiplier for x in [self.onset, self.end]]
-		tmp2 = [x * 10**ev.unit.multiplier for x in [ev.onset, ev.end]]
+		tmp1 = [x * 10**self.__unit.multiplier for x in [self.onset, self.end]]
+		tmp2 = [x * 10**evUnit.multiplier for x in [ev.onset, ev.end]]
 		#Finally, decide whether they overlap.
 		res = False
 		if tmp2[0] <= tmp1[0] and tmp2[1]>= tmp1[0]: #ev2.onset precedes ev1.onset, and ev2.end expand beyond ev1.onset
@@ -535,7 +625,7 @@ class smTimelineEvent(smIdentifiable):
 		res = res & (self.id == obj2.id)
 		res = res & (self.onset == obj2.onset)
 		res = res & (self.duration == obj2.duration)
-		res = res & (self.unit.isEqual(obj2.unit))
+		res = res & (self.__unit.isEqual(obj2._smTimelineEvent__unit))
 		res = res & (self.info == obj2.info)
 		
 		return res
@@ -550,7 +640,7 @@ class smTimelineEvent(smIdentifiable):
 		:rtype: bool
 
 		'''
-		return self.unit.name == 'Sample'
+		return self.__unit.name == 'Sample'
 
 
 	def isInSeconds(self):
@@ -563,7 +653,7 @@ class smTimelineEvent(smIdentifiable):
 		:rtype: bool
 
 		'''
-		return self.unit.name == 'Second'
+		return self.__unit.name == 'Second'
 
 
 	def toSamples(self,samplingRate = 1):
@@ -587,11 +677,9 @@ class smTimelineEvent(smIdentifiable):
 			msg = self.getClassName() + ':toSamples: Unexpected parameter value. Sampling rate must be equal or greater than 0 Hz.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		currUnit = self.unit.name
-		currMultiplier = self.unit.multiplier
-		self.__unit = smMeasurementUnit(name='Sample',acronym='samples', \
-								multiplier=1, \
-								isInternationalSystem=False)
+		currUnit = self.__unit.name
+		currMultiplier = self.__unit.multiplier
+		self.__unit = self._getSharedUnit('Sample', 1)
 		#and update the onset and duration from seconds.
 		if currUnit == 'Sample':
 			pass
@@ -627,16 +715,14 @@ class smTimelineEvent(smIdentifiable):
 			msg = self.getClassName() + ':toSamples: Unexpected parameter value. Sampling rate must be equal or greater than 0 Hz.'
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
-		currUnit = self.unit.name
-		self.__unit = smMeasurementUnit(name = 'Second', acronym = 's', \
-								multiplier = newMultiplier, \
-								isInternationalSystem = True)
+		currUnit = self.__unit.name
+		self.__unit = self._getSharedUnit('Second', newMultiplier)
 		#and update the onset and duration from samples.
 		if currUnit == 'Second':
 			pass
 		else:
-			self.onset = (self.onset / samplingRate) / 10**self.unit.multiplier
-			self.duration = (self.duration / samplingRate) / 10**self.unit.multiplier
+			self.onset = (self.onset / samplingRate) / 10**self.__unit.multiplier
+			self.duration = (self.duration / samplingRate) / 10**self.__unit.multiplier
 		return None
 		
 
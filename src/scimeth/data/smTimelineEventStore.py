@@ -0,0 +1,893 @@
+# -*- coding: utf-8 -*-
+#
+#File: smTimelineEventStore.py
+#
+'''
+Created on Sun Oct 18 10:12:05 2026
+
+Module ***smTimelineEventStore***
+
+This module implements the class
+:class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`.
+
+
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Class :class:`smTimelineEventStore` created.       |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added an id to position index so that              |
+|             |        |   :meth:`getPositions` no longer scans the ids.      |
+|             |        | - Added method :meth:`hasID`.                        |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Columns are now returned as read-only views.       |
+|             |        | - Added method :meth:`getView`.                      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added an interval index (events sorted by onset    |
+|             |        |   with the running maximum of their ends) and method |
+|             |        |   :meth:`getPositionsInWindow`.                      |
+|             |        | - Added read-only property :attr:`revision`.         |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`attachColumns`.                |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - :meth:`materialise` no longer draws new ids for    |
+|             |        |   the materialised events.                           |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Small updates and insertions no longer invalidate  |
+|             |        |   the interval index. The few stale positions are    |
+|             |        |   checked apart by :meth:`getPositionsInWindow`      |
+|             |        |   until the index is rebuilt.                        |
+|             |        | - Added protected method :meth:`_markStale`.         |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso::
+
+	:class:`smTimeline <scimeth.data.smTimeline>`,
+	:class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+'''
+
+
+## Import
+#import warnings
+#import deprecation
+#import os
+import types
+
+import numpy as np
+
+
+#from scimeth import __version__
+#from scimeth import data as scimeth
+from .smTimelineEvent import smTimelineEvent
+
+
+## Class definition
+class smTimelineEventStore():
+	#Sphinx documentation
+	'''A :class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`
+	keeps a collection of
+	:class:`smTimelineEvents <scimeth.data.smTimelineEvent>` in columnar
+	form.
+
+	Rather than holding one
+	:class:`smTimelineEvent <scimeth.data.smTimelineEvent>` object per event,
+	the store keeps parallel numpy arrays (columns) for the events'
+	:attr:`ids`, :attr:`onsets`, :attr:`durations`, :attr:`ends`,
+	:attr:`units` (as a code; see :attr:`SAMPLE` and :attr:`SECOND`),
+	:attr:`multipliers` and :attr:`infos`. The i-th element of every column
+	corresponds to the same event (the i-th row or position).
+
+	:class:`smTimelineEvent <scimeth.data.smTimelineEvent>` objects are only
+	built (materialised) when requested with :meth:`materialise`. Changes
+	to the materialised objects are **not** reflected in the store.
+
+	Columns are allocated with some spare capacity so that successive
+	insertions do not reallocate the arrays every time.
+
+	An index from the events' ids to their positions is maintained
+	alongside the columns, so that looking up k events by id costs O(k)
+	regardless of the number of events in the store.
+
+	This is the container used internally by
+	:class:`smTimeline <scimeth.data.smTimeline>` to keep its events. The
+	store does **not** check the class invariants of the timeline (e.g.
+	uniqueness of ids); that is responsibility of the
+	:class:`smTimeline <scimeth.data.smTimeline>`.
+
+	'''
+
+	#Private class attributes shared by all instances
+	__MAXSTALEPOSITIONS = 256 #Maximum number of modified positions
+						#tolerated before rebuilding the interval index
+
+	#Class constructor
+	def __init__(self, capacity = 0):
+		'''Class constructor. Creates a new empty instance of
+		:class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`.
+
+		:Parameters:
+
+		:param capacity: Optional. Number of events for which room is
+			initially reserved. The default is 0.
+		:type capacity: int
+
+		:Returns:
+
+		A new object instance of :class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`.
+		'''
+		if type(capacity) is not int or capacity < 0:
+			msg = self.getClassName() + ':__init__: Unexpected parameter value for capacity.'
+			raise ValueError(msg)
+
+		self.__version = '0.1'
+
+		self.__nEvents = 0 #Number of events (rows) in use.
+		self.__ids         = np.zeros(capacity, dtype = np.int64)
+		self.__onsets      = np.zeros(capacity, dtype = np.float64)
+		self.__durations   = np.zeros(capacity, dtype = np.float64)
+		self.__ends        = np.zeros(capacity, dtype = np.float64)
+		self.__units       = np.zeros(capacity, dtype = np.int8)
+		self.__multipliers = np.zeros(capacity, dtype = np.float64)
+		self.__infos       = np.empty(capacity, dtype = object)
+		self.__index = dict() #Index of positions (values) by event id (keys)
+		self.__revision = 0 #Increased on every modification of the events
+		self.__intervalIndex = dict() #Interval indexes (values) by unit
+									#and multiplier (keys). Built on demand.
+		self.__intervalIndexRevision = 0 #Revision at which the interval
+									#indexes were built
+		self.__stalePositions = set() #Positions modified or added since
+									#the interval indexes were built
+
+		return
+
+
+	#Properties getters/setters
+	#
+	# Remember: Sphinx ignores docstrings on property setters so all
+	#documentation for a property must be on the @property method
+
+	#Note that python does not have constants nor static constants,
+	#so in order to have a constant, a new property is defined
+	#with only a getter method and no setter.
+	@property
+	def SAMPLE(self): #SAMPLE getter
+		'''
+		Constant SAMPLE = 0
+		Code in :attr:`units` for events expressed in 'Sample'.
+
+		:getter: Gets constant SAMPLE.
+		:type: int
+		'''
+		return 0
+
+	@property
+	def SECOND(self): #SECOND getter
+		'''
+		Constant SECOND = 1
+		Code in :attr:`units` for events expressed in 'Second'.
+
+		:getter: Gets constant SECOND.
+		:type: int
+		'''
+		return 1
+
+	@property
+	def capacity(self): #capacity getter
+		'''
+		Number of events that can be held before the columns have
+		to be reallocated. This is a read-only property.
+
+		:getter: Gets the capacity.
+		:type: int
+		'''
+		return len(self.__ids)
+
+	@property
+	def durations(self): #durations getter
+		'''
+		Column of events' durations. This is a read-only property.
+
+		Columns are returned as read-only views (no copy is made). Use
+		:meth:`numpy.ndarray.copy` if you need to modify them.
+
+		:getter: Gets the events' durations.
+		:type: numpy.ndarray of float
+		'''
+		return self._readOnlyView(self.__durations)
+
+	@property
+	def ends(self): #ends getter
+		'''
+		Column of events' ends. This is a read-only property.
+
+		:getter: Gets the events' ends.
+		:type: numpy.ndarray of float
+		'''
+		return self._readOnlyView(self.__ends)
+
+	@property
+	def ids(self): #ids getter
+		'''
+		Column of events' ids. This is a read-only property.
+
+		:getter: Gets the events' ids.
+		:type: numpy.ndarray of int
+		'''
+		return self._readOnlyView(self.__ids)
+
+	@property
+	def infos(self): #infos getter
+		'''
+		Column of events' information. This is a read-only property.
+
+		:getter: Gets the events' information.
+		:type: numpy.ndarray of object
+		'''
+		return self._readOnlyView(self.__infos)
+
+	@property
+	def multipliers(self): #multipliers getter
+		'''
+		Column of events' unit multipliers. This is a read-only property.
+
+		:getter: Gets the events' unit multipliers.
+		:type: numpy.ndarray of float
+		'''
+		return self._readOnlyView(self.__multipliers)
+
+	@property
+	def onsets(self): #onsets getter
+		'''
+		Column of events' onsets. This is a read-only property.
+
+		:getter: Gets the events' onsets.
+		:type: numpy.ndarray of float
+		'''
+		return self._readOnlyView(self.__onsets)
+
+	@property
+	def revision(self): #revision getter
+		'''
+		Revision of the events. The revision is increased every time the
+		events are modified, so that derived structures can detect when
+		they are out of date. This is a read-only property.
+
+		:getter: Gets the revision.
+		:type: int
+		'''
+		return self.__revision
+
+	@property
+	def units(self): #units getter
+		'''
+		Column of events' unit codes; either :attr:`SAMPLE` or
+		:attr:`SECOND`. This is a read-only property.
+
+		:getter: Gets the events' unit codes.
+		:type: numpy.ndarray of int
+		'''
+		return self._readOnlyView(self.__units)
+
+	@property
+	def version(self): #version getter
+		'''
+		The object version.
+
+		:getter: Gets the version.
+		:type: str
+		'''
+		return self.__version
+
+
+	#Private methods
+	def __len__(self):
+		'''Number of events in the store.
+
+		:return: The number of events in the store.
+		:rtype: int
+		'''
+		return self.__nEvents
+
+	def __str__(self, indentationLevel=1):
+		'''Provides a string representation for the objects of the class.
+
+		:Parameters:
+
+		:param indentationLevel: Indentation level. Number of \t inserted
+			in front of the attribute names. Default is 1. Must be positive or 0.
+		:type indentationLevel: int
+
+		:return: A string representation for the object
+		:rtype: str
+		'''
+		if type(indentationLevel) is not int:
+			msg = self.getClassName() + ':__str__: Unexpected parameter type. IndentationLevel must be of type int.'
+			raise ValueError(msg)
+		if indentationLevel < 0:
+			msg = self.getClassName() + ':__str__: Unexpected parameter value. IndentationLevel must be positive or 0.'
+			raise ValueError(msg)
+
+		s = '<' + self.getClassName() + ': {\n'
+		for attributename in ['ids', 'onsets', 'durations', 'ends', \
+							  'units', 'multipliers', 'infos']:
+			s = s + indentationLevel*'\t' + attributename + '\t= ' \
+					+ str(getattr(self,attributename)) + ';\n'
+		return s + indentationLevel*'\t' + '}>'
+
+
+	#Protected methods
+	def _getIntervalIndex(self, unit, multiplier):
+		'''
+		Gets the interval index of the events of a given unit.
+
+		The index holds the positions of the events sorted by onset, their
+		onsets and ends (scaled to the given multiplier), and the running
+		maximum of the ends in onset order. It is built on demand, and
+		rebuilt whenever the events have been modified since it was built.
+
+		:Parameters:
+
+		:param unit: The unit code; either :attr:`SAMPLE` or :attr:`SECOND`.
+		:type unit: int
+		:param multiplier: Multiplier in which onsets and ends are expressed.
+		:type multiplier: float
+
+		:return: A tuple (positions, onsets, ends, maxEnds)
+		:rtype: tuple of numpy.ndarray
+		'''
+		if self.__intervalIndexRevision != self.__revision:
+			self.__intervalIndex = dict()
+			self.__intervalIndexRevision = self.__revision
+			self.__stalePositions = set()
+		key = (unit, float(multiplier))
+		if key not in self.__intervalIndex:
+			positions = np.flatnonzero(self.units == unit)
+			scale = 10.0**(self.multipliers[positions] - multiplier)
+			onsets = self.onsets[positions] * scale
+			order = np.argsort(onsets, kind = 'stable')
+			positions = positions[order]
+			onsets = onsets[order]
+			ends = self.ends[positions] * scale[order]
+			maxEnds = np.maximum.accumulate(ends) if len(ends) > 0 else ends
+			self.__intervalIndex[key] = (positions, onsets, ends, maxEnds)
+		return self.__intervalIndex[key]
+
+	def _markStale(self, positions):
+		'''
+		Records the positions about to be modified (or added) so that
+		the interval index can be kept instead of rebuilt.
+
+		Must be called just before increasing the :attr:`revision`. If
+		the index is not up to date, or too many positions would be
+		stale, nothing is recorded and the index will be rebuilt on the
+		next query.
+
+		:Parameters:
+
+		:param positions: The positions (rows) to be modified or added.
+		:type positions: iterable of int
+		'''
+		if self.__intervalIndexRevision != self.__revision \
+				or len(self.__intervalIndex) == 0:
+			return
+		positions = list(positions)
+		if len(self.__stalePositions) + len(positions) \
+				> smTimelineEventStore.__MAXSTALEPOSITIONS:
+			return
+		self.__stalePositions.update(positions)
+		#The index (patched by the stale positions) remains valid
+		self.__intervalIndexRevision = self.__revision + 1
+		return
+
+	def _readOnlyView(self, column):
+		'''
+		Gets a read-only view over the rows in use of a column.
+
+		:Parameters:
+
+		:param column: One of the (private) columns of the store.
+		:type column: numpy.ndarray
+
+		:return: A view of the first :meth:`__len__` elements of the column
+			with its writeable flag unset.
+		:rtype: numpy.ndarray
+		'''
+		tmp = column[:self.__nEvents]
+		tmp.flags.writeable = False
+		return tmp
+
+	def _rebuildIndex(self):
+		'''
+		Rebuilds the index of positions by event id from the ids column.
+		'''
+		self.__index = dict(zip(self.ids.tolist(), range(self.__nEvents)))
+		return
+
+	def _reserve(self, nEvents):
+		'''
+		Ensures there is room for at least `nEvents` events in the columns.
+
+		Columns are grown geometrically (doubling the capacity) so that
+		repeated insertions have amortized constant cost.
+
+		:Parameters:
+
+		:param nEvents: Number of events that the columns must be able to hold.
+		:type nEvents: int
+		'''
+		currCapacity = len(self.__ids)
+		if nEvents <= currCapacity:
+			return
+		newCapacity = max(nEvents, 2*currCapacity, 16)
+		n = self.__nEvents
+		for attr in ['ids', 'onsets', 'durations', 'ends', \
+					 'units', 'multipliers', 'infos']:
+			mangledName = '_smTimelineEventStore__' + attr
+			oldColumn = getattr(self, mangledName)
+			if oldColumn.dtype == object:
+				newColumn = np.empty(newCapacity, dtype = object)
+			else:
+				newColumn = np.zeros(newCapacity, dtype = oldColumn.dtype)
+			newColumn[:n] = oldColumn[:n]
+			setattr(self, mangledName, newColumn)
+		return
+
+
+	#Public methods
+	def getClassName(self):
+		'''Gets the class name.
+
+		:return: The class name
+		:rtype: str
+		'''
+		return type(self).__name__
+
+
+	def addColumns(self, ids, onsets, durations, units = None, \
+				   multipliers = None, infos = None):
+		'''Appends a batch of events given in columnar form.
+
+		All columns must have the same length. The events' ends are
+		computed as `onsets + durations`.
+
+		:Parameters:
+
+		:param ids: The events' ids.
+		:type ids: array-like of int
+		:param onsets: The events' onsets.
+		:type onsets: array-like of float
+		:param durations: The events' durations.
+		:type durations: array-like of float
+		:param units: Optional. The events' unit codes (see :attr:`SAMPLE`
+			and :attr:`SECOND`). The default is all :attr:`SAMPLE`.
+		:type units: array-like of int
+		:param multipliers: Optional. The events' unit multipliers. The
+			default is all 0.
+		:type multipliers: array-like of float
+		:param infos: Optional. The events' information. The default is
+			all None.
+		:type infos: array-like of object
+
+		:return: None
+		:rtype: NoneType
+		'''
+		ids       = np.asarray(ids, dtype = np.int64).ravel()
+		onsets    = np.asarray(onsets, dtype = np.float64).ravel()
+		durations = np.asarray(durations, dtype = np.float64).ravel()
+		nNew = len(ids)
+		if units is None:
+			units = np.full(nNew, self.SAMPLE, dtype = np.int8)
+		if multipliers is None:
+			multipliers = np.zeros(nNew, dtype = np.float64)
+		units       = np.asarray(units, dtype = np.int8).ravel()
+		multipliers = np.asarray(multipliers, dtype = np.float64).ravel()
+		if not (len(onsets) == nNew and len(durations) == nNew \
+				and len(units) == nNew and len(multipliers) == nNew \
+				and (infos is None or len(infos) == nNew)):
+			msg = self.getClassName() + ':addColumns: Unexpected parameter value. All columns must have the same length.'
+			raise ValueError(msg)
+		if nNew == 0:
+			return None
+
+		n = self.__nEvents
+		self._reserve(n + nNew)
+		self.__ids[n:n+nNew]         = ids
+		self.__onsets[n:n+nNew]      = onsets
+		self.__durations[n:n+nNew]   = durations
+		self.__ends[n:n+nNew]        = onsets + durations
+		self.__units[n:n+nNew]       = units
+		self.__multipliers[n:n+nNew] = multipliers
+		self.__infos[n:n+nNew]       = None
+		if infos is not None:
+			for i, info in enumerate(infos):
+				self.__infos[n+i] = info
+		self.__nEvents = n + nNew
+		self.__index.update(zip(ids.tolist(), range(n, n+nNew)))
+		self._markStale(range(n, n+nNew))
+		self.__revision += 1
+		return None
+
+
+	def addEvents(self, theEvents):
+		'''Appends a collection of
+		:class:`smTimelineEvents <scimeth.data.smTimelineEvent>`.
+
+		The values of the events are copied into the columns. The event
+		objects are not kept.
+
+		:Parameters:
+
+		:param theEvents: The events to append.
+		:type theEvents: iterable of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+
+		:return: None
+		:rtype: NoneType
+		'''
+		theEvents = list(theEvents)
+		ids         = [ev.id for ev in theEvents]
+		onsets      = [ev.onset for ev in theEvents]
+		durations   = [ev.duration for ev in theEvents]
+		units       = list()
+		multipliers = list()
+		for ev in theEvents:
+			tmpUnit = ev.unit
+			units.append(self.SECOND if tmpUnit.name == 'Second' else self.SAMPLE)
+			multipliers.append(tmpUnit.multiplier)
+		infos       = [ev.info for ev in theEvents]
+		self.addColumns(ids, onsets, durations, units = units, \
+						multipliers = multipliers, infos = infos)
+		return None
+
+
+	def attachColumns(self, ids, onsets, durations, ends, units, \
+					  multipliers, infos = None):
+		'''Replaces all events in the store by the given columns.
+
+		Contrary to :meth:`addColumns`, the arrays are attached as the
+		columns of the store without copying them (e.g. memory-mapped
+		arrays remain memory-mapped). They are only copied when the
+		store has to grow. Arrays must have the dtypes of the columns
+		and the same length, which becomes the capacity of the store.
+		Do not attach memory-mapped arrays opened in 'r+' mode unless
+		changes to the events should be written to the file.
+
+		:Parameters:
+
+		:param ids: The events' ids.
+		:type ids: numpy.ndarray of numpy.int64
+		:param onsets: The events' onsets.
+		:type onsets: numpy.ndarray of numpy.float64
+		:param durations: The events' durations.
+		:type durations: numpy.ndarray of numpy.float64
+		:param ends: The events' ends.
+		:type ends: numpy.ndarray of numpy.float64
+		:param units: The events' unit codes (see :attr:`SAMPLE` and
+			:attr:`SECOND`).
+		:type units: numpy.ndarray of numpy.int8
+		:param multipliers: The events' unit multipliers.
+		:type multipliers: numpy.ndarray of numpy.float64
+		:param infos: Optional. The events' information. The default is
+			all None.
+		:type infos: numpy.ndarray of object
+
+		:return: None
+		:rtype: NoneType
+		'''
+		nNew = len(ids)
+		if infos is None:
+			infos = np.empty(nNew, dtype = object)
+		columns = {'ids': (ids, np.int64), 'onsets': (onsets, np.float64), \
+				   'durations': (durations, np.float64), \
+				   'ends': (ends, np.float64), 'units': (units, np.int8), \
+				   'multipliers': (multipliers, np.float64), \
+				   'infos': (infos, object)}
+		for column, dtype in columns.values():
+			if not isinstance(column, np.ndarray) or column.dtype != dtype \
+					or column.shape != (nNew,):
+				msg = self.getClassName() + ':attachColumns: Unexpected parameter value. Columns must be 1D arrays of the same length and the expected dtypes.'
+				raise ValueError(msg)
+		for attr, (column, _) in columns.items():
+			setattr(self, '_smTimelineEventStore__' + attr, column)
+		self.__nEvents = nNew
+		self._rebuildIndex()
+		self.__revision += 1
+		return None
+
+
+	def clear(self):
+		'''Removes all events from the store.
+
+		The capacity is kept.
+
+		:return: None
+		:rtype: NoneType
+		'''
+		self.__infos[:self.__nEvents] = None #Release the references
+		self.__nEvents = 0
+		self.__index = dict()
+		self.__revision += 1
+		return None
+
+
+	def getPositions(self, theIDs):
+		'''Gets the positions (rows) of the events with the given ids.
+
+		Ids not found in the store are ignored. The cost is proportional
+		to the number of ids requested, not to the size of the store.
+
+		:Parameters:
+
+		:param theIDs: The events' ids.
+		:type theIDs: iterable of int
+
+		:return: The positions of the events found, in increasing order.
+		:rtype: numpy.ndarray of int
+		'''
+		if isinstance(theIDs, np.ndarray):
+			theIDs = theIDs.ravel().tolist()
+		index = self.__index
+		positions = [index[oid] for oid in set(theIDs) if oid in index]
+		positions.sort()
+		return np.array(positions, dtype = np.int64)
+
+
+	def getPositionsInWindow(self, t0, t1, unit, multiplier = 0):
+		'''Gets the positions of the events active within a time window.
+
+		An event is active within the window if its closed interval
+		[onset, end] intersects the closed window [t0, t1]. Only events
+		expressed in the given unit are considered. Onsets and ends are
+		compared after scaling them from the events' multipliers to the
+		given multiplier.
+
+		Queries are resolved with binary searches over an interval index
+		of the events sorted by onset, which is rebuilt only after the
+		events are modified. A few modified or added events are checked
+		apart instead of rebuilding the index (see :meth:`_markStale`).
+
+		:Parameters:
+
+		:param t0: Start of the window.
+		:type t0: float
+		:param t1: End of the window.
+		:type t1: float
+		:param unit: The unit code; either :attr:`SAMPLE` or :attr:`SECOND`.
+		:type unit: int
+		:param multiplier: Optional. Multiplier in which `t0` and `t1` are
+			expressed. The default is 0.
+		:type multiplier: float
+
+		:return: The positions of the active events, in increasing order.
+		:rtype: numpy.ndarray of int
+		'''
+		positions, onsets, ends, maxEnds = self._getIntervalIndex(unit, multiplier)
+		#Events starting after the window cannot be active...
+		last = np.searchsorted(onsets, t1, side = 'right')
+		#...and neither can those ending before the window, which
+		#(by the running maximum) include all events before first.
+		first = np.searchsorted(maxEnds[:last], t0, side = 'left')
+		candidates = np.arange(first, last)
+		res = positions[candidates[ends[first:last] >= t0]]
+		if len(self.__stalePositions) > 0:
+			stale = np.fromiter(self.__stalePositions, dtype = np.int64)
+			res = res[~np.isin(res, stale)]
+			stale = stale[self.__units[stale] == unit]
+			scale = 10.0**(self.__multipliers[stale] - multiplier)
+			active = (self.__onsets[stale] * scale <= t1) \
+						& (self.__ends[stale] * scale >= t0)
+			res = np.concatenate((res, stale[active]))
+		res.sort()
+		return res
+
+
+	def getView(self):
+		'''Gets a read-only view over all the columns of the store.
+
+		No data is copied; the columns are read-only views as those
+		returned by the column properties. The view reflects the content
+		of the store at the time of the call; views are not guaranteed to
+		follow later insertions or removals.
+
+		:return: A read-only mapping from the column names ('ids',
+			'onsets', 'durations', 'ends', 'units', 'multipliers' and
+			'infos') to the columns.
+		:rtype: :class:`types.MappingProxyType`
+		'''
+		return types.MappingProxyType({'ids'         : self.ids,
+									   'onsets'      : self.onsets,
+									   'durations'   : self.durations,
+									   'ends'        : self.ends,
+									   'units'       : self.units,
+									   'multipliers' : self.multipliers,
+									   'infos'       : self.infos})
+
+
+	def hasID(self, theID):
+		'''Checks whether there is an event with the given id in the store.
+
+		:Parameters:
+
+		:param theID: The event id.
+		:type theID: int
+
+		:return: True if an event with such id exists. False otherwise.
+		:rtype: bool
+		'''
+		return theID in self.__index
+
+
+	def isEqual(self, obj2):
+		'''
+		Compares whether a second object is of the same type and holds
+		the same events (in the same positions).
+
+		:Parameters:
+
+		obj2 : :class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`
+			Object to be compared with.
+
+		:Returns:
+
+		Boolean. True if both objects have the same information.
+		False otherwise.
+		'''
+		res = True
+		res = res & (type(self) == type(obj2))
+		if not res:
+			return res
+
+		res = res & (len(self) == len(obj2))
+		if not res:
+			return res
+		res = res & bool(np.array_equal(self.ids, obj2.ids))
+		res = res & bool(np.array_equal(self.onsets, obj2.onsets))
+		res = res & bool(np.array_equal(self.durations, obj2.durations))
+		res = res & bool(np.array_equal(self.units, obj2.units))
+		res = res & bool(np.array_equal(self.multipliers, obj2.multipliers))
+		res = res & all(a == b for a, b in zip(self.infos, obj2.infos))
+		return res
+
+
+	def materialise(self, positions = None):
+		'''Builds :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+		objects from the columns.
+
+		The new objects are independent from the store; changes to them
+		are not reflected in the store.
+
+		:Parameters:
+
+		:param positions: Optional. The positions (rows) of the events
+			to materialise. The default (None) materialises all events.
+		:type positions: array-like of int
+
+		:return: The list of materialised events, in the order of `positions`.
+		:rtype: list of :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+		'''
+		if positions is None:
+			positions = np.arange(self.__nEvents)
+		theEvents = list()
+		for pos in np.asarray(positions, dtype = np.int64).ravel():
+			if self.__units[pos] == self.SECOND:
+				unit = 'Second'
+			else:
+				unit = 'Sample'
+			ev = smTimelineEvent._fromValues(int(self.__ids[pos]), unit, \
+								float(self.__multipliers[pos]), \
+								float(self.__onsets[pos]), \
+								float(self.__durations[pos]), self.__infos[pos])
+			theEvents.append(ev)
+		return theEvents
+
+
+	def remove(self, positions):
+		'''Removes the events at the given positions (rows).
+
+		Remaining events keep their relative order but their positions
+		are compacted.
+
+		:Parameters:
+
+		:param positions: The positions (rows) of the events to remove.
+		:type positions: array-like of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		positions = np.asarray(positions, dtype = np.int64).ravel()
+		if len(positions) == 0:
+			return None
+		n = self.__nEvents
+		keep = np.ones(n, dtype = bool)
+		keep[positions] = False
+		nKeep = int(np.count_nonzero(keep))
+		for attr in ['ids', 'onsets', 'durations', 'ends', \
+					 'units', 'multipliers', 'infos']:
+			column = getattr(self, '_smTimelineEventStore__' + attr)
+			column[:nKeep] = column[:n][keep]
+		self.__infos[nKeep:n] = None #Release the references
+		self.__nEvents = nKeep
+		self._rebuildIndex() #Positions have been compacted
+		self.__revision += 1
+		return None
+
+
+	def setColumns(self, positions, ids = None, onsets = None, \
+				   durations = None, units = None, multipliers = None, \
+				   infos = None):
+		'''Overwrites the values of the events at the given positions (rows).
+
+		Only the columns provided are updated. The events' ends are
+		recomputed as `onsets + durations`.
+
+		:Parameters:
+
+		:param positions: The positions (rows) of the events to update.
+		:type positions: array-like of int
+		:param ids, onsets, durations, units, multipliers, infos: Optional.
+			The new values for the corresponding columns. Either a scalar or
+			an array-like of the same length as `positions`.
+
+		:return: None
+		:rtype: NoneType
+		'''
+		positions = np.asarray(positions, dtype = np.int64).ravel()
+		if ids is not None:
+			for oid in self.__ids[positions].tolist():
+				self.__index.pop(oid, None)
+			self.__ids[positions] = ids
+			self.__index.update(zip(self.__ids[positions].tolist(), positions.tolist()))
+		if onsets is not None:
+			self.__onsets[positions] = onsets
+		if durations is not None:
+			self.__durations[positions] = durations
+		if units is not None:
+			self.__units[positions] = units
+		if multipliers is not None:
+			self.__multipliers[positions] = multipliers
+		if infos is not None:
+			for pos, info in zip(positions, infos):
+				self.__infos[pos] = info
+		self.__ends[positions] = self.__onsets[positions] + self.__durations[positions]
+		self._markStale(positions.tolist())
+		self.__revision += 1
+		return None
+
+
+	def setEvents(self, positions, theEvents):
+		'''Overwrites the events at the given positions (rows) with the
+		values of the given
+		:class:`smTimelineEvents <scimeth.data.smTimelineEvent>`.
+
+		:Parameters:
+
+		:param positions: The positions (rows) of the events to update.
+		:type positions: array-like of int
+		:param theEvents: The new events. Must have the same length as
+			`positions`.
+		:type theEvents: list of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+
+		:return: None
+		:rtype: NoneType
+		'''
+		units = list()
+		multipliers = list()
+		for ev in theEvents:
+			tmpUnit = ev.unit
+			units.append(self.SECOND if tmpUnit.name == 'Second' else self.SAMPLE)
+			multipliers.append(tmpUnit.multiplier)
+		self.setColumns(positions, \
+						ids = [ev.id for ev in theEvents], \
+						onsets = [ev.onset for ev in theEvents], \
+						durations = [ev.duration for ev in theEvents], \
+						units = units, multipliers = multipliers, \
+						infos = [ev.info for ev in theEvents])
+		return None
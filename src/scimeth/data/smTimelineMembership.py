@@ -0,0 +1,700 @@
+# -*- coding: utf-8 -*-
+#
+#File: smTimelineMembership.py
+#
+'''
+Created on Sun Oct 18 18:41:26 2026
+
+Module ***smTimelineMembership***
+
+This module implements the class
+:class:`smTimelineMembership <scimeth.data.smTimelineMembership>`.
+
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Class :class:`smTimelineMembership` created.       |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`addPairs`.                     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added method :meth:`getEventPairs`.                |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - New pairs are merged into the sorted pairs by      |
+|             |        |   binary search, and the copy sorted by event is     |
+|             |        |   updated rather than discarded, so small edits no   |
+|             |        |   longer sort all the pairs.                         |
+|             |        | - Added protected methods :meth:`_findPairs`,        |
+|             |        |   :meth:`_insertPairs`, :meth:`_removePairs` and     |
+|             |        |   :meth:`_sortPairs`.                                |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso::
+
+	:class:`smTimeline <scimeth.data.smTimeline>`,
+	:class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+'''
+
+## Import
+#import warnings
+#import deprecation
+#import os
+
+import numpy as np
+
+#from scimeth import __version__
+#from scimeth import data as scimeth
+
+
+## Class definition
+class smTimelineMembership():
+	#Sphinx documentation
+	'''A :class:`smTimelineMembership <scimeth.data.smTimelineMembership>`
+	keeps the associations between
+	:class:`smTimelineConditions <scimeth.data.smTimelineCondition>` and
+	:class:`smTimelineEvents <scimeth.data.smTimelineEvent>` as a sparse
+	boolean membership matrix.
+
+	Only the non-zero entries of the matrix are kept, as two parallel
+	arrays of conditions' ids and events' ids (the (condition, event)
+	pairs) sorted by condition and then by event, i.e. in a
+	compressed-row like layout. The events of a set of conditions
+	(rows) are hence found by binary search. A second copy of the
+	pairs sorted by event (compressed-column like layout) is built on
+	demand for the reverse lookup of the conditions of a set of events.
+	Once built, it is kept up to date with the associations.
+
+	New pairs are merged into the sorted arrays by binary search rather
+	than sorting all the pairs again, so associating a few events costs
+	O(k log M) searches plus a copy of the arrays, where k is the number
+	of new pairs and M the number of pairs.
+
+	Associations are added, removed and renamed in bulk with vectorized
+	operations over the pairs, so the cost of removing a set of events
+	does not depend on the number of conditions.
+
+	This is the container used internally by
+	:class:`smTimeline <scimeth.data.smTimeline>` to keep the
+	associations. The membership does **not** check that the conditions
+	and events exist in the timeline; that is responsibility of the
+	:class:`smTimeline <scimeth.data.smTimeline>`.
+	'''
+
+	#Private class attributes shared by all instances
+
+
+	#Class constructor
+	def __init__(self):
+		'''Class constructor. Creates a new empty instance of
+		:class:`smTimelineMembership <scimeth.data.smTimelineMembership>`.
+
+		:Returns:
+
+		A new object instance of :class:`smTimelineMembership <scimeth.data.smTimelineMembership>`.
+		'''
+		self.__version = '0.1'
+		self.__conditionIDs = np.zeros(0, dtype = np.int64) #Sorted by
+		self.__eventIDs = np.zeros(0, dtype = np.int64)     #condition and event
+		self.__byEvent = None #Pairs sorted by event and condition. Built on demand.
+		return
+
+
+	#Properties getters/setters
+	#
+	# Remember: Sphinx ignores docstrings on property setters so all
+	#documentation for a property must be on the @property method
+
+	@property
+	def conditionIDs(self): #conditionIDs getter
+		'''
+		Conditions' ids of the (condition, event) pairs. This is a
+		read-only property.
+
+		Pairs are sorted by condition and then by event. The array is
+		returned as a read-only view (no copy is made).
+
+		:getter: Gets the conditions' ids of the pairs.
+		:type: numpy.ndarray of int
+		'''
+		return self._readOnlyView(self.__conditionIDs)
+
+	@property
+	def eventIDs(self): #eventIDs getter
+		'''
+		Events' ids of the (condition, event) pairs. This is a
+		read-only property.
+
+		:getter: Gets the events' ids of the pairs.
+		:type: numpy.ndarray of int
+		'''
+		return self._readOnlyView(self.__eventIDs)
+
+	@property
+	def version(self): #version getter
+		'''
+		The object version.
+
+		:getter: Gets the version.
+		:type: str
+		'''
+		return self.__version
+
+
+	#Private methods
+	def __len__(self):
+		'''Number of (condition, event) pairs.
+
+		:return: The number of associations.
+		:rtype: int
+		'''
+		return len(self.__conditionIDs)
+
+	def __str__(self, indentationLevel=1):
+		'''Provides a string representation for the objects of the class.
+
+		:Parameters:
+
+		:param indentationLevel: Indentation level. Number of \t inserted
+			in front of the attribute names. Default is 1. Must be positive or 0.
+		:type indentationLevel: int
+
+		:return: A string representation for the object
+		:rtype: str
+		'''
+		if type(indentationLevel) is not int:
+			msg = self.getClassName() + ':__str__: Unexpected parameter type. IndentationLevel must be of type int.'
+			raise ValueError(msg)
+		if indentationLevel < 0:
+			msg = self.getClassName() + ':__str__: Unexpected parameter value. IndentationLevel must be positive or 0.'
+			raise ValueError(msg)
+
+		s = '<' + self.getClassName() + ': {\n'
+		for attributename in ['conditionIDs', 'eventIDs']:
+			s = s + indentationLevel*'\t' + attributename + '\t= ' \
+					+ str(getattr(self,attributename)) + ';\n'
+		return s + indentationLevel*'\t' + '}>'
+
+
+	#Protected methods
+	@staticmethod
+	def _asIDs(theIDs):
+		'''
+		Converts a collection of ids to an array.
+
+		:Parameters:
+
+		:param theIDs: The ids.
+		:type theIDs: iterable of int
+
+		:return: The ids.
+		:rtype: numpy.ndarray of numpy.int64
+		'''
+		if not isinstance(theIDs, np.ndarray):
+			theIDs = list(theIDs)
+		return np.asarray(theIDs, dtype = np.int64).ravel()
+
+	@staticmethod
+	def _gatherRanges(sortedKeys, theKeys):
+		'''
+		Gets the positions of all the elements of a sorted array equal
+		to any of the given keys.
+
+		:Parameters:
+
+		:param sortedKeys: The sorted array.
+		:type sortedKeys: numpy.ndarray
+		:param theKeys: The keys.
+		:type theKeys: iterable of int
+
+		:return: The positions, grouped by key.
+		:rtype: numpy.ndarray of int
+		'''
+		theKeys = np.unique(smTimelineMembership._asIDs(theKeys))
+		starts = np.searchsorted(sortedKeys, theKeys, side = 'left')
+		lengths = np.searchsorted(sortedKeys, theKeys, side = 'right') - starts
+		#Concatenate the ranges [start, start+length) without looping
+		offsets = np.cumsum(lengths) - lengths
+		return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+	@staticmethod
+	def _findPairs(majorKeys, minorKeys, newMajorKeys, newMinorKeys):
+		'''
+		Locates some pairs in an array of pairs sorted by a major and a
+		minor key.
+
+		:Parameters:
+
+		:param majorKeys: The major keys of the pairs, sorted.
+		:type majorKeys: numpy.ndarray
+		:param minorKeys: The minor keys of the pairs, sorted within
+			each major key.
+		:type minorKeys: numpy.ndarray
+		:param newMajorKeys: The major keys of the pairs to locate,
+			sorted.
+		:type newMajorKeys: numpy.ndarray
+		:param newMinorKeys: The minor keys of the pairs to locate,
+			sorted within each major key.
+		:type newMinorKeys: numpy.ndarray
+
+		:return: A tuple (positions, found). The positions at which
+			the pairs would be inserted keeping the order, and whether
+			each pair is already in the array.
+		:rtype: tuple of numpy.ndarray
+		'''
+		positions = np.zeros(len(newMajorKeys), dtype = np.int64)
+		found = np.zeros(len(newMajorKeys), dtype = bool)
+		keys, bounds = np.unique(newMajorKeys, return_index = True)
+		bounds = np.append(bounds, len(newMajorKeys))
+		starts = np.searchsorted(majorKeys, keys, side = 'left')
+		stops = np.searchsorted(majorKeys, keys, side = 'right')
+		#Binary search within the range of each major key
+		for k in range(len(keys)):
+			segment = minorKeys[starts[k]:stops[k]]
+			tmpKeys = newMinorKeys[bounds[k]:bounds[k+1]]
+			tmpPositions = np.searchsorted(segment, tmpKeys)
+			if len(segment) > 0:
+				found[bounds[k]:bounds[k+1]] = \
+					segment[np.minimum(tmpPositions, len(segment)-1)] == tmpKeys
+			positions[bounds[k]:bounds[k+1]] = starts[k] + tmpPositions
+		return positions, found
+
+	def _getByEvent(self):
+		'''
+		Gets the pairs sorted by event and then by condition.
+
+		The pairs are sorted on demand the first time, and updated
+		thereafter as the associations are modified.
+
+		:return: A tuple (eventIDs, conditionIDs).
+		:rtype: tuple of numpy.ndarray
+		'''
+		if self.__byEvent is None:
+			order = np.lexsort((self.__conditionIDs, self.__eventIDs))
+			self.__byEvent = (self.__eventIDs[order], self.__conditionIDs[order])
+		return self.__byEvent
+
+	def _insertPairs(self, conditionIDs, eventIDs):
+		'''
+		Merges new pairs into the pairs, discarding repetitions.
+
+		Both the pairs sorted by condition and, if built, the copy
+		sorted by event are updated without sorting them again.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids of the new pairs.
+		:type conditionIDs: numpy.ndarray of numpy.int64
+		:param eventIDs: The events' ids of the new pairs.
+		:type eventIDs: numpy.ndarray of numpy.int64
+		'''
+		conditionIDs, eventIDs = self._sortPairs(conditionIDs, eventIDs)
+		positions, found = self._findPairs(self.__conditionIDs, \
+							self.__eventIDs, conditionIDs, eventIDs)
+		if found.all():
+			return
+		conditionIDs = conditionIDs[~found]
+		eventIDs = eventIDs[~found]
+		self.__conditionIDs = np.insert(self.__conditionIDs, positions[~found], conditionIDs)
+		self.__eventIDs = np.insert(self.__eventIDs, positions[~found], eventIDs)
+		if self.__byEvent is not None:
+			byEvent, byEventConditions = self.__byEvent
+			eventIDs, conditionIDs = self._sortPairs(eventIDs, conditionIDs)
+			positions, _ = self._findPairs(byEvent, byEventConditions, \
+							eventIDs, conditionIDs)
+			self.__byEvent = (np.insert(byEvent, positions, eventIDs), \
+							  np.insert(byEventConditions, positions, conditionIDs))
+		return
+
+	def _readOnlyView(self, column):
+		'''
+		Gets a read-only view of an array.
+
+		:Parameters:
+
+		:param column: One of the (private) arrays of pairs.
+		:type column: numpy.ndarray
+
+		:return: A view of the array with its writeable flag unset.
+		:rtype: numpy.ndarray
+		'''
+		tmp = column.view()
+		tmp.flags.writeable = False
+		return tmp
+
+	def _removePairs(self, conditionIDs, eventIDs):
+		'''
+		Removes some pairs. Non existing pairs are ignored.
+
+		Both the pairs sorted by condition and, if built, the copy
+		sorted by event are updated without sorting them again.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids of the pairs.
+		:type conditionIDs: numpy.ndarray of numpy.int64
+		:param eventIDs: The events' ids of the pairs.
+		:type eventIDs: numpy.ndarray of numpy.int64
+		'''
+		conditionIDs, eventIDs = self._sortPairs(conditionIDs, eventIDs)
+		positions, found = self._findPairs(self.__conditionIDs, \
+							self.__eventIDs, conditionIDs, eventIDs)
+		if not found.any():
+			return
+		self.__conditionIDs = np.delete(self.__conditionIDs, positions[found])
+		self.__eventIDs = np.delete(self.__eventIDs, positions[found])
+		if self.__byEvent is not None:
+			byEvent, byEventConditions = self.__byEvent
+			eventIDs, conditionIDs = self._sortPairs(eventIDs[found], conditionIDs[found])
+			positions, _ = self._findPairs(byEvent, byEventConditions, \
+							eventIDs, conditionIDs)
+			self.__byEvent = (np.delete(byEvent, positions), \
+							  np.delete(byEventConditions, positions))
+		return
+
+	def _setPairs(self, conditionIDs, eventIDs):
+		'''
+		Replaces the pairs, sorting them and discarding repetitions.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids of the pairs.
+		:type conditionIDs: numpy.ndarray of numpy.int64
+		:param eventIDs: The events' ids of the pairs.
+		:type eventIDs: numpy.ndarray of numpy.int64
+		'''
+		self.__conditionIDs, self.__eventIDs = self._sortPairs(conditionIDs, eventIDs)
+		self.__byEvent = None
+		return
+
+	@staticmethod
+	def _sortPairs(majorKeys, minorKeys):
+		'''
+		Sorts pairs by a major and a minor key, discarding repetitions.
+
+		:Parameters:
+
+		:param majorKeys: The major keys of the pairs.
+		:type majorKeys: numpy.ndarray
+		:param minorKeys: The minor keys of the pairs.
+		:type minorKeys: numpy.ndarray
+
+		:return: The sorted major and minor keys.
+		:rtype: tuple of numpy.ndarray
+		'''
+		order = np.lexsort((minorKeys, majorKeys))
+		majorKeys = majorKeys[order]
+		minorKeys = minorKeys[order]
+		keep = np.ones(len(order), dtype = bool)
+		keep[1:] = (np.diff(majorKeys) != 0) | (np.diff(minorKeys) != 0)
+		return majorKeys[keep], minorKeys[keep]
+
+
+	#Public methods
+	def getClassName(self):
+		'''Gets the class name.
+
+		:return: The class name
+		:rtype: str
+		'''
+		return type(self).__name__
+
+
+	def addPairs(self, conditionIDs, eventIDs):
+		'''Adds the given (condition, event) pairs.
+
+		Contrary to :meth:`associate`, the i-th event is only associated
+		to the i-th condition. Existing associations are kept.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids of the pairs.
+		:type conditionIDs: iterable of int
+		:param eventIDs: The events' ids of the pairs. Must have the same
+			length as `conditionIDs`.
+		:type eventIDs: iterable of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		conditionIDs = self._asIDs(conditionIDs)
+		eventIDs = self._asIDs(eventIDs)
+		if len(conditionIDs) != len(eventIDs):
+			msg = self.getClassName() + ':addPairs: Unexpected parameter value. Conditions and events must have the same length.'
+			raise ValueError(msg)
+		if len(conditionIDs) == 0:
+			return None
+		self._insertPairs(conditionIDs, eventIDs)
+		return None
+
+
+	def associate(self, conditionIDs, eventIDs):
+		'''Associates all the given events to all the given conditions.
+
+		Existing associations are kept.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids.
+		:type conditionIDs: iterable of int
+		:param eventIDs: The events' ids.
+		:type eventIDs: iterable of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		conditionIDs = np.unique(self._asIDs(conditionIDs))
+		eventIDs = np.unique(self._asIDs(eventIDs))
+		if len(conditionIDs) == 0 or len(eventIDs) == 0:
+			return None
+		self._insertPairs(np.repeat(conditionIDs, len(eventIDs)), \
+						  np.tile(eventIDs, len(conditionIDs)))
+		return None
+
+
+	def clear(self):
+		'''Removes all associations.
+
+		:return: None
+		:rtype: NoneType
+		'''
+		self._setPairs(np.zeros(0, dtype = np.int64), np.zeros(0, dtype = np.int64))
+		return None
+
+
+	def dissociate(self, conditionIDs, eventIDs):
+		'''Removes the associations between all the given events and
+		all the given conditions.
+
+		Non existing associations are ignored.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids.
+		:type conditionIDs: iterable of int
+		:param eventIDs: The events' ids.
+		:type eventIDs: iterable of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		positions = self._gatherRanges(self.__conditionIDs, conditionIDs)
+		positions = positions[np.isin(self.__eventIDs[positions], \
+									  self._asIDs(eventIDs))]
+		if len(positions) > 0:
+			self._removePairs(self.__conditionIDs[positions], self.__eventIDs[positions])
+		return None
+
+
+	def getConditions(self, eventIDs):
+		'''Gets the conditions associated to any of the given events.
+
+		This is the reverse lookup (column extraction) of the membership.
+
+		:Parameters:
+
+		:param eventIDs: The events' ids.
+		:type eventIDs: iterable of int
+
+		:return: The conditions' ids, sorted and without repetitions.
+		:rtype: numpy.ndarray of int
+		'''
+		byEvent, byEventConditions = self._getByEvent()
+		positions = self._gatherRanges(byEvent, eventIDs)
+		return np.unique(byEventConditions[positions])
+
+
+	def getEventPairs(self, eventIDs):
+		'''Gets the (condition, event) pairs of the given events.
+
+		:Parameters:
+
+		:param eventIDs: The events' ids.
+		:type eventIDs: iterable of int
+
+		:return: A tuple (eventIDs, conditionIDs) with the pairs sorted
+			by event and then by condition.
+		:rtype: tuple of numpy.ndarray of int
+		'''
+		byEvent, byEventConditions = self._getByEvent()
+		positions = self._gatherRanges(byEvent, eventIDs)
+		return byEvent[positions], byEventConditions[positions]
+
+
+	def getEvents(self, conditionIDs):
+		'''Gets the events associated to any of the given conditions.
+
+		This is the row extraction of the membership.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids.
+		:type conditionIDs: iterable of int
+
+		:return: The events' ids, sorted and without repetitions.
+		:rtype: numpy.ndarray of int
+		'''
+		positions = self._gatherRanges(self.__conditionIDs, conditionIDs)
+		return np.unique(self.__eventIDs[positions])
+
+
+	def getPairs(self, conditionIDs = None):
+		'''Gets the (condition, event) pairs of the given conditions.
+
+		:Parameters:
+
+		:param conditionIDs: Optional. The conditions' ids. If None,
+			all pairs are retrieved.
+		:type conditionIDs: iterable of int
+
+		:return: A tuple (conditionIDs, eventIDs) with the pairs sorted
+			by condition and then by event.
+		:rtype: tuple of numpy.ndarray of int
+		'''
+		if conditionIDs is None:
+			return self.conditionIDs, self.eventIDs
+		positions = self._gatherRanges(self.__conditionIDs, conditionIDs)
+		return self.__conditionIDs[positions], self.__eventIDs[positions]
+
+
+	def isEqual(self, obj2):
+		'''
+		Compares whether a second object is of the same type and holds
+		the same associations.
+
+		:Parameters:
+
+		obj2 : :class:`smTimelineMembership <scimeth.data.smTimelineMembership>`
+			Object to be compared with.
+
+		:Returns:
+
+		Boolean. True if both objects have the same information.
+		False otherwise.
+		'''
+		res = True
+		res = res & (type(self) == type(obj2))
+		if not res:
+			return res
+		res = res & bool(np.array_equal(self.conditionIDs, obj2.conditionIDs))
+		res = res & bool(np.array_equal(self.eventIDs, obj2.eventIDs))
+		return res
+
+
+	def removeConditions(self, conditionIDs):
+		'''Removes all the associations of the given conditions.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids.
+		:type conditionIDs: iterable of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		positions = self._gatherRanges(self.__conditionIDs, conditionIDs)
+		if len(positions) > 0:
+			self.__conditionIDs = np.delete(self.__conditionIDs, positions)
+			self.__eventIDs = np.delete(self.__eventIDs, positions)
+			if self.__byEvent is not None:
+				keep = ~np.isin(self.__byEvent[1], self._asIDs(conditionIDs))
+				self.__byEvent = (self.__byEvent[0][keep], self.__byEvent[1][keep])
+		return None
+
+
+	def removeEvents(self, eventIDs):
+		'''Removes all the associations of the given events.
+
+		:Parameters:
+
+		:param eventIDs: The events' ids.
+		:type eventIDs: iterable of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		eventIDs = self._asIDs(eventIDs)
+		keep = ~np.isin(self.__eventIDs, eventIDs)
+		if not keep.all():
+			self.__conditionIDs = self.__conditionIDs[keep]
+			self.__eventIDs = self.__eventIDs[keep]
+			if self.__byEvent is not None:
+				positions = self._gatherRanges(self.__byEvent[0], eventIDs)
+				self.__byEvent = (np.delete(self.__byEvent[0], positions), \
+								  np.delete(self.__byEvent[1], positions))
+		return None
+
+
+	def renameCondition(self, oldID, newID):
+		'''Changes the id of a condition in its associations.
+
+		:Parameters:
+
+		:param oldID: The current condition id.
+		:type oldID: int
+		:param newID: The new condition id.
+		:type newID: int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		positions = self._gatherRanges(self.__conditionIDs, [oldID])
+		if len(positions) == 0 or oldID == newID:
+			return None
+		eventIDs = self.__eventIDs[positions]
+		self._removePairs(np.full(len(eventIDs), oldID, dtype = np.int64), eventIDs)
+		self._insertPairs(np.full(len(eventIDs), newID, dtype = np.int64), eventIDs)
+		return None
+
+
+	def renameEvent(self, oldID, newID):
+		'''Changes the id of an event in its associations.
+
+		:Parameters:
+
+		:param oldID: The current event id.
+		:type oldID: int
+		:param newID: The new event id.
+		:type newID: int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		if oldID == newID:
+			return None
+		byEvent, byEventConditions = self._getByEvent()
+		conditionIDs = byEventConditions[self._gatherRanges(byEvent, [oldID])]
+		if len(conditionIDs) == 0:
+			return None
+		self._removePairs(conditionIDs, np.full(len(conditionIDs), oldID, dtype = np.int64))
+		self._insertPairs(conditionIDs, np.full(len(conditionIDs), newID, dtype = np.int64))
+		return None
+
+
+	def setPairs(self, conditionIDs, eventIDs):
+		'''Replaces all associations by the given (condition, event) pairs.
+
+		:Parameters:
+
+		:param conditionIDs: The conditions' ids of the pairs.
+		:type conditionIDs: iterable of int
+		:param eventIDs: The events' ids of the pairs. Must have the same
+			length as `conditionIDs`.
+		:type eventIDs: iterable of int
+
+		:return: None
+		:rtype: NoneType
+		'''
+		conditionIDs = self._asIDs(conditionIDs)
+		eventIDs = self._asIDs(eventIDs)
+		if len(conditionIDs) != len(eventIDs):
+			msg = self.getClassName() + ':setPairs: Unexpected parameter value. Conditions and events must have the same length.'
+			raise ValueError(msg)
+		self._setPairs(conditionIDs, eventIDs)
+		return None
@@ -26,6 +26,8 @@ Created on Mon Apr 20 17:51:28 2020
 +-------------+--------+------------------------------------------------------+
 |  7-May-2020 | FOE    | - Added module smScrollableFrame.                    |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added module smVirtualListFrame.                   |
++-------------+--------+------------------------------------------------------+
 
 
 .. seealso:: None
@@ -38,5 +40,6 @@ Created on Mon Apr 20 17:51:28 2020
 #Make .data subpackage classes visible to main SciMeth package
 from .smGuiTimeline import smGuiTimeline
 from .smScrollableFrame import smScrollableFrame
+from .smVirtualListFrame import smVirtualListFrame
 
 
@@ -85,6 +85,80 @@ provides two types of interface:
 | 19-May-2020 | FOE    | - Callback `callbackApplyChanges` for conditions     |
 |             |        |   is now working correctly.                          |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Callback `callbackApplyChanges` for conditions     |
+|             |        |   now looks up the edited events by id in an index   |
+|             |        |   rather than scanning the events for every row.     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - :meth:`repaintCanvasTimeline` now draws all the    |
+|             |        |   events of a condition as a single PolyCollection   |
+|             |        |   from the events columns, and only creates the text |
+|             |        |   of the labels being shown (one text per event).    |
+|             |        | - Added protected method                             |
+|             |        |   :meth:`_getConditionsEventsArrays`.                |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The timeline canvas now has a navigation toolbar   |
+|             |        |   for zoom and pan. Only the events within the       |
+|             |        |   visible range are drawn. If there are more events  |
+|             |        |   than pixels, they are aggregated into density      |
+|             |        |   bars, and labels are only shown when few events    |
+|             |        |   are visible.                                       |
+|             |        | - Added callback :meth:`on_xlim_changed` and         |
+|             |        |   protected method :meth:`_drawTimelineEvents`.      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The artists of the timeline and overlapping        |
+|             |        |   canvases are now kept by condition and event id,   |
+|             |        |   and only those changed are updated. Showing/hiding |
+|             |        |   labels, editing a condition and changes in the     |
+|             |        |   overlapping status are blitted over a cached       |
+|             |        |   background rather than fully repainted.            |
+|             |        | - Added callbacks :meth:`callbackShowHideLabels` and |
+|             |        |   :meth:`on_draw_canvas`, and protected methods      |
+|             |        |   :meth:`_blitCanvas`, :meth:`_drawTimelineLabels`   |
+|             |        |   and :meth:`_getAnimatedArtists`.                   |
+|             |        | - Bug fixing: :meth:`repaintCanvasOverlapping` was   |
+|             |        |   indexing the overlapping pairs as callables, and   |
+|             |        |   the tick labels did not follow the order of the    |
+|             |        |   conditions ids.                                    |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The conditions list is now a                       |
+|             |        |   :class:`smVirtualListFrame`; only the conditions   |
+|             |        |   in view have a widget, the widgets are recycled    |
+|             |        |   while scrolling, and their events are retrieved    |
+|             |        |   on demand. Widgets of removed conditions are no    |
+|             |        |   longer kept.                                       |
+|             |        | - Added method :meth:`setCondition` to               |
+|             |        |   :class:`smGuiConditionWidget`, and protected       |
+|             |        |   methods :meth:`_bindConditionWidget` and           |
+|             |        |   :meth:`_createConditionWidget`.                    |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - The events treeview of the condition widget is now |
+|             |        |   filled by pages as it is scrolled, sorted by       |
+|             |        |   onset. Cells can be edited with a double click,    |
+|             |        |   and `callbackApplyChanges` only writes back the    |
+|             |        |   edited rows, which are notified to the new events  |
+|             |        |   observers (:meth:`bindEventsObserver`).            |
+|             |        | - Added callback                                     |
+|             |        |   :meth:`on_update_conditionWidgetEvents` so that    |
+|             |        |   the edited events are updated in the timeline.     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - After the edited events are applied, the events    |
+|             |        |   arrays of their conditions are refreshed and only  |
+|             |        |   those rows are redrawn and blitted.                |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Selecting the Timeline tab only repaints the       |
+|             |        |   timeline canvas if its conditions changed (e.g. a  |
+|             |        |   new condition or a new timeline); otherwise it is  |
+|             |        |   blitted.                                           |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Editing a cell of the events treeview updates the  |
+|             |        |   dependent cell of the row (the end, or the         |
+|             |        |   duration if the end is edited), and                |
+|             |        |   `callbackApplyChanges` only writes the onsets and  |
+|             |        |   durations back. The edited events are applied      |
+|             |        |   before the condition; if they are rejected, their  |
+|             |        |   rows are reloaded and the condition is left        |
+|             |        |   unchanged.                                         |
++-------------+--------+------------------------------------------------------+
 
 
 
@@ -122,6 +196,7 @@ from matplotlib.backends.backend_tkagg import (
 # Implement the default Matplotlib key bindings.
 #from matplotlib.backend_bases import key_press_handler
 from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
 
 
 import scimeth as sm
@@ -141,6 +216,7 @@ class smGuiConditionWidget(tk.Frame):
 	'''
 
     #Private class attributes shared by all instances
+	__PAGESIZE = 100 #Number of events inserted in the events treeview at once
 
 	#Class constructor
 	def __init__(self, parent, condition = sm.data.smTimelineCondition(), \
@@ -179,6 +255,7 @@ class smGuiConditionWidget(tk.Frame):
 								#because of python "pass-by-object-reference"
 								#BUT it won't properly update the rest of
 								#the timeline, e.g. conditionsEventMap, etc
+		self.__eventsObservers = list() #Observers of the changes in the events
 								 
 		
 		
@@ -186,11 +263,16 @@ class smGuiConditionWidget(tk.Frame):
 		self.__condition = sm.data.smTimelineCondition() #The condition being manipulated
 		self.__events = None #Events associated to the condition
 		self.__uiElements = dict()
+		self.__eventsByID = dict() #Events indexed by id
+		self.__eventsOrder = list() #Ids of the events by row of the treeview
+		self.__nLoadedRows = 0 #Number of rows inserted in the treeview
+		self.__dirtyRows = set() #Ids of the events edited in the treeview
 		
 		
 		#Initialize
 		self.condition = condition;
 		self.events = events;
+			#The ui elements are filled in by setCondition below
 		
 		#Create my widget an insert it into the parent
 		#Create and add the main tabbed notebook
@@ -201,7 +283,6 @@ class smGuiConditionWidget(tk.Frame):
 		self.uiElements['label_id'] = tk.Label(self, text='Id:')
 		self.uiElements['label_id'].grid(row=0, column=0, sticky='e')
 		self.uiElements['entry_id'] = tk.Entry(self)
-		self.uiElements['entry_id'].insert(0,self.condition.id)
 		self.uiElements['entry_id'].grid(row=0, column=1, sticky='w')
 		status = tk.BooleanVar() #Reset to "decouple" from the previous status variable
 		status.set(True)
@@ -214,14 +295,12 @@ class smGuiConditionWidget(tk.Frame):
 		self.uiElements['label_tag'] = tk.Label(self, text='Tag:', anchor='w')
 		self.uiElements['label_tag'].grid(row=1, column=0, sticky = 'e')
 		self.uiElements['entry_tag'] = tk.Entry(self)
-		self.uiElements['entry_tag'].insert(0,self.condition.tag)
 		self.uiElements['entry_tag'].grid(row=1, column=1, sticky = 'w')
 		self.uiElements['label_description'] = tk.Label(self, text='Description:', anchor="w")
 		self.uiElements['label_description'].grid(row=2, column=0)
 		self.uiElements['entry_description'] = tk.Text(self, \
 												 width = 30, height = 6, \
 												 wrap = 'word')
-		self.uiElements['entry_description'].insert('1.0',self.condition.description)
 		self.uiElements['entry_description'].grid(row=2, column=1, \
 													rowspan = 3, columnspan = 2)
 		tmpScrollBar = tk.Scrollbar(self)
@@ -240,23 +319,25 @@ class smGuiConditionWidget(tk.Frame):
 		self.uiElements['treeview_events'].heading('onset', text = 'onset', anchor = tk.W)
 		self.uiElements['treeview_events'].heading('duration', text = 'duration', anchor = tk.W)
 		self.uiElements['treeview_events'].heading('end', text = 'end', anchor = tk.W)
-		if self.events is not None:
-			for iEv, ev in enumerate(self.events):
-				self.uiElements['treeview_events'].insert(\
-						'', iEv, iid = ev.id, \
-						text = str(ev.id), \
-						values = (str(ev.onset), str(ev.duration), str(ev.end)))
 		self.uiElements['treeview_events'].grid(row=0, column=4, rowspan = 4,padx = (10,0))
+		#Rows are inserted by pages as the treeview is scrolled
+		tmpScrollBar = tk.Scrollbar(self)
+		tmpScrollBar.config(command=self.uiElements['treeview_events'].yview)
+		tmpScrollBar.grid(row=0, column=5, rowspan = 4, sticky = 'ns')
+		self.uiElements['scrollbar_events'] = tmpScrollBar
+		self.uiElements['treeview_events'].config(yscrollcommand=self.on_treeview_yscroll)
+		self.uiElements['treeview_events'].bind('<Double-1>', self.on_treeview_doubleclick)
 
 		self.uiElements['button_applyChanges'] = \
 				tk.Button(self,\
 					text = 'Apply changes', command = self.callbackApplyChanges)
-		self.uiElements['button_applyChanges'].grid(row=0, column=5, sticky = 'we', padx = (10,0), pady=(2,0))
+		self.uiElements['button_applyChanges'].grid(row=0, column=6, sticky = 'we', padx = (10,0), pady=(2,0))
 		self.uiElements['button_removeCondition'] = \
 				tk.Button(self,\
 					text = 'Remove condition')#, command = 'callbackMethodHere')
-		self.uiElements['button_removeCondition'].grid(row=1, column=5, sticky = 'we', padx = (10,0), pady=(2,0))
+		self.uiElements['button_removeCondition'].grid(row=1, column=6, sticky = 'we', padx = (10,0), pady=(2,0))
 
+		self.setCondition(self.condition, self.events)
 
 		return
 	
@@ -352,6 +433,128 @@ class smGuiConditionWidget(tk.Frame):
 		return None
 
 	
+	#Protected methods
+	@staticmethod
+	def _applyRowValues(ev, values):
+		'''
+		Writes the values of a row of the events treeview into an event.
+		
+		Only the onset and the duration are written; the end of the
+		event follows from them (see :meth:`_updateRowValues`).
+		
+		:param ev: The event to update
+		:type ev: :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+		:param values: The (onset, duration, end) of the row
+		:type values: sequence
+		
+		:return: The updated event
+		:rtype: :class:`smTimelineEvent <scimeth.data.smTimelineEvent>`
+		'''
+		ev.onset    = float(values[0])
+		ev.duration = float(values[1])
+		return ev
+
+	def _commitCellEdit(self, entry, rowid, column):
+		'''
+		Writes the value of a cell editor into the events treeview and
+		marks the row as edited. The dependent cell of the row is
+		updated too (see :meth:`_updateRowValues`).
+		
+		:param entry: The cell editor
+		:type entry: tk.Entry
+		:param rowid: The row (event id) being edited
+		:type rowid: str
+		:param column: The column being edited, e.g. '#1'
+		:type column: str
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		if not entry.winfo_exists():
+			return None #Already committed
+		tmpTreeview = self.uiElements['treeview_events']
+		if entry.get() != tmpTreeview.set(rowid, column):
+			values = list(tmpTreeview.item(rowid)['values'])
+			values[int(column[1:])-1] = entry.get()
+			try:
+				values = self._updateRowValues(values, column)
+			except ValueError:
+				tk.messagebox.showerror('Error','Unexpected value ' + entry.get() + '.')
+				entry.destroy()
+				return None
+			tmpTreeview.item(rowid, values = values)
+			self.__dirtyRows.add(int(rowid))
+		entry.destroy()
+		return None
+
+	def _loadNextPage(self):
+		'''
+		Inserts the next page of events into the events treeview.
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		tmpTreeview = self.uiElements['treeview_events']
+		first = self.__nLoadedRows
+		last = min(first + smGuiConditionWidget.__PAGESIZE, len(self.__eventsOrder))
+		for evId in self.__eventsOrder[first:last]:
+			ev = self.__eventsByID[evId]
+			tmpTreeview.insert(\
+					'', 'end', iid = ev.id, \
+					text = str(ev.id), \
+					values = (str(ev.onset), str(ev.duration), str(ev.end)))
+		self.__nLoadedRows = last
+		return None
+
+	def _reloadRows(self, eventIDs):
+		'''
+		Reloads the values of some rows of the events treeview from
+		their events, e.g. to discard their edits.
+		
+		:param eventIDs: The ids of the events whose rows are reloaded
+		:type eventIDs: list of int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		tmpTreeview = self.uiElements['treeview_events']
+		for evId in eventIDs:
+			ev = self.__eventsByID.get(evId)
+			if ev is not None and tmpTreeview.exists(evId):
+				tmpTreeview.item(evId, \
+					values = (str(ev.onset), str(ev.duration), str(ev.end)))
+		return None
+
+	@staticmethod
+	def _updateRowValues(values, column):
+		'''
+		Updates the dependent cell of a row of the events treeview
+		after one of its cells has been edited.
+		
+		The end of an event is its onset plus its duration. Editing
+		the onset moves the event, i.e. its duration is kept, and
+		editing the duration moves its end. Editing the end changes
+		its duration.
+		
+		:param values: The (onset, duration, end) of the row, including
+			the edited cell
+		:type values: sequence
+		:param column: The column edited; '#1' (onset), '#2' (duration)
+			or '#3' (end)
+		:type column: str
+		
+		:return: The (onset, duration, end) of the row
+		:rtype: tuple of str
+		'''
+		values = [str(x) for x in values]
+		onset, duration, end = [float(x) for x in values]
+		if column == '#3':
+			values[1] = str(end - onset)
+		else:
+			values[2] = str(onset + duration)
+		return tuple(values)
+
+
 	#Public methods
 	def getClassName(self):
 		'''Gets the class name.
@@ -365,6 +568,10 @@ class smGuiConditionWidget(tk.Frame):
 		'''Callback for button `Apply Changes` to save changes
 		to condition.
 		
+		The edited events are applied first. If they are rejected,
+		e.g. because they conflict with other events, the edits are
+		discarded, and the condition is not changed either.
+		
 		:return: None
 		:rtype: NoneType
 		'''
@@ -372,45 +579,62 @@ class smGuiConditionWidget(tk.Frame):
 		tmpFilters = copy.deepcopy(warnings.filters) #Keep a copy of current warning filters
 		warnings.filterwarnings('error') #Turn warnings into errors
 			#so that they can be catch as exceptions.
+		editedIDs = sorted(self.__dirtyRows)
+		flagEventsApplied = False
 		try:
-			#Beware! In most languages where the block within
-			#a try statement is executed all or nothing, and if something goes
-			#wrong within the try block, the system restores to the state
-			#prior to the try. contrary to these, in python, the code execute
-			#wihtin the tru block but before any exception is
-			#raised, stays executed even if an exception is raised!!!
-			self.condition.id = int(self.uiElements['entry_id'].get())
-			self.condition.tag = self.uiElements['entry_tag'].get()
-			self.condition.description = self.uiElements['entry_description'].get('1.0', 'end')
-			#notify observers, so that they can update themselves.
-			for observerCallback in self.__conditionObservers:
-				observerCallback(tmpCondition.id,self.condition)
-			
-			for rowid in self.uiElements['treeview_events'].get_children():
-				elem = self.uiElements['treeview_events'].item(rowid) #Get the full row
-				ev = None
-				flagFound = False
-				for tmpEv in self.events:
-					if tmpEv.id == int(elem['text']):
-						ev = tmpEv #Note that this is a shallow copy
-									#So as I make changes below. it will also automatically
- 									#be updated on self.events.
-						flagFound = True
-						break
-				if flagFound:
-					ev.onset    = float(elem['values'][0])
-					ev.duration = float(elem['values'][1])
-					ev.end      = float(elem['values'][2])
-				else:
-					tk.messagebox.showwarning('Warning','Event ' + elem['text'] + ' not found.')
+			#Only write back the edited rows. The edited events are
+			#copies until the observers accept them.
+			theIDs = list()
+			editedEvents = list()
+			for evId in editedIDs:
+				ev = self.__eventsByID.get(evId)
+				if ev is None:
+					tk.messagebox.showwarning('Warning','Event ' + str(evId) + ' not found.')
+					continue
+				elem = self.uiElements['treeview_events'].item(evId) #Get the full row
+				theIDs.append(evId)
+				editedEvents.append(self._applyRowValues(copy.deepcopy(ev), \
+														 elem['values']))
+			if len(theIDs) > 0:
+				#notify observers, so that they can update themselves.
+				for observerCallback in self.__eventsObservers:
+					observerCallback(theIDs, editedEvents)
+				for evId, ev in zip(theIDs, editedEvents):
+					self.events.discard(self.__eventsByID[evId])
+					self.events.add(ev)
+					self.__eventsByID[evId] = ev
+			flagEventsApplied = True
 		except Warning as w:
 			tk.messagebox.showwarning('Warning',str(w))
-			#and restore the condition
-			self.condition = copy.deepcopy(tmpCondition)
 		except Exception as e:
 			tk.messagebox.showerror('Error',str(e))
-			#and restore the condition
-			self.condition = copy.deepcopy(tmpCondition)
+		if not flagEventsApplied:
+			#Discard the rejected edits
+			self._reloadRows(editedIDs)
+		self.__dirtyRows = set()
+		
+		if flagEventsApplied:
+			try:
+				#Beware! In most languages where the block within
+				#a try statement is executed all or nothing, and if something goes
+				#wrong within the try block, the system restores to the state
+				#prior to the try. contrary to these, in python, the code execute
+				#wihtin the tru block but before any exception is
+				#raised, stays executed even if an exception is raised!!!
+				self.condition.id = int(self.uiElements['entry_id'].get())
+				self.condition.tag = self.uiElements['entry_tag'].get()
+				self.condition.description = self.uiElements['entry_description'].get('1.0', 'end')
+				#notify observers, so that they can update themselves.
+				for observerCallback in self.__conditionObservers:
+					observerCallback(tmpCondition.id,self.condition)
+			except Warning as w:
+				tk.messagebox.showwarning('Warning',str(w))
+				#and restore the condition
+				self.condition = copy.deepcopy(tmpCondition)
+			except Exception as e:
+				tk.messagebox.showerror('Error',str(e))
+				#and restore the condition
+				self.condition = copy.deepcopy(tmpCondition)
 		#Now reset warnings filter status
 		warnings.resetwarnings()
 		warnings.filters = copy.deepcopy(tmpFilters)
@@ -421,6 +645,104 @@ class smGuiConditionWidget(tk.Frame):
 		self.__conditionObservers.append(callback)
 
 
+	def bindEventsObserver(self, callback):
+		'''
+		Registers an observer of the changes applied to the events.
+		
+		On applying changes, the callback receives the list of ids of
+		the edited events and the list of the edited events.
+		
+		:param callback: The observer
+		:type callback: callable
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		self.__eventsObservers.append(callback)
+
+
+	def on_treeview_doubleclick(self, event):
+		'''
+		Callback for double clicks on the events treeview. Opens an
+		editor over the clicked cell. The event id is not editable.
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		tmpTreeview = self.uiElements['treeview_events']
+		rowid = tmpTreeview.identify_row(event.y)
+		column = tmpTreeview.identify_column(event.x)
+		if rowid == '' or column == '#0':
+			return None
+		x, y, width, height = tmpTreeview.bbox(rowid, column)
+		entry = tk.Entry(tmpTreeview)
+		entry.insert(0, tmpTreeview.set(rowid, column))
+		entry.place(x = x, y = y, width = width, height = height)
+		entry.focus_set()
+		entry.bind('<Return>', lambda e: self._commitCellEdit(entry, rowid, column))
+		entry.bind('<FocusOut>', lambda e: self._commitCellEdit(entry, rowid, column))
+		entry.bind('<Escape>', lambda e: entry.destroy())
+		return None
+
+
+	def on_treeview_yscroll(self, first, last):
+		'''
+		Callback for the scrolling of the events treeview. Updates the
+		scrollbar and inserts the next page of events when the end of
+		the loaded rows comes into view.
+		
+		:param first: Fraction of the rows above the view
+		:type first: str
+		:param last: Fraction of the rows up to the end of the view
+		:type last: str
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		self.uiElements['scrollbar_events'].set(first, last)
+		if float(last) >= 1.0 and self.__nLoadedRows < len(self.__eventsOrder) \
+				and self.uiElements['treeview_events'].winfo_viewable():
+			self._loadNextPage()
+		return None
+
+
+	def setCondition(self, condition, events = None):
+		'''
+		Sets the condition and events being manipulated, and refreshes
+		the widget content accordingly.
+		
+		This permits recycling the widget for a different condition
+		rather than creating a new widget.
+		
+		:param condition: The condition
+		:type condition: :class:`smTimelineCondition <scimeth.data.smTimelineCondition>`
+		:param events: Optional. The events associated to the condition.
+		:type events: set of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		self.condition = condition
+		self.events = events
+		self.uiElements['entry_id'].delete(0, 'end')
+		self.uiElements['entry_id'].insert(0,self.condition.id)
+		self.uiElements['entry_tag'].delete(0, 'end')
+		self.uiElements['entry_tag'].insert(0,self.condition.tag)
+		self.uiElements['entry_description'].delete('1.0', 'end')
+		self.uiElements['entry_description'].insert('1.0',self.condition.description)
+		#The events are only inserted in the treeview by pages
+		tmpTreeview = self.uiElements['treeview_events']
+		tmpTreeview.delete(*tmpTreeview.get_children())
+		tmpEvents = list() if self.events is None else list(self.events)
+		self.__eventsByID = dict([(ev.id, ev) for ev in tmpEvents])
+		self.__eventsOrder = [ev.id for ev in \
+					sm.data.smTimeline.sortTimelineEventsByOnset(tmpEvents)]
+		self.__nLoadedRows = 0
+		self.__dirtyRows = set()
+		self._loadNextPage()
+		return None
+
+
 ##############################################################################
 # Class smGuiTimeline
 ##############################################################################
@@ -433,6 +755,11 @@ class smGuiTimeline(tk.Frame):
 	'''
 
     #Private class attributes shared by all instances
+	__MAXLABELLEDEVENTS = 100 #Labels are only shown when at most
+						#this number of events are visible
+	__BLITTEDCANVASES = {'canvas_Timeline': 'axes_eventsDisplay', \
+						 'canvas_Overlapping': 'axes_overlappingDisplay'}
+						#Axes of the canvases updated by blitting
 
 	#Class constructor
 	def __init__(self, parent = None, timeline = sm.data.smTimeline()):
@@ -477,6 +804,20 @@ class smGuiTimeline(tk.Frame):
 		self.__savedTimeline = sm.data.smTimeline() #The last saved timeline back up.
 		self.__mode = flagMode #True for widget, False for main window
 		self.__uiElements = dict()
+		self.__conditionsEvents = list() #Events arrays of the conditions
+								#as drawn in the timeline canvas
+		self.__visibleEvents = dict() #Events arrays within the visible
+								#range of the timeline canvas by condition id
+		self.__timelineArtists = dict() #Artists of the visible events
+								#keyed by condition and event id
+		self.__flagTimelineLabels = False #Whether the events labels are shown
+		self.__overlappingArtists = dict() #Artists of the overlapping canvas
+		self.__overlappingLabels = list() #Conditions shown in the overlapping canvas
+		self.__canvasBackgrounds = dict() #Cached backgrounds for blitting
+		self.__flagTimelineStale = True #Whether the timeline canvas needs
+								#a full repaint, e.g. new conditions
+		self.__conditionsList = list() #Ids of the conditions in the
+								#conditions list, by row
 		
 		#Initialize
 		self.savedTimeline = timeline;
@@ -559,6 +900,7 @@ class smGuiTimeline(tk.Frame):
 #								 master=self.uiElements['canvasFrame_Timeline'])  # A tk.DrawingArea.
 		self.uiElements['canvas_Timeline'] = FigureCanvasTkAgg(fig, \
 								 master=self.uiElements['tabTimeline_EventDisplayFrame'])  # A tk.DrawingArea.
+		self.uiElements['canvas_Timeline'].mpl_connect('draw_event', self.on_draw_canvas)
 		self.uiElements['canvas_Timeline'].draw()
 # 		self.uiElements['canvasToolbar_Timeline'] = NavigationToolbar2Tk(\
 # 								 self.uiElements['canvas_Timeline'], \
@@ -569,6 +911,15 @@ class smGuiTimeline(tk.Frame):
 # 		self.uiElements['canvasToolbar_Timeline'].update()
 		self.uiElements['canvas_Timeline'].get_tk_widget().grid(row = 0, \
 														  column = 0, columnspan = 6)
+		#Toolbar for zoom and pan. The toolbar packs itself by default,
+		#so prevent it to not clash with the grid layout.
+		self.uiElements['canvasToolbar_Timeline'] = NavigationToolbar2Tk(\
+								 self.uiElements['canvas_Timeline'], \
+								 self.uiElements['tabTimeline_EventDisplayFrame'], \
+								 pack_toolbar = False)
+		self.uiElements['canvasToolbar_Timeline'].update()
+		self.uiElements['canvasToolbar_Timeline'].grid(row = 2, column = 0, \
+														  columnspan = 6, sticky = 'w')
 		
 		self.uiElements['label_ShowHide'] = tk.Label(self.uiElements['tabTimeline_EventDisplayFrame'], \
 											  text='Show / Hide:', anchor="w")
@@ -578,7 +929,7 @@ class smGuiTimeline(tk.Frame):
 		self.uiElements['checkbox_Id'] = tk.Checkbutton(self.uiElements['tabTimeline_EventDisplayFrame'], \
 											  text='Id', variable=status,\
 											  onvalue = True, offvalue = False,\
-											  command = self.repaintCanvasTimeline)
+											  command = self.callbackShowHideLabels)
 		self.uiElements['checkbox_Id'].status = status 
 		self.uiElements['checkbox_Id'].grid(row=1, column=1, sticky = 'w')
 		status = tk.BooleanVar() #Reset to "decouple" from the previous status variable
@@ -586,7 +937,7 @@ class smGuiTimeline(tk.Frame):
 		self.uiElements['checkbox_Onset'] = tk.Checkbutton(self.uiElements['tabTimeline_EventDisplayFrame'], \
 											  text='Onset', variable=status,\
 											  onvalue = True, offvalue = False,\
-											  command = self.repaintCanvasTimeline)
+											  command = self.callbackShowHideLabels)
 		self.uiElements['checkbox_Onset'].status = status 
 		self.uiElements['checkbox_Onset'].grid(row=1, column=2, sticky = 'w')
 		status = tk.BooleanVar() #Reset to "decouple" from the previous status variable
@@ -594,7 +945,7 @@ class smGuiTimeline(tk.Frame):
 		self.uiElements['checkbox_Duration'] = tk.Checkbutton(self.uiElements['tabTimeline_EventDisplayFrame'], \
 											  text='Duration', variable=status,\
 											  onvalue = True, offvalue = False,\
-											  command = self.repaintCanvasTimeline)
+											  command = self.callbackShowHideLabels)
 		self.uiElements['checkbox_Duration'].status = status 
 		self.uiElements['checkbox_Duration'].grid(row=1, column=3, sticky = 'w')
 		status = tk.BooleanVar() #Reset to "decouple" from the previous status variable
@@ -602,7 +953,7 @@ class smGuiTimeline(tk.Frame):
 		self.uiElements['checkbox_End'] = tk.Checkbutton(self.uiElements['tabTimeline_EventDisplayFrame'], \
 											  text='End', variable=status,\
 											  onvalue = True, offvalue = False,\
-											  command = self.repaintCanvasTimeline)
+											  command = self.callbackShowHideLabels)
 		self.uiElements['checkbox_End'].status = status 
 		self.uiElements['checkbox_End'].grid(row=1, column=4, sticky = 'w')
 		self.uiElements['button_selectUnits'] = \
@@ -704,8 +1055,11 @@ class smGuiTimeline(tk.Frame):
 					text = 'Remove all conditions')#, command = 'callbackMethodHere')
 		self.uiElements['button_removeAllConditions'].grid(row=0, sticky='e')
 
+		#Only the widgets of the conditions in view are created, and
+		#they are recycled while scrolling.
 		self.uiElements['tabConditions_ConditionsDisplayFrame'] = \
-				sm.gui.smScrollableFrame(self.uiElements['tabConditions'], \
+				sm.gui.smVirtualListFrame(self.uiElements['tabConditions'], \
+						 self._createConditionWidget, self._bindConditionWidget, \
 						 borderwidth = 1, relief = 'sunken', \
 						 text = 'Conditions list', padx = 5, pady = 5)
 		self.uiElements['tabConditions_ConditionsDisplayFrame'].grid(row=1, sticky='nswe')
@@ -713,22 +1067,7 @@ class smGuiTimeline(tk.Frame):
 		self.uiElements['label_NoConditions2'] = \
 			 tk.Label(self.uiElements['tabConditions_ConditionsDisplayFrame'], \
 										  text='There are no conditions', anchor="w")
-		self.uiElements['label_NoConditions2'].pack(side='top', fill='x')
-		if len(self.currentTimeline.conditions) != 0:
-			self.uiElements['label_NoConditions2'].pack_forget()
-				#Labels do not have the visible property, so the way to
-				#hide it is using pack_forget
-		for cond in self.currentTimeline.conditions:
-			tmpUIElemTag = 'condWidget_' + str(cond.id)
-			condEvents = self.currentTimeline.getConditionsEvents(cond)
-			self.uiElements[tmpUIElemTag] = smGuiConditionWidget( \
-								self.uiElements['tabConditions_ConditionsDisplayFrame'].scrollableFrame, \
-											  condition=cond, \
-											  events = condEvents)
-			self.uiElements[tmpUIElemTag].pack(fill='x', expand = 1, pady=5)
-			#Register observer to update the timeline if
-			#the condition is updated
-			self.uiElements[tmpUIElemTag].bindConditionObserver(self.on_update_conditionWidget)
+		self.repaintConditionsDisplayFrame()
 		
 		
 		
@@ -753,6 +1092,7 @@ class smGuiTimeline(tk.Frame):
 #								 master=self.uiElements['canvasFrame_Overlapping'])  # A tk.DrawingArea.
 		self.uiElements['canvas_Overlapping'] = FigureCanvasTkAgg(fig, \
 								 master=self.uiElements['tabOverlapping'])  # A tk.DrawingArea.
+		self.uiElements['canvas_Overlapping'].mpl_connect('draw_event', self.on_draw_canvas)
 		self.uiElements['canvas_Overlapping'].draw()
 # 		self.uiElements['canvasToolbar_Overlapping'] = NavigationToolbar2Tk(\
 # 								 self.uiElements['canvas_Overlapping'], \
@@ -831,6 +1171,7 @@ class smGuiTimeline(tk.Frame):
 			#warnings.warn(msg,SyntaxWarning)
 			raise ValueError(msg)
 		self.__currentTimeline = newTimeline
+		self.__flagTimelineStale = True
 		return None
 
 	@property
@@ -907,6 +1248,256 @@ class smGuiTimeline(tk.Frame):
 
 
 	#Protected methods
+	def _bindConditionWidget(self, widget, idx):
+		'''
+		Fills a condition widget of the conditions list (uiElement
+		'tabConditions_ConditionsDisplayFrame') with the condition of
+		a row and its events.
+		
+		The events are only retrieved when the row comes into view.
+		
+		:param widget: The condition widget
+		:type widget: :class:`smGuiConditionWidget`
+		:param idx: The row of the conditions list
+		:type idx: int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		condId = self.__conditionsList[idx]
+		cond = copy.deepcopy(self.currentTimeline.conditionsView[condId])
+		widget.setCondition(cond, self.currentTimeline.getConditionsEvents(condId))
+		return None
+
+	def _blitCanvas(self, canvasTag):
+		'''
+		Redraws only the persistent (animated) artists of a canvas over
+		its cached background, and blits the axes.
+		
+		If there is no cached background yet, e.g. the canvas has not
+		been drawn, a full redraw of the canvas is requested instead.
+		
+		:param canvasTag: The uiElement tag of the canvas; either
+			'canvas_Timeline' or 'canvas_Overlapping'.
+		:type canvasTag: str
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		tmpCanvas = self.uiElements[canvasTag]
+		tmpAxes   = self.uiElements[smGuiTimeline.__BLITTEDCANVASES[canvasTag]]
+		background = self.__canvasBackgrounds.get(canvasTag)
+		if background is None:
+			tmpCanvas.draw_idle()
+			return None
+		tmpCanvas.restore_region(background)
+		for artist in self._getAnimatedArtists(canvasTag).values():
+			tmpAxes.draw_artist(artist)
+		tmpCanvas.blit(tmpAxes.bbox)
+		return None
+
+	def _createConditionWidget(self, parent):
+		'''
+		Creates a new condition widget for the conditions list
+		(uiElement 'tabConditions_ConditionsDisplayFrame').
+		
+		:param parent: The container of the widget
+		:type parent: Container
+		
+		:return: The condition widget
+		:rtype: :class:`smGuiConditionWidget`
+		'''
+		widget = smGuiConditionWidget(parent)
+		#Register observer to update the timeline if
+		#the condition is updated
+		widget.bindConditionObserver(self.on_update_conditionWidget)
+		widget.bindEventsObserver(self.on_update_conditionWidgetEvents)
+		return widget
+
+	def _drawTimelineEvents(self, conditionIds = None):
+		'''
+		Draws the events within the visible range of the events axes
+		(uiElement 'axes_eventsDisplay').
+		
+		For each condition, only the events intersecting the visible
+		range are drawn, as a single collection which replaces the
+		previous one of the condition. If a condition has more visible
+		events than pixels in the axes, the events are aggregated into
+		density bars; each bar covers a pixel and its height is
+		proportional to the number of events within it.
+		
+		The collections are animated artists kept by condition id, so
+		that they can be blitted.
+		
+		:param conditionIds: Optional. The ids of the conditions to
+			redraw. By default, all the conditions are redrawn.
+		:type conditionIds: list of int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		tmpAxes = self.uiElements['axes_eventsDisplay']
+		if conditionIds is not None:
+			conditionIds = set(conditionIds)
+		x0, x1 = tmpAxes.get_xlim()
+		nPixels = max(int(tmpAxes.bbox.width), 1)
+		nConditions = len(self.__conditionsEvents)
+		cmap = plt.get_cmap('jet', max(nConditions, 1))
+			#lut is the number of colors. However, to access the
+			#such number of levels, call cmap.N
+		for idx, (condId, condTag, ids, onsets, durations, ends) in \
+				enumerate(self.__conditionsEvents):
+			if conditionIds is not None and condId not in conditionIds:
+				continue
+			#Cull the events outside the visible range
+			tmp = (ends >= x0) & (onsets <= x1)
+			ids, onsets, durations, ends = ids[tmp], onsets[tmp], durations[tmp], ends[tmp]
+			self.__visibleEvents[condId] = (ids, onsets, durations, ends)
+			pos = idx+1
+			#colorIdx = float(idx)/cmap.N
+			colorIdx = idx
+			if len(ids) > nPixels:
+				#Level of detail; count the events within each pixel
+				#from the impulses at their first and last pixels.
+				bins = np.linspace(x0, x1, nPixels + 1)
+				first = np.clip(np.searchsorted(bins, onsets, side = 'right') - 1, 0, nPixels - 1)
+				last = np.clip(np.searchsorted(bins, ends, side = 'right') - 1, 0, nPixels - 1)
+				impulses = np.zeros(nPixels + 1)
+				np.add.at(impulses, first, 1)
+				np.add.at(impulses, last + 1, -1)
+				density = np.cumsum(impulses[:-1])
+				tmp = np.flatnonzero(density)
+				heights = 0.8 * density[tmp] / density.max()
+				left = bins[tmp]
+				right = bins[tmp + 1]
+				verts = np.empty((len(tmp), 4, 2))
+				verts[:, :, 0] = np.stack((left, right, right, left), axis = 1)
+				verts[:, 0, 1] = pos-0.4
+				verts[:, 1, 1] = pos-0.4
+				verts[:, 2, 1] = pos-0.4 + heights
+				verts[:, 3, 1] = pos-0.4 + heights
+			else:
+				verts = np.empty((len(ids), 4, 2))
+				verts[:, :, 0] = np.stack((onsets, ends, ends, onsets), axis = 1)
+				verts[:, :, 1] = [pos-0.4, pos-0.4, pos+0.4, pos+0.4]
+			artist = self.__timelineArtists.pop(('condition', condId), None)
+			if artist is not None:
+				artist.remove()
+			self.__timelineArtists[('condition', condId)] = \
+					tmpAxes.add_collection(PolyCollection(verts, \
+						facecolors = cmap(colorIdx), edgecolors = cmap(colorIdx), \
+						animated = True), autolim = False)
+		self._drawTimelineLabels(conditionIds)
+		return None
+
+	def _drawTimelineLabels(self, conditionIds = None):
+		'''
+		Draws the labels of the visible events in the events axes
+		(uiElement 'axes_eventsDisplay'), showing only the information
+		checked.
+		
+		The labels are only shown if at most __MAXLABELLEDEVENTS events
+		are visible. The labels are animated artists kept by condition
+		and event id; existing labels are updated in place, and those
+		no longer needed are removed.
+		
+		:param conditionIds: Optional. The ids of the conditions whose
+			labels are to be redrawn. By default, the labels of all the
+			conditions are redrawn. All the labels are also redrawn if
+			the labels are switched on or off.
+		:type conditionIds: set of int
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		tmpAxes = self.uiElements['axes_eventsDisplay']
+		x0 = tmpAxes.get_xlim()[0]
+		labelFlags = [self.uiElements[tmpUIElemTag].status.get() for tmpUIElemTag in \
+					  ['checkbox_Id', 'checkbox_Onset', 'checkbox_Duration', 'checkbox_End']]
+		nVisible = sum([len(ids) for ids, _, _, _ in self.__visibleEvents.values()])
+		flagLabels = any(labelFlags) and nVisible <= smGuiTimeline.__MAXLABELLEDEVENTS
+		if flagLabels != self.__flagTimelineLabels:
+			conditionIds = None
+		self.__flagTimelineLabels = flagLabels
+		keptLabels = set()
+		if flagLabels:
+			for idx, (condId, _, _, _, _, _) in enumerate(self.__conditionsEvents):
+				if conditionIds is not None and condId not in conditionIds:
+					continue
+				pos = idx+1
+				ids, onsets, durations, ends = self.__visibleEvents[condId]
+				for evId, onset, duration, end in zip(ids.tolist(), \
+						onsets.tolist(), durations.tolist(), ends.tolist()):
+					lines = ['id = ' + str(evId), 'o = ' + str(onset), \
+							 'd = ' + str(duration), 'e = ' + str(end)]
+					s = '\n'.join([line for line, flag in zip(lines, labelFlags) if flag])
+					key = ('label', condId, evId)
+					artist = self.__timelineArtists.get(key)
+					if artist is None:
+						self.__timelineArtists[key] = tmpAxes.text(x = max(onset, x0), \
+								 y = pos+0.35, s = s, color = 'w', \
+								 verticalalignment = 'top', clip_on = True, \
+								 animated = True)
+					else:
+						artist.set_text(s)
+						artist.set_position((max(onset, x0), pos+0.35))
+					keptLabels.add(key)
+		#Remove the labels no longer shown
+		for key in [key for key in self.__timelineArtists \
+					if key[0] == 'label' and key not in keptLabels \
+					and (conditionIds is None or key[1] in conditionIds)]:
+			self.__timelineArtists.pop(key).remove()
+		return None
+
+	def _getAnimatedArtists(self, canvasTag):
+		'''
+		Gets the persistent (animated) artists of a canvas.
+		
+		:param canvasTag: The uiElement tag of the canvas; either
+			'canvas_Timeline' or 'canvas_Overlapping'.
+		:type canvasTag: str
+		
+		:return: The artists of the canvas keyed by condition and/or
+			event id. This is not a copy.
+		:rtype: dict
+		'''
+		if canvasTag == 'canvas_Timeline':
+			return self.__timelineArtists
+		return self.__overlappingArtists
+
+	def _getConditionsEventsArrays(self, conditionIds = None):
+		'''
+		Gets the events of every condition of the current timeline as
+		arrays, without building the event objects.
+		
+		:param conditionIds: Optional. The ids of the conditions whose
+			events are to be retrieved. By default, the events of all the
+			conditions are retrieved.
+		:type conditionIds: set of int
+		
+		:return: A list with one tuple (condition id, condition tag, ids,
+			onsets, durations, ends) per condition, sorted by condition id.
+			The events' ids, onsets, durations and ends are
+			numpy.ndarray.
+		:rtype: list of tuple
+		'''
+		theTimeline = self.currentTimeline
+		eventsView = theTimeline.eventsView
+		ids = eventsView['ids']
+		order = np.argsort(ids)
+		res = list()
+		for condId, cond in sorted(theTimeline.conditionsView.items()):
+			if conditionIds is not None and condId not in conditionIds:
+				continue
+			condEventsIds = np.fromiter(theTimeline.getConditionsEvents( \
+								condId, flagOnlyIDs = True), dtype = np.int64)
+			positions = order[np.searchsorted(ids, condEventsIds, sorter = order)] \
+							if len(condEventsIds) > 0 else condEventsIds
+			res.append((condId, cond.tag, ids[positions], \
+						eventsView['onsets'][positions], \
+						eventsView['durations'][positions], \
+						eventsView['ends'][positions]))
+		return res
 
 	#Public methods
 	def getClassName(self):
@@ -937,6 +1528,8 @@ class smGuiTimeline(tk.Frame):
 			tk.messagebox.showwarning('Warning',str(w))
 		except Exception as e:
 			tk.messagebox.showerror('Error',str(e))
+		#The new condition adds a row to the timeline canvas
+		self.__flagTimelineStale = True
 		self.repaintConditionsDisplayFrame()
 		return None
 	
@@ -958,6 +1551,22 @@ class smGuiTimeline(tk.Frame):
 		return None
 
 
+	def callbackShowHideLabels(self):
+		'''
+		Callback method for the show/hide checkboxes `checkbox_Id`,
+		`checkbox_Onset`, `checkbox_Duration` and `checkbox_End`.
+		
+		Only the labels of the events are updated, and blitted over
+		the rest of the timeline canvas.
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		self._drawTimelineLabels()
+		self._blitCanvas('canvas_Timeline')
+		return None
+
+
 	def callbackSwitchTimeUnits(self):
 		'''
 		Callback method for the `button_addNewCondition`.
@@ -978,6 +1587,27 @@ class smGuiTimeline(tk.Frame):
 		return None
 	
 	
+	def on_draw_canvas(self, event):
+		'''
+		Callback for the full redraws of the canvases updated by
+		blitting. Caches the background of the axes, and draws the
+		persistent (animated) artists on top of it.
+		
+		:param event: The draw event.
+		:type event: :class:`matplotlib.backend_bases.DrawEvent`
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		for canvasTag, axesTag in smGuiTimeline.__BLITTEDCANVASES.items():
+			if self.uiElements.get(canvasTag) is event.canvas:
+				tmpAxes = self.uiElements[axesTag]
+				self.__canvasBackgrounds[canvasTag] = \
+							event.canvas.copy_from_bbox(tmpAxes.bbox)
+				for artist in self._getAnimatedArtists(canvasTag).values():
+					tmpAxes.draw_artist(artist)
+		return None
+
 	def on_exit(self):
 		'''
 		Closes the window and exit
@@ -997,13 +1627,26 @@ class smGuiTimeline(tk.Frame):
 		'''
 		Updates the tabs contents upon changing tab focus.
 		
+		The timeline canvas is only repainted if its conditions have
+		changed, e.g. a new condition was added. Otherwise, the edits
+		to the conditions have already been drawn, and the canvas is
+		just blitted.
+		
 		:return: None
 		:rtype: NoneType
 		'''
 		selected_tab = event.widget.select()
 		tab_text = event.widget.tab(selected_tab, 'text')
 		if tab_text == 'Timeline':
-			self.repaintCanvasTimeline()
+			theConditions = self.currentTimeline.conditionsView
+			labelStr = [str(condId) + ':' + theConditions[condId].tag \
+						for condId in sorted(theConditions)]
+			if self.__flagTimelineStale or labelStr != \
+					[str(condId) + ':' + condTag \
+					 for condId, condTag, _, _, _, _ in self.__conditionsEvents]:
+				self.repaintCanvasTimeline()
+			else:
+				self._blitCanvas('canvas_Timeline')
 		if tab_text == 'Conditions':
 			pass
 		if tab_text == 'Overlapping':
@@ -1021,6 +1664,84 @@ class smGuiTimeline(tk.Frame):
 		:rtype: NoneType
 		'''
 		self.currentTimeline.setConditions(theId,theCondition)
+		if theId != theCondition.id:
+			#The rows of the conditions list are sorted by id. Wait
+			#for the condition widget to finish applying the changes.
+			self.after_idle(self.repaintConditionsDisplayFrame)
+		#Update only the row of the condition, unless the rows
+		#need to be reordered.
+		condIds = [condId for condId, _, _, _, _, _ in self.__conditionsEvents]
+		if theId not in condIds:
+			self.repaintCanvasTimeline()
+			return None
+		idx = condIds.index(theId)
+		condIds[idx] = theCondition.id
+		if condIds != sorted(condIds):
+			self.repaintCanvasTimeline()
+			return None
+		_, oldTag, ids, onsets, durations, ends = self.__conditionsEvents[idx]
+		self.__conditionsEvents[idx] = (theCondition.id, theCondition.tag, \
+										ids, onsets, durations, ends)
+		if theId != theCondition.id:
+			#Re-key the artists of the condition
+			self.__visibleEvents.pop(theId, None)
+			for key in [key for key in self.__timelineArtists if key[1] == theId]:
+				self.__timelineArtists.pop(key).remove()
+			self._drawTimelineEvents([theCondition.id])
+		if theId != theCondition.id or oldTag != theCondition.tag:
+			#The ticks are outside the blitted axes
+			self.uiElements['axes_eventsDisplay'].set_yticklabels( \
+					labels = [str(condId) + ':' + condTag \
+						for condId, condTag, _, _, _, _ in self.__conditionsEvents])
+			self.uiElements['canvas_Timeline'].draw_idle()
+		return None
+
+	def on_update_conditionWidgetEvents(self, eventIDs, events):
+		'''
+		Observer of smGuiConditionWidgets so that the timeline
+		updates the events edited in the widget.
+		
+		Only the rows of the conditions of the edited events are
+		updated and blitted.
+		
+		:param eventIDs: The ids of the edited events
+		:type eventIDs: list of int
+		:param events: The edited events
+		:type events: list of :class:`smTimelineEvents <scimeth.data.smTimelineEvent>`
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		theTimeline = self.currentTimeline
+		theTimeline.setEvents(list(eventIDs), list(events))
+		#The edited events may have changed their ids
+		condIds = theTimeline.getEventsConditions([ev.id for ev in events], \
+												  flagOnlyIDs = True)
+		if len(condIds) == 0:
+			return None
+		newArrays = dict([(elem[0], elem) for elem in \
+						  self._getConditionsEventsArrays(condIds)])
+		for idx, elem in enumerate(self.__conditionsEvents):
+			if elem[0] in newArrays:
+				self.__conditionsEvents[idx] = newArrays[elem[0]]
+		self._drawTimelineEvents(list(condIds))
+		self._blitCanvas('canvas_Timeline')
+		return None
+
+	def on_xlim_changed(self, axes):
+		'''
+		Callback for changes in the visible range of the events axes
+		(uiElement 'axes_eventsDisplay'), e.g. zoom and pan. Redraws the
+		events within the new visible range.
+		
+		:param axes: The axes whose limits changed.
+		:type axes: :class:`matplotlib.axes.Axes`
+		
+		:return: None
+		:rtype: NoneType
+		'''
+		self._drawTimelineEvents()
+		self.uiElements['canvas_Timeline'].draw_idle()
 		return None
 
 	def repaintCanvasOverlapping(self):
@@ -1032,31 +1753,51 @@ class smGuiTimeline(tk.Frame):
 		:class:`smTimelineConditions <scimeth.data.smTimelineCondition>`
 		in the :class:`smTimeline <scimeth.data.smTimeline>`.
 		
+		If the conditions have not changed since the last repaint, only
+		the overlapping status image is updated and blitted.
+		
 		:return: None
 		:rtype: NoneType
 		'''
 		tmpCanvas = self.uiElements['canvas_Overlapping']
 		#tmpFig    = self.uiElements['figure_overlappingDisplay']
 		tmpAxes   = self.uiElements['axes_overlappingDisplay']
+
+		#Convert list of overlapping pairs to array
+		theTimeline = self.currentTimeline
+		condIds = sorted(theTimeline.conditionsView)
+		nConditions = len(condIds)
+		tmpOverlapStatusArray = theTimeline.NON_OVERLAP \
+								* np.ones((nConditions,nConditions),dtype=float)
+		condIdx = dict([(condId, idx) for idx, condId in enumerate(condIds)])
+		for pair in theTimeline.overlapStatus:
+			idx1 = condIdx[pair[0]]
+			idx2 = condIdx[pair[1]]
+			tmpOverlapStatusArray[idx1,idx2] = theTimeline.OVERLAP
+			tmpOverlapStatusArray[idx2,idx1] = theTimeline.OVERLAP
+		#Collect conditions ids and tags
+		labelStr = [str(condId) + ':' + theTimeline.conditionsView[condId].tag \
+					for condId in condIds]
+		
+		#If the conditions are the same, only the overlapping status
+		#may have changed; update the image and blit it.
+		tmpImage = self.__overlappingArtists.get('overlapStatus')
+		if tmpImage is not None and labelStr == self.__overlappingLabels:
+			tmpImage.set_data(tmpOverlapStatusArray)
+			self._blitCanvas('canvas_Overlapping')
+			return None
+		
 		#Clear axes
 		tmpAxes.cla()
+		self.__overlappingArtists = dict() #Already removed by cla()
+		self.__overlappingLabels = labelStr
 		#tmpAxes.patch.set_facecolor('blue')
 		tmpAxes.patch.set_alpha(0.0) #Not working. But apparently
 									 #this is a know bug.
 									 #https://github.com/matplotlib/matplotlib/issues/9007
 
-		#Convert list of overlapping pairs to array
-		nConditions = len(self.currentTimeline.conditions)
-		tmpOverlapStatusArray = self.currentTimeline.NON_OVERLAP \
-								* np.ones((nConditions,nConditions),dtype=float)
-		condIds = self.currentTimeline.getConditionsID()
-		for pair in self.currentTimeline.overlapStatus:
-			idx1 = condIds.index(pair(0))
-			idx2 = condIds.index(pair(1))
-			tmpOverlapStatusArray[idx1,idx2] = self.currentTimeline.OVERLAP
-
 		#Choose colormap
-		cmap = plt.cm.get_cmap(name = 'bwr', lut = 2)
+		cmap = plt.get_cmap('bwr', 2)
 			#lut is the number of colors. However, to access the
 			#such number of levels, call cmap.N
 		#Redraw overlapping status
@@ -1064,14 +1805,13 @@ class smGuiTimeline(tk.Frame):
 # 				extent=[0.5, nConditions+0.5, 0.5, nConditions+0.5], \
 # 				cmap = cmap)
 		if nConditions != 0:
-			tmpAxes.imshow(tmpOverlapStatusArray, \
-					origin = 'upper', cmap = cmap)
+			self.__overlappingArtists['overlapStatus'] = \
+				tmpAxes.imshow(tmpOverlapStatusArray, \
+					origin = 'upper', cmap = cmap, \
+					vmin = float(theTimeline.NON_OVERLAP), \
+					vmax = float(theTimeline.OVERLAP), animated = True)
 				#Note: There is also matshow but it is actually a wrapper over
 				#imshow with some predifined settings.
-		#Collect conditions ids and tags
-		labelStr = list()
-		for cond in self.currentTimeline.conditions:
-			labelStr.append(str(cond.id) + ':' + cond.tag)
 		
 		#Beautify
 		tmpAxes.set_xlabel('Conditions')
@@ -1105,39 +1845,13 @@ class smGuiTimeline(tk.Frame):
 									 #this is a know bug.
 									 #https://github.com/matplotlib/matplotlib/issues/9007
 
-		#Choose colormap
-		nConditions = len(self.currentTimeline.conditions)
-		cmap = plt.cm.get_cmap(name = 'jet', \
-							   lut = nConditions)
-			#lut is the number of colors. However, to access the
-			#such number of levels, call cmap.N
-		#Redraw events
-		pos=0
-		labelStr = list()
-		for idx, cond in enumerate(self.currentTimeline.conditions):
-			labelStr.append(str(cond.id) + ':' + cond.tag)
-			condEvents = self.currentTimeline.getConditionsEvents(cond)
-			pos=idx+1
-			for ev in condEvents:
-				#colorIdx = float(idx)/cmap.N
-				colorIdx = idx
-				tmpAxes.fill([ev.onset, ev.end, ev.end, ev.onset],\
-							 [pos-0.4, pos-0.4, pos+0.4, pos+0.4],\
-							 color = cmap(colorIdx))
-				#Show/Hide event information
-				s = 'id = ' + str(ev.id)
-				tmp = tmpAxes.text(x = ev.onset, y = pos+0.3, s = s, \
-						   color = 'w')
-				tmp.set_visible(self.uiElements['checkbox_Id'].status.get())
-				s = 'o = ' + str(ev.onset)
-				tmp = tmpAxes.text(x = ev.onset, y = pos+0.1, s = s, color = 'w')
-				tmp.set_visible(self.uiElements['checkbox_Onset'].status.get())
-				s = 'd = ' + str(ev.duration)
-				tmp = tmpAxes.text(x = ev.onset, y = pos-0.1, s = s, color = 'w')
-				tmp.set_visible(self.uiElements['checkbox_Duration'].status.get())
-				s = 'e = ' + str(ev.end)
-				tmp = tmpAxes.text(x = ev.onset, y = pos-0.3, s = s, color = 'w')
-				tmp.set_visible(self.uiElements['checkbox_End'].status.get())
+		self.__timelineArtists = dict() #Already removed by cla()
+		self.__visibleEvents = dict()
+		self.__conditionsEvents = self._getConditionsEventsArrays()
+		nConditions = len(self.__conditionsEvents)
+		pos = nConditions
+		labelStr = [str(condId) + ':' + condTag \
+					for condId, condTag, _, _, _, _ in self.__conditionsEvents]
 		
 		#Beautify
 		if self.currentTimeline.unit.name == 'Sample':
@@ -1152,7 +1866,15 @@ class smGuiTimeline(tk.Frame):
 		tmpAxes.set_ylabel('Conditions')
 		tmpAxes.set_yticks(ticks = list(range(1,nConditions+1)))
 		tmpAxes.set_yticklabels(labels = labelStr)
+		#Draw the visible events, and redraw them on zoom and pan.
+		#Note that cla() disconnects the callbacks.
+		self._drawTimelineEvents()
+		tmpAxes.callbacks.connect('xlim_changed', self.on_xlim_changed)
+		toolbar = self.uiElements.get('canvasToolbar_Timeline')
+		if toolbar is not None:
+			toolbar.update() #Reset the home view of the toolbar
 		tmpCanvas.draw()
+		self.__flagTimelineStale = False
 		return None
 	
 	
@@ -1163,31 +1885,26 @@ class smGuiTimeline(tk.Frame):
 		within the uiElement 'tabConditions' which
 		is the one displaying the conditions list.
 		
+		The list is virtual; only the conditions in view have a
+		:class:`smGuiConditionWidget` and their events are
+		retrieved when they come into view.
+		
 		:return: None
 		:rtype: NoneType
 		'''
+		tmpFrame = self.uiElements['tabConditions_ConditionsDisplayFrame']
+		self.__conditionsList = sorted(self.currentTimeline.conditionsView)
 		#Labels do not have the visible property, so the way to
 		#hide it is using pack_forget
-		if len(self.currentTimeline.conditions) == 0:
-			self.uiElements['label_NoConditions2'].pack()
+		if len(self.__conditionsList) == 0:
+			self.uiElements['label_NoConditions2'].pack(side='top', fill='x', \
+											before = tmpFrame.canvas)
 		else:
 			self.uiElements['label_NoConditions2'].pack_forget()
-		for cond in self.currentTimeline.conditions:
-			tmpUIElemTag = 'condWidget_' + str(cond.id)
-			if tmpUIElemTag in self.uiElements:
-				pass
-			else:
-				condEvents = self.currentTimeline.getConditionsEvents(cond)
-				self.uiElements[tmpUIElemTag] = \
-					 smGuiConditionWidget(self.uiElements['tabConditions_ConditionsDisplayFrame'].scrollableFrame, \
-												  condition=cond, \
-												  events = condEvents)
-				self.uiElements[tmpUIElemTag].pack(fill='x', pady=5)
-				#Register observer to update the timeline if
-				#the condition is updated
-				self.uiElements[tmpUIElemTag].bindConditionObserver(self.on_update_conditionWidget)
-
-		return
+		#Only the conditions in view are bound to a widget; widgets
+		#of conditions no longer in the list are recycled.
+		tmpFrame.nRows = len(self.__conditionsList)
+		return None
 	
 	def runEventMainLoop(self):
 		'''
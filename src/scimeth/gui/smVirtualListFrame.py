@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+#
+#File: smVirtualListFrame.py
+#
+'''
+Created on Sun Oct 18 16:12:05 2026
+
+Module ***smVirtualListFrame***
+
+This module implements the class :class:`smVirtualListFrame <scimeth.gui.smVirtualListFrame>`.
+
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Class :class:`smVirtualListFrame` created.         |
++-------------+--------+------------------------------------------------------+
+
+
+
+.. seealso::
+
+	:class:`smScrollableFrame <scimeth.gui.smScrollableFrame>`,
+	:class:`smGuiTimeline <scimeth.gui.smGuiTimeline>`
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+'''
+import math
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class smVirtualListFrame(tk.LabelFrame):
+	'''A :class:`smVirtualListFrame <scimeth.gui.smVirtualListFrame>`
+	provides a vertically scrollable list of rows of widgets in which
+	only the rows in view are instantiated.
+
+	As in :class:`smScrollableFrame <scimeth.gui.smScrollableFrame>`,
+	the rows are laid on a Canvas. However, rather than packing one
+	widget per row, the list only keeps a pool of widgets to cover the
+	rows in view. While scrolling, the widgets of the rows leaving the
+	view are recycled for the rows entering it. The rows must be
+	of the same height.
+
+	The content of the rows is provided by two callables:
+
+	* rowFactory(parent) creates a new (unbound) row widget.
+	* rowBinder(widget, index) fills the widget with the content
+		of row index.
+
+	'''
+	#Private class attributes shared by all instances
+
+
+	#Class constructor
+	def __init__(self, parent, rowFactory, rowBinder, *args, \
+				 rowHeight = None, **kwargs):
+		'''Class constructor. Creates a new instance of
+		:class:`smVirtualListFrame <scimeth.gui.smVirtualListFrame>`.
+
+		:param parent: Container frame or window
+		:type parent: Container frame or window
+		:param rowFactory: Creates a new row widget. It receives the
+			parent of the widget.
+		:type rowFactory: callable
+		:param rowBinder: Fills a row widget with the content of a row.
+			It receives the widget and the index of the row.
+		:type rowBinder: callable
+		:param rowHeight: Optional. The height of the rows in pixels. By
+			default, it is the requested height of the first widget
+			created.
+		:type rowHeight: int
+		'''
+		super().__init__(parent, *args, **kwargs)
+		self.__rowFactory = rowFactory
+		self.__rowBinder = rowBinder
+		self.__rowHeight = rowHeight
+		self.__nRows = 0
+		self.__boundWidgets = dict() #Row index -> (widget, canvas window)
+		self.__freeWidgets = list() #Recycled (widget, canvas window)
+
+		self.canvas = tk.Canvas(self)
+		vscrollbar = ttk.Scrollbar(self, orient='vertical', command=self.on_yview)
+		self.canvas.configure(yscrollcommand = vscrollbar.set)
+		self.canvas.bind('<Configure>', lambda e: self.refresh(flagRebind = False))
+		vscrollbar.pack(side = 'right', fill = 'y')
+		self.canvas.pack(side = 'left', fill = 'both', expand = True)
+		return
+
+
+	#Properties getters/setters
+	#
+	# Remember: Sphinx ignores docstrings on property setters so all
+	#documentation for a property must be on the @property method
+
+	@property
+	def nRows(self): #nRows getter
+		'''
+		The number of rows in the list.
+
+		Setting the number of rows rebinds the rows in view.
+
+		:getter: Gets the number of rows.
+		:setter: Sets the number of rows.
+		:type: int
+		'''
+		return self.__nRows
+
+	@nRows.setter
+	def nRows(self,newNRows): #nRows setter
+		if type(newNRows) is not int or newNRows < 0:
+			msg = self.getClassName() + ':nRows: Unexpected attribute type or value.'
+			raise ValueError(msg)
+		self.__nRows = newNRows
+		self.refresh()
+		return None
+
+	@property
+	def widgets(self): #widgets getter
+		'''
+		The row widgets currently bound by row index. This is a
+		read-only property.
+
+		:getter: Gets a dictionary of the bound row widgets.
+		:type: dict
+		'''
+		return dict([(idx, widget) for idx, (widget, _) \
+						in self.__boundWidgets.items()])
+
+
+	#Protected methods
+	def _getRowsInView(self):
+		'''
+		Gets the range of rows in view.
+
+		:return: The first and the (exclusive) last row in view.
+		:rtype: tuple of int
+		'''
+		top = self.canvas.canvasy(0)
+		height = max(self.canvas.winfo_height(), 1)
+		first = max(int(top // self.__rowHeight), 0)
+		last = min(int(math.ceil((top + height) / self.__rowHeight)), self.__nRows)
+		return first, max(first, last)
+
+	def _getWidget(self):
+		'''
+		Gets a widget for a row, either recycled or new.
+
+		:return: The widget and its canvas window.
+		:rtype: tuple
+		'''
+		if len(self.__freeWidgets) > 0:
+			widget, window = self.__freeWidgets.pop()
+			self.canvas.itemconfigure(window, state = 'normal')
+			return widget, window
+		widget = self.__rowFactory(self.canvas)
+		window = self.canvas.create_window((0, 0), window = widget, anchor = 'nw')
+		return widget, window
+
+
+	#Public methods
+	def getClassName(self):
+		'''Gets the class name.
+
+		:return: The class name
+		:rtype: str
+		'''
+		return type(self).__name__
+
+	def on_yview(self, *args):
+		'''
+		Callback for the vertical scrollbar. Scrolls the canvas and
+		binds the rows entering the view.
+
+		:return: None
+		:rtype: NoneType
+		'''
+		self.canvas.yview(*args)
+		self.refresh(flagRebind = False)
+		return None
+
+	def refresh(self, flagRebind = True):
+		'''
+		Places and binds the widgets of the rows in view.
+
+		Widgets of the rows no longer in view are hidden and kept for
+		recycling.
+
+		:param flagRebind: Optional. If True (default), the rows
+			already in view are also rebound e.g. because the content
+			of the rows changed. If False, only the rows entering the
+			view are bound.
+		:type flagRebind: bool
+
+		:return: None
+		:rtype: NoneType
+		'''
+		if self.__rowHeight is None:
+			if self.__nRows == 0:
+				return None
+			#Measure the rows from the first widget
+			widget, window = self._getWidget()
+			self.__rowBinder(widget, 0)
+			widget.update_idletasks()
+			self.__rowHeight = max(widget.winfo_reqheight(), 1)
+			self.__boundWidgets[0] = (widget, window)
+			flagRebind = False #It is the only row bound so far
+		self.canvas.configure(scrollregion = (0, 0, \
+				self.canvas.winfo_width(), self.__nRows * self.__rowHeight))
+		first, last = self._getRowsInView()
+		#Release the widgets of the rows leaving the view
+		for idx in [idx for idx in self.__boundWidgets if not first <= idx < last]:
+			widget, window = self.__boundWidgets.pop(idx)
+			self.canvas.itemconfigure(window, state = 'hidden')
+			self.__freeWidgets.append((widget, window))
+		width = self.canvas.winfo_width()
+		for idx in range(first, last):
+			if idx in self.__boundWidgets:
+				widget, window = self.__boundWidgets[idx]
+				if flagRebind:
+					self.__rowBinder(widget, idx)
+			else:
+				widget, window = self._getWidget()
+				self.__rowBinder(widget, idx)
+				self.__boundWidgets[idx] = (widget, window)
+			self.canvas.coords(window, 0, idx * self.__rowHeight)
+			self.canvas.itemconfigure(window, width = width)
+		return None
@@ -18,6 +18,10 @@ Created on Tue Mar 24 23:42:31 2020
 +-------------+--------+------------------------------------------------------+
 | 15-May-2020 | FOE    | - Added function `methods`.                          |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added functions `multikey_argsort` and             |
+|             |        |   `multikey_sort` for stable lexicographic sorting.  |
+|             |        | - Bug fixing: `quick_sort` now returns the array.    |
++-------------+--------+------------------------------------------------------+
 
 
 .. seealso:: None
@@ -27,6 +31,8 @@ Created on Tue Mar 24 23:42:31 2020
 
 """
 
+import numpy as np
+
 
 def methods(theObject):
 	'''Retrieve the list of methods of the object.
@@ -35,6 +41,80 @@ def methods(theObject):
 	return tmp
 
 
+def multikey_argsort(keys):
+	'''
+	Gets the permutation that sorts lexicographically by several keys.
+	
+	The sort is stable; elements with the same values in all the keys
+	keep their relative order. Numerical keys are sorted at once
+	with :func:`numpy.lexsort`. Otherwise, Python's (stable) sort is
+	used on tuples of keys.
+	
+	:Parameters:
+	
+	keys : sequence of array-like
+		The keys, primary key first. All keys must have the same length.
+
+	:Returns:
+
+	permutation : numpy.ndarray of int
+		The indexes of the elements in sorted order.
+	'''
+	keys = [np.asarray(k) for k in keys]
+	if len(keys) == 0:
+		raise ValueError('multikey_argsort: At least one key is required.')
+	n = len(keys[0])
+	if any(k.shape != (n,) for k in keys):
+		raise ValueError('multikey_argsort: Keys must be 1D and have the same length.')
+	if all(k.dtype.kind in 'biuf' for k in keys):
+		#numpy.lexsort takes the primary key last
+		return np.lexsort(keys[::-1])
+	rows = list(zip(*[k.tolist() for k in keys]))
+	return np.array(sorted(range(n), key = rows.__getitem__), dtype = np.int64)
+
+
+def multikey_sort(items, keys, return_permutation = False):
+	'''
+	Sorts a sequence of objects lexicographically by several keys.
+	
+	The sort is stable (see :func:`multikey_argsort`).
+	
+	:Parameters:
+	
+	items : sequence
+		The objects to be sorted.
+	keys : sequence of str or callable
+		The keys, primary key first. Each key is either the name of an
+		attribute of the objects or a function returning the key of
+		an object.
+	return_permutation : bool, optional
+		If True, the permutation is also returned. The default is False.
+
+	:Returns:
+
+	sortedItems : list
+		The sorted objects.
+	permutation : numpy.ndarray of int
+		The indexes of the objects in sorted order. Only returned if
+		`return_permutation` is True.
+	'''
+	items = list(items)
+	keyArrays = list()
+	for key in keys:
+		if isinstance(key, str):
+			keyArrays.append([getattr(x, key) for x in items])
+		else:
+			keyArrays.append([key(x) for x in items])
+	if len(items) == 0:
+		permutation = np.zeros(0, dtype = np.int64)
+	else:
+		permutation = multikey_argsort(keyArrays)
+	sortedItems = [items[i] for i in permutation]
+	if return_permutation:
+		return sortedItems, permutation
+	return sortedItems
+
+
 def partition(array, start, end, compare_func):
 	'''
 	Splits an array 
@@ -76,6 +156,9 @@ def quick_sort(array, start, end, compare_func):
 	Sort an array of objects according to the object comparing function
 	`compare_func`.
 	
+	The sort is in place and it is not stable. Prefer
+	:func:`multikey_sort`.
+	
 	Algorithm from: https://stackabuse.com/quicksort-in-python/
 	
 	:Parameters:
@@ -95,9 +178,10 @@ def quick_sort(array, start, end, compare_func):
 		The sorted array.
 	'''
 	if start >= end:
-		return
+		return array
 	p = partition(array, start, end, compare_func)
 	quick_sort(array, start, p-1, compare_func)
 	quick_sort(array, p+1, end, compare_func)
+	return array
 
 
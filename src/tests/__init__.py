@@ -45,3 +45,6 @@ from .testSciMethDataSmMeasurementUnit import testSciMethDataSmMeasurementUnit
 from .testSciMethDataSmTimelineEvent import testSciMethDataSmTimelineEvent
 from .testSciMethDataSmTimelineCondition import testSciMethDataSmTimelineCondition
 from .testSciMethDataSmTimeline import testSciMethDataSmTimeline
+from .testSciMethDataSmTimelineEventStore import testSciMethDataSmTimelineEventStore
+from .testSciMethDataSmTimelineMembership import testSciMethDataSmTimelineMembership
+from .testSciMethDataSmMeasurement import testSciMethDataSmMeasurement
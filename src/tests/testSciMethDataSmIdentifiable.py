@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+#File: testSciMethDataSmIdentifiable.py
+#
+"""
+Created on Sun Oct 18 15:16:37 2026
+
+Module ***testSciMethDataSmIdentifiable***
+
+Contains the tests for class :class:`scimeth.data.smIdentifiable`
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Test module created                                |
+|             |        | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_threadSafeIDs`                               |
+|             |        | * `test_partitionIDs`                                |
+|             |        |                                                      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_registry`                                    |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_registryKeepsLiveInstances`                  |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodReserveIDs`                            |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso:: None
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+"""
+
+import sys
+import gc
+import time
+import threading
+import unittest
+import copy
+
+#Add paths
+if not sys.path[0] == '..':
+	sys.path.insert(0, '..')
+
+import scimeth as sm
+
+class testSciMethDataSmIdentifiable(unittest.TestCase):
+	'''A test suite for :class:`smIdentifiable <scimeth.data.smIdentifiable>`
+	'''
+
+
+	def test_threadSafeIDs(self):
+		'''
+		Tests that events constructed in parallel threads get
+		different ids.
+		'''
+		theIDs = list()
+		def createEvents():
+			theIDs.extend([sm.data.smTimelineEvent().id for i in range(2000)])
+		threads = [threading.Thread(target = createEvents) for i in range(4)]
+		for t in threads:
+			t.start()
+		for t in threads:
+			t.join()
+		self.assertEqual(len(set(theIDs)), 8000)
+		first = sm.data.smTimelineEvent.reserveIDs(10)
+		self.assertEqual(sm.data.smTimelineEvent().id, first + 10)
+
+
+
+	def test_partitionIDs(self):
+		'''
+		Tests methods :meth:`partitionIDs` and :meth:`resetIDs`.
+		'''
+		#Use a dedicated class not to interfere with other tests
+		class tmpIdentifiable(sm.data.smIdentifiable):
+			pass
+		tmpIdentifiable.partitionIDs(2, partitionSize = 10)
+		self.assertEqual(tmpIdentifiable().id, 21)
+		self.assertEqual(tmpIdentifiable.reserveIDs(8), 22)
+		self.assertEqual(tmpIdentifiable().id, 30)
+		with self.assertRaises(RuntimeError):
+			tmpIdentifiable()
+		tmpIdentifiable.resetIDs()
+		self.assertEqual(tmpIdentifiable().id, 1)
+		with self.assertRaises(ValueError):
+			tmpIdentifiable.partitionIDs(-1)
+
+
+
+	def test_registry(self):
+		'''
+		Tests the registry of instances by id.
+		'''
+		#Use a dedicated class not to interfere with other tests
+		class tmpEvent(sm.data.smTimelineEvent):
+			__slots__ = ()
+		with self.assertRaises(RuntimeError):
+			tmpEvent.getInstance(1)
+		tmpEvent.enableRegistry()
+		theEvent = tmpEvent(onset = 3)
+		theID = theEvent.id
+		self.assertIs(tmpEvent.getInstance(theID), theEvent)
+		#Registries are per class
+		otherEvent = sm.data.smTimelineEvent()
+		otherEvent.id = theID + 1
+		self.assertIsNone(tmpEvent.getInstance(theID + 1))
+		theEvent.id = theID + 100
+		self.assertIsNone(tmpEvent.getInstance(theID))
+		self.assertIs(tmpEvent.getInstance(theID + 100), theEvent)
+		#Entries disappear when objects are garbage collected
+		del theEvent
+		gc.collect()
+		self.assertIsNone(tmpEvent.getInstance(theID + 100))
+		tmpEvent.enableRegistry(False)
+		with self.assertRaises(RuntimeError):
+			tmpEvent.getInstance(theID)
+
+
+
+	def test_registryKeepsLiveInstances(self):
+		'''
+		Tests that the registry does not overwrite live instances with
+		copies, and that events materialised by a timeline are not
+		registered.
+		'''
+		#Use a dedicated class not to interfere with other tests
+		class tmpEvent(sm.data.smTimelineEvent):
+			__slots__ = ()
+		tmpEvent.enableRegistry()
+		theEvent = tmpEvent(onset = 3)
+		theID = theEvent.id
+		theCopy = copy.deepcopy(theEvent)
+		self.assertIs(tmpEvent.getInstance(theID), theEvent)
+		other = tmpEvent()
+		other.id = theID
+		self.assertIs(tmpEvent.getInstance(theID), theEvent)
+		#...until the registered instance is garbage collected
+		del theEvent
+		gc.collect()
+		self.assertIsNone(tmpEvent.getInstance(theID))
+		other.id = theID
+		self.assertIs(tmpEvent.getInstance(theID), other)
+		del theCopy
+		tmpEvent.enableRegistry(False)
+		#Materialised events are transient copies
+		sm.data.smTimelineEvent.enableRegistry()
+		try:
+			ev = sm.data.smTimelineEvent(onset = 5)
+			theTimeline = sm.data.smTimeline()
+			theTimeline.addEvents(ev)
+			theCopy = theTimeline.getEvents({ev.id}).pop()
+			self.assertIsNot(theCopy, ev)
+			self.assertIs(sm.data.smTimelineEvent.getInstance(ev.id), ev)
+			del ev
+			gc.collect()
+			self.assertIsNone(sm.data.smTimelineEvent.getInstance(theCopy.id))
+		finally:
+			sm.data.smTimelineEvent.enableRegistry(False)
+
+
+
+	def test_methodReserveIDs(self):
+		'''
+		Tests method :meth:`reserveIDs`.
+		'''
+		#Use a dedicated class not to interfere with other tests
+		class tmpIdentifiable(sm.data.smIdentifiable):
+			pass
+		first = tmpIdentifiable().id
+		self.assertEqual(tmpIdentifiable.reserveIDs(100), first + 1)
+		self.assertEqual(tmpIdentifiable().id, first + 101)
+		self.assertEqual(tmpIdentifiable.reserveIDs(0), first + 102)
+		self.assertEqual(tmpIdentifiable().id, first + 102)
+		with self.assertRaises(ValueError):
+			tmpIdentifiable.reserveIDs(-1)
+		with self.assertRaises(ValueError):
+			tmpIdentifiable.reserveIDs(1.5)
+
+
+
+	@staticmethod
+	def runTests():
+		'''
+		Class executable method
+		'''
+		print('TESTING smIdentifiable')
+		#The unittest is faster then the print above. Wait 1/2 sec to ensure messages are print "in order"
+		time.sleep(0.5)
+		t = unittest.TestLoader().loadTestsFromTestCase(testSciMethDataSmIdentifiable)
+		unittest.TextTestRunner(verbosity=2).run(t)
+		#unittest.main(verbosity=2)
+
+if __name__ == '__main__':
+	print(' ')
+	testSciMethDataSmIdentifiable.runTests()
\ No newline at end of file
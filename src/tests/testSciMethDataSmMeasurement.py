@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+#
+#File: testSciMethDataSmMeasurement.py
+#
+"""
+Created on Sun Oct 18 16:20:11 2026
+
+Module ***testSciMethDataSmMeasurement***
+
+Contains the tests for class :class:`scimeth.data.smMeasurement`
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Test module created                                |
+|             |        | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_ObjectConstructionDefaultCall`               |
+|             |        | * `test_ObjectConstructionParameterizedCall`         |
+|             |        | * `test_settingAttributeData`                        |
+|             |        | * `test_methodOpenData`                              |
+|             |        |                                                      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodGetEpochs`                             |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso:: None
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+"""
+
+import sys
+import os
+import time
+import tempfile
+import unittest
+
+import numpy as np
+
+#Add paths
+if not sys.path[0] == '..':
+	sys.path.insert(0, '..')
+
+import scimeth as sm
+
+class testSciMethDataSmMeasurement(unittest.TestCase):
+	'''A test suite for :class:`smMeasurement <scimeth.data.smMeasurement>`
+	'''
+
+
+	def test_ObjectConstructionDefaultCall(self):
+		'''
+		Tests object creation with a default call to constructor.
+		'''
+		theMeasurement = sm.data.smMeasurement()
+		self.assertIsInstance(theMeasurement,sm.data.smMeasurement,\
+		   'Test: Cannot construct object with default call to constructor.')
+		self.assertEqual(theMeasurement.data.shape, (0,0,0))
+
+
+	def test_ObjectConstructionParameterizedCall(self):
+		'''
+		Tests object creation with a parameterized call to constructor.
+		'''
+		theData = np.random.rand(50,3,2)
+		theMeasurement = sm.data.smMeasurement(data = theData)
+		self.assertIs(theMeasurement.data, theData)
+		self.assertEqual(theMeasurement.timeline.length, 50)
+		theTimeline = sm.data.smTimeline(length = 50)
+		theMeasurement = sm.data.smMeasurement(data = theData, \
+											   timeline = theTimeline)
+		self.assertIs(theMeasurement.timeline, theTimeline)
+		with self.assertRaises(ValueError):
+			sm.data.smMeasurement(data = theData, \
+								  timeline = sm.data.smTimeline(length = 20))
+
+
+	def test_settingAttributeData(self):
+		'''
+		Tests setting attribute :attr:`data`.
+		'''
+		theMeasurement = sm.data.smMeasurement(data = np.zeros((50,3,2)))
+		#Buffer protocol objects are attached without copying
+		theData = np.ones((50,1,1))
+		theMeasurement.data = memoryview(theData)
+		self.assertEqual(theMeasurement.data.shape, (50,1,1))
+		self.assertTrue(np.shares_memory(theMeasurement.data, theData))
+		with self.assertRaises(ValueError):
+			theMeasurement.data = np.zeros((49,3,2))
+		with self.assertRaises(ValueError):
+			theMeasurement.data = np.zeros((50,3))
+		with self.assertRaises(ValueError):
+			theMeasurement.data = 'Not a tensor'
+
+
+	def test_methodOpenData(self):
+		'''
+		Tests method :meth:`openData`.
+		'''
+		theData = np.random.rand(50,3,2)
+		theMeasurement = sm.data.smMeasurement(data = theData)
+		with tempfile.TemporaryDirectory() as tmpDir:
+			filename = os.path.join(tmpDir, 'data.npy')
+			np.save(filename, theData)
+			theMeasurement.openData(filename)
+			self.assertIsInstance(theMeasurement.data, np.memmap)
+			self.assertTrue(np.array_equal(theMeasurement.data[10:20], \
+										   theData[10:20]))
+			filename = os.path.join(tmpDir, 'data.bin')
+			theData.tofile(filename)
+			theMeasurement.openData(filename, shape = (50,3,2))
+			self.assertIsInstance(theMeasurement.data, np.memmap)
+			self.assertTrue(np.array_equal(theMeasurement.data, theData))
+			with self.assertRaises(ValueError):
+				theMeasurement.openData(filename, shape = (25,6,2))
+			#Release the maps before removing the files
+			theMeasurement.data = theData
+
+
+	def test_methodGetEpochs(self):
+		'''
+		Tests method :meth:`getEpochs`.
+		'''
+		theData = np.arange(100*2*3, dtype = float).reshape(100,2,3)
+		theMeasurement = sm.data.smMeasurement(data = theData)
+		condA = sm.data.smTimelineCondition(tag = 'condA')
+		theMeasurement.timeline.addConditions(condA)
+		evs = [sm.data.smTimelineEvent(onset = k, duration = 2) for k in (40, 10, 25)]
+		theMeasurement.timeline.addEvents(evs)
+		theMeasurement.timeline.associateEvents([ev.id for ev in evs], [condA.id])
+		epochs, ids = theMeasurement.getEpochs(condA, 5, 10)
+		self.assertEqual(epochs.shape, (3, 15, 2, 3))
+		self.assertEqual(ids.tolist(), [evs[1].id, evs[2].id, evs[0].id])
+		self.assertTrue(np.array_equal(epochs[0], theData[5:20]))
+		self.assertTrue(np.array_equal(epochs[2], theData[35:50]))
+		#Strided views for equally spaced events
+		view, _ = theMeasurement.getEpochs(condA.id, 5, 10, flagView = True)
+		self.assertTrue(np.shares_memory(view, theData))
+		self.assertTrue(np.array_equal(view, epochs))
+		self.assertFalse(view.flags.writeable)
+		#Baseline correction
+		epochs, _ = theMeasurement.getEpochs(condA, 5, 10, baseline = (-5, 0))
+		self.assertTrue(np.allclose(epochs[:, 0:5].mean(axis = 1), 0))
+		with self.assertRaises(ValueError):
+			theMeasurement.getEpochs(condA, 5, 10, baseline = (-8, 0))
+		#Windows out of the data are skipped
+		with self.assertWarns(SyntaxWarning):
+			epochs, ids = theMeasurement.getEpochs(condA, 12, 10)
+		self.assertEqual(ids.tolist(), [evs[2].id, evs[0].id])
+		#Unequally spaced events cannot be viewed
+		ev = sm.data.smTimelineEvent(onset = 80, duration = 2)
+		theMeasurement.timeline.addEvents(ev)
+		theMeasurement.timeline.associateEvents([ev.id], [condA.id])
+		with self.assertWarns(SyntaxWarning):
+			epochs, _ = theMeasurement.getEpochs(condA, 5, 10, flagView = True)
+		self.assertFalse(np.shares_memory(epochs, theData))
+
+
+
+	@staticmethod
+	def runTests():
+		'''
+		Class executable method
+		'''
+		print('TESTING smMeasurement')
+		#The unittest is faster then the print above. Wait 1/2 sec to ensure messages are print "in order"
+		time.sleep(0.5)
+		t = unittest.TestLoader().loadTestsFromTestCase(testSciMethDataSmMeasurement)
+		unittest.TextTestRunner(verbosity=2).run(t)
+		#unittest.main(verbosity=2)
+
+if __name__ == '__main__':
+	print(' ')
+	testSciMethDataSmMeasurement.runTests()
@@ -27,6 +27,14 @@ Contains the tests for class :class:`scimeth.data.smMeasurementUnit`
 |             |        |   using `try:except`.                                |
 |             |        | - Improved some comments                             |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodGetInterned`                           |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_internedID`                                  |
++-------------+--------+------------------------------------------------------+
 
 
 
@@ -40,6 +48,8 @@ Contains the tests for class :class:`scimeth.data.smMeasurementUnit`
 import sys
 import time
 import unittest
+import copy
+import pickle
 
 #Add paths
 if not sys.path[0] == '..':
@@ -112,6 +122,48 @@ class testSciMethDataSmMeasurementUnit(unittest.TestCase):
 							 name='Second', acronym = 's', isInternationalSystem = True)))
 
 
+	def test_methodGetInterned(self):
+		'''
+		Tests method :meth:`getInterned`.
+		'''
+		theUnit = sm.data.smMeasurementUnit.getInterned(multiplier=-3, \
+							name='Second', acronym = 's', isInternationalSystem = True)
+		self.assertTrue(theUnit.isInterned)
+		self.assertIs(theUnit, sm.data.smMeasurementUnit.getInterned(multiplier=-3.0, \
+							name='Second', acronym = 's', isInternationalSystem = True))
+		self.assertIsNot(theUnit, sm.data.smMeasurementUnit.getInterned(multiplier=-6, \
+							name='Second', acronym = 's', isInternationalSystem = True))
+		self.assertIs(copy.deepcopy(theUnit), theUnit)
+		self.assertIs(pickle.loads(pickle.dumps(theUnit)), theUnit)
+		self.assertTrue(theUnit.isEqual(theUnit))
+		with self.assertRaises(ValueError):
+			theUnit.multiplier = 0
+		#Units built with the constructor are not interned
+		otherUnit = sm.data.smMeasurementUnit(multiplier=-3, name='Second', \
+							acronym = 's', isInternationalSystem = True)
+		self.assertFalse(otherUnit.isInterned)
+		self.assertTrue(theUnit.isEqual(otherUnit))
+		self.assertIsNot(copy.deepcopy(otherUnit), otherUnit)
+
+
+
+	def test_internedID(self):
+		'''
+		Tests that the id of interned units cannot be changed.
+		'''
+		theUnit = sm.data.smMeasurementUnit.getInterned(multiplier=-3, \
+							name='Second', acronym = 's', isInternationalSystem = True)
+		theID = theUnit.id
+		with self.assertRaises(ValueError):
+			theUnit.id = theID + 1000
+		self.assertEqual(theUnit.id, theID)
+		#The id of units built with the constructor can be changed
+		otherUnit = sm.data.smMeasurementUnit(multiplier=-3, name='Second', \
+							acronym = 's', isInternationalSystem = True)
+		otherUnit.id = theID + 1000
+		self.assertEqual(otherUnit.id, theID + 1000)
+
+
 
 	@staticmethod
 	def runTests():
@@ -35,6 +35,52 @@ Contains the tests for class :class:`scimeth.data.smTimeline`
 |             |        |                                                      |
 |             |        | * `test_methodAddConditions`                         |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodAddEvents`                             |
+|             |        | * `test_methodRemoveEvents`                          |
+|             |        | * `test_methodGetConditions`                         |
+|             |        | * `test_methodRemoveConditions`                      |
+|             |        | * `test_readOnlyViews`                               |
+|             |        | * `test_methodGetOverlapConflicts`                   |
+|             |        | * `test_methodGetEventsInWindow`                     |
+|             |        | * `test_methodToSecondsAndToSamples`                 |
+|             |        | * `test_implicitTimestamps`                          |
+|             |        | * `test_methodGetEventsInSamples`                    |
+|             |        | * `test_methodSaveAndLoad`                           |
+|             |        | * `test_methodGetEventsConditions`                   |
+|             |        | * `test_methodAddEventColumns`                       |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodSortTimelineEvents`                    |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodWouldConflict`                         |
+|             |        | * `test_incrementalOverlapCheck`                     |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodGetBoxcar`                             |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodGetHRFKernel`                          |
+|             |        | * `test_methodGetRegressors`                         |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_overlapConflictsByChunks`                    |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_saveAndLoadInfos`                            |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_hrfCachesAreBounded`                         |
++-------------+--------+------------------------------------------------------+
 
 
 
@@ -46,7 +92,13 @@ Contains the tests for class :class:`scimeth.data.smTimeline`
 """
 
 import sys
+import os
+import builtins
+import pickle
+import gc
+import weakref
 import time
+import tempfile
 import unittest
 import copy
 
@@ -54,6 +106,8 @@ import copy
 if not sys.path[0] == '..':
 	sys.path.insert(0, '..')
 
+import numpy as np
+
 import scimeth as sm
 
 class testSciMethDataSmTimeline(unittest.TestCase):
@@ -184,6 +238,643 @@ class testSciMethDataSmTimeline(unittest.TestCase):
 		self.assertTrue(len(t.conditions)==4)
 		
 
+	def test_methodAddEvents(self):
+		'''
+		Tests method :meth:`addEvents`.
+		'''
+		t = sm.data.smTimeline()
+		evA = sm.data.smTimelineEvent(onset = 5, duration = 3)
+		evB = sm.data.smTimelineEvent(onset = 10, duration = 2)
+		t.addEvents([evA,evB]) #Added as list.
+		t.addEvents(sm.data.smTimelineEvent(onset = 20, duration = 1))
+					#A single event is wrapped into a set.
+		self.assertEqual(len(t.events), 3)
+		with self.assertWarns(SyntaxWarning):
+			t.addEvents({evA}) #Repeated id. It is discarded.
+		self.assertEqual(len(t.events), 3)
+		tmp = t.getEvents({evA.id})
+		self.assertEqual(len(tmp), 1)
+		self.assertTrue(tmp.pop().isEqual(evA))
+
+
+	def test_methodRemoveEvents(self):
+		'''
+		Tests method :meth:`removeEvents`.
+		'''
+		t = sm.data.smTimeline()
+		condA = sm.data.smTimelineCondition(tag='condA')
+		t.addConditions(condA)
+		evs = [sm.data.smTimelineEvent(onset = 10*i, duration = 2) for i in range(5)]
+		t.addEvents(evs)
+		t.associateEvents([ev.id for ev in evs], [condA.id])
+		t.removeEvents([evs[0].id, evs[1]])
+		self.assertEqual(t.getEventsID(), set([ev.id for ev in evs[2:]]))
+		self.assertEqual(set([ev.id for ev in t.getConditionsEvents(condA)]), \
+						 set([ev.id for ev in evs[2:]]))
+
+
+	def test_methodGetConditions(self):
+		'''
+		Tests method :meth:`getConditions`.
+		'''
+		t = sm.data.smTimeline()
+		conds = [sm.data.smTimelineCondition(tag='cond'+str(i)) for i in range(4)]
+		t.addConditions(set(conds))
+		self.assertEqual(len(t.getConditions()), 4)
+		tmp = t.getConditions([conds[1].id, conds[3].id, -1])
+		self.assertEqual(set([cond.id for cond in tmp]), \
+						 set([conds[1].id, conds[3].id]))
+		#Conditions are retrieved as copies
+		for cond in tmp:
+			self.assertNotIn(cond, conds)
+
+
+	def test_methodRemoveConditions(self):
+		'''
+		Tests method :meth:`removeConditions`.
+		'''
+		t = sm.data.smTimeline()
+		condA = sm.data.smTimelineCondition(tag='condA')
+		condB = sm.data.smTimelineCondition(tag='condB')
+		t.addConditions({condA, condB})
+		evA = sm.data.smTimelineEvent(onset = 3, duration = 2)
+		evB = sm.data.smTimelineEvent(onset = 8, duration = 2)
+		t.addEvents({evA, evB})
+		t.associateEvents([evA.id], [condA.id])
+		t.associateEvents([evB.id], [condB.id])
+		t.removeConditions([condA])
+		self.assertEqual(t.getConditionsID(), {condB.id})
+		self.assertEqual(len(t.getConditionsEvents(condB)), 1)
+		#Events are not removed with the conditions
+		self.assertEqual(t.getEventsID(), {evA.id, evB.id})
+
+
+	def test_readOnlyViews(self):
+		'''
+		Tests the read-only views :attr:`timestamps`, :attr:`eventsView`
+		and :attr:`conditionsView`, and method :meth:`copy`.
+		'''
+		t = sm.data.smTimeline()
+		condA = sm.data.smTimelineCondition(tag='condA')
+		t.addConditions(condA)
+		ev = sm.data.smTimelineEvent(onset = 3, duration = 2)
+		t.addEvents(ev)
+		with self.assertRaises(ValueError):
+			t.timestamps[0] = 5
+		theView = t.eventsView
+		self.assertEqual(theView['ids'].tolist(), [ev.id])
+		self.assertEqual(theView['ends'].tolist(), [5])
+		with self.assertRaises(ValueError):
+			theView['onsets'][0] = 1
+		with self.assertRaises(TypeError):
+			t.conditionsView[-1] = condA
+		self.assertEqual(list(t.conditionsView.keys()), [condA.id])
+		self.assertIsInstance(t.overlapStatus, frozenset)
+		#Copies are independent of the original
+		t2 = t.copy()
+		t2.removeEvents([ev.id])
+		self.assertEqual(t.getEventsID(), {ev.id})
+		self.assertEqual(t2.getEventsID(), set())
+
+
+	def test_methodGetOverlapConflicts(self):
+		'''
+		Tests method :meth:`getOverlapConflicts` and the overlap status.
+		'''
+		t = sm.data.smTimeline()
+		condA = sm.data.smTimelineCondition(tag='condA')
+		condB = sm.data.smTimelineCondition(tag='condB')
+		t.addConditions({condA, condB})
+		evA1 = sm.data.smTimelineEvent(onset = 0, duration = 5)
+		evA2 = sm.data.smTimelineEvent(onset = 20, duration = 5)
+		evB1 = sm.data.smTimelineEvent(onset = 5, duration = 5) #Touches evA1
+		evB2 = sm.data.smTimelineEvent(onset = 22, duration = 1) #Within evA2
+		evB3 = sm.data.smTimelineEvent(onset = 40, duration = 1)
+		t.addEvents([evA1, evA2, evB1, evB2, evB3])
+		t.allowOverlap({(condB.id, condA.id)})
+		self.assertEqual(t.overlapStatus, \
+						 {tuple(sorted([condA.id, condB.id]))})
+		t.associateEvents([evA1.id, evA2.id], [condA.id])
+		t.associateEvents([evB1.id, evB2.id, evB3.id], [condB.id])
+		self.assertEqual(t.getOverlapConflicts(), [])
+		#Forbidding the overlap reports all conflicts
+		with self.assertRaises(ValueError) as cm:
+			t.forbidOverlap([[condA.id, condB.id]])
+		if condA.id < condB.id:
+			expected = [(evA1.id, evB1.id), (evA2.id, evB2.id)]
+		else:
+			expected = [(evB1.id, evA1.id), (evB2.id, evA2.id)]
+		self.assertIn(' 2 conflicting pairs', str(cm.exception))
+		self.assertIn(', '.join([str(x) for x in sorted(expected)]), \
+					  str(cm.exception))
+		#...and leaves the timeline unchanged
+		self.assertEqual(t.overlapStatus, \
+						 {tuple(sorted([condA.id, condB.id]))})
+		self.assertEqual(t.getOverlapConflicts(), [])
+		with self.assertRaises(ValueError):
+			t.overlapStatus = set()
+		self.assertEqual(t.overlapStatus, \
+						 {tuple(sorted([condA.id, condB.id]))})
+		self.assertEqual(t.getOverlapConflicts(), [])
+
+
+	def test_methodGetEventsInWindow(self):
+		'''
+		Tests methods :meth:`getEventsInWindow` and :meth:`getActiveConditionsAt`.
+		'''
+		t = sm.data.smTimeline(length = 200)
+		condA = sm.data.smTimelineCondition(tag='condA')
+		condB = sm.data.smTimelineCondition(tag='condB')
+		t.addConditions({condA, condB})
+		evs = [sm.data.smTimelineEvent(onset = 10*i, duration = 4) for i in range(10)]
+		t.addEvents(evs)
+		t.associateEvents([ev.id for ev in evs[:5]], [condA.id])
+		t.associateEvents([ev.id for ev in evs[5:]], [condB.id])
+		self.assertEqual(t.getEventsInWindow(14, 31, flagOnlyIDs = True), \
+						 set([evs[1].id, evs[2].id, evs[3].id]))
+		self.assertEqual(set([ev.id for ev in t.getEventsInWindow(0, 0)]), \
+						 {evs[0].id})
+		self.assertEqual(t.getEventsInWindow(5, 9, flagOnlyIDs = True), set())
+		self.assertEqual(t.getActiveConditionsAt(62, flagOnlyIDs = True), \
+						 {condB.id})
+		self.assertEqual(t.getActiveConditionsAt(65, flagOnlyIDs = True), \
+						 set())
+		#The index follows changes in the events
+		t.removeEvents([evs[1].id])
+		self.assertEqual(t.getEventsInWindow(14, 31, flagOnlyIDs = True), \
+						 set([evs[2].id, evs[3].id]))
+		#Windows in seconds
+		tstamps = t.timestamps
+		self.assertEqual(t.getEventsInWindow(tstamps[20], tstamps[20], \
+						 unit = 'Second', flagOnlyIDs = True), {evs[2].id})
+
+
+	def test_methodToSecondsAndToSamples(self):
+		'''
+		Tests methods :meth:`toSeconds` and :meth:`toSamples`.
+		'''
+		#Uniformly sampled
+		t = sm.data.smTimeline(length = 100, samplingRate = 10, \
+							   timeMultiplier = -3)
+		evs = [sm.data.smTimelineEvent(onset = 10*i, duration = 5) for i in range(5)]
+		t.addEvents(evs)
+		t.toSeconds()
+		self.assertEqual(t.unit.name, 'Second')
+		for ev in t.events:
+			self.assertEqual(ev.unit.name, 'Second')
+			self.assertEqual(ev.unit.multiplier, -3)
+			self.assertAlmostEqual(ev.onset, (ev.id - evs[0].id) * 1000)
+			self.assertAlmostEqual(ev.duration, 500)
+		t.toSamples()
+		self.assertEqual(t.unit.name, 'Sample')
+		for ev in t.events:
+			self.assertEqual(ev.unit.name, 'Sample')
+			self.assertEqual(ev.onset, (ev.id - evs[0].id) * 10)
+			self.assertEqual(ev.duration, 5)
+		#Non-uniformly sampled; snaps to the closest timestamp
+		t = sm.data.smTimeline(length = 5, unit = 'Second')
+		t.timestamps = [0, 1, 2, 4, 8]
+		ev = sm.data.smTimelineEvent(unit = 'Second', onset = 2.9, duration = 2)
+		t.addEvents(ev)
+		t.toSamples()
+		tmp = t.getEvents([ev.id]).pop()
+		self.assertEqual(tmp.onset, 2)
+		self.assertEqual(tmp.duration, 1)
+
+
+	def test_implicitTimestamps(self):
+		'''
+		Tests that uniformly sampled timelines keep their timestamps
+		implicitly until non-uniform timestamps are set.
+		'''
+		t = sm.data.smTimeline(length = 1000, samplingRate = 250, \
+							   timeMultiplier = -3, init = 10)
+		self.assertIsNone(t._smTimeline__timestamps)
+		self.assertTrue(np.allclose(t.timestamps, np.linspace(10, 4006, 1000)))
+		self.assertAlmostEqual(t.end, 4006)
+		t.length = 1200
+		self.assertAlmostEqual(t.end, 4806)
+		t.timeMultiplier = 0
+		self.assertAlmostEqual(t.init, 0.01)
+		self.assertAlmostEqual(t.end, 4.806)
+		#Equally spaced timestamps are still kept implicitly
+		t.timestamps = [0, 1, 2, 3]
+		self.assertIsNone(t._smTimeline__timestamps)
+		self.assertEqual(t.samplingRate, 1)
+		#...but non-uniform ones are kept explicitly
+		t.timestamps = [0, 1, 2, 5]
+		self.assertEqual(t.timestamps.tolist(), [0, 1, 2, 5])
+		self.assertEqual(t.samplingRate, -1)
+		self.assertEqual(t.length, 4)
+
+
+	def test_methodGetEventsInSamples(self):
+		'''
+		Tests method :meth:`getEventsInSamples`.
+		'''
+		t = sm.data.smTimeline(length = 100, samplingRate = 10)
+		evA = sm.data.smTimelineEvent(onset = 30, duration = 5)
+		evB = sm.data.smTimelineEvent(unit = 'Second', onset = 1.21, duration = 0.5)
+		evC = sm.data.smTimelineEvent(onset = 4, duration = 1)
+		t.addEvents([evA, evB, evC])
+		ids, onsets, ends = t.getEventsInSamples()
+		self.assertEqual(ids.tolist(), [evC.id, evB.id, evA.id])
+		self.assertEqual(onsets.tolist(), [4, 12, 30])
+		self.assertEqual(ends.tolist(), [5, 17, 35])
+		ids, onsets, _ = t.getEventsInSamples({evA.id, -1})
+		self.assertEqual(ids.tolist(), [evA.id])
+		self.assertEqual(onsets.tolist(), [30])
+
+
+	def test_methodSaveAndLoad(self):
+		'''
+		Tests methods :meth:`save` and :meth:`load`.
+		'''
+		t = sm.data.smTimeline(unit = 'Second', length = 100, \
+							   samplingRate = 10, timeMultiplier = -3)
+		condA = sm.data.smTimelineCondition(tag = 'condA', description = 'The A')
+		condB = sm.data.smTimelineCondition(tag = 'condB')
+		t.addConditions({condA, condB})
+		evs = [sm.data.smTimelineEvent(onset = 5*i, duration = 2) for i in range(5)]
+		evs.append(sm.data.smTimelineEvent(onset = 3, duration = 1, info = 'The info'))
+		t.addEvents(evs)
+		t.associateEvents([ev.id for ev in evs[:3]], [condA.id])
+		t.associateEvents([evs[5].id], [condB.id])
+		t.allowOverlap({(condA.id, condB.id)})
+		with tempfile.TemporaryDirectory() as tmpDir:
+			filename = os.path.join(tmpDir, 'timeline.smtl')
+			t.save(filename)
+			t2 = sm.data.smTimeline.load(filename)
+			self.assertTrue(t.isEqual(t2))
+			self.assertEqual(t2.getConditions({condA.id}).pop().description, 'The A')
+			#Memory-mapped events and timestamps
+			t.timestamps = np.concatenate((np.arange(50), np.arange(50)+100))
+			t.save(filename)
+			t2 = sm.data.smTimeline.load(filename, flagMemoryMap = True)
+			self.assertTrue(t.isEqual(t2))
+			self.assertIsInstance(t2._smTimeline__timestamps, np.memmap)
+			#Changes are not written back to the file
+			t2.removeEvents({evs[0].id})
+			t3 = sm.data.smTimeline.load(filename)
+			self.assertTrue(t.isEqual(t3))
+			del t2, t3
+			#Unexpected files
+			with open(filename, 'wb') as f:
+				f.write(b'Not a timeline')
+			with self.assertRaises(ValueError):
+				sm.data.smTimeline.load(filename)
+
+
+	def test_methodGetEventsConditions(self):
+		'''
+		Tests method :meth:`getEventsConditions`.
+		'''
+		t = sm.data.smTimeline(length = 100)
+		condA = sm.data.smTimelineCondition(tag = 'condA')
+		condB = sm.data.smTimelineCondition(tag = 'condB')
+		t.addConditions({condA, condB})
+		t.allowOverlap({(condA.id, condB.id)})
+		evs = [sm.data.smTimelineEvent(onset = 10*i, duration = 2) for i in range(3)]
+		t.addEvents(evs)
+		t.associateEvents([evs[0].id, evs[1].id], [condA.id])
+		t.associateEvents([evs[1].id], [condB.id])
+		self.assertEqual(t.getEventsConditions(evs[0].id, flagOnlyIDs = True), {condA.id})
+		self.assertEqual(t.getEventsConditions([evs[1], evs[2]], flagOnlyIDs = True), \
+						 {condA.id, condB.id})
+		self.assertEqual(t.getEventsConditions({evs[2].id}), set())
+		#Removing events and conditions clears their associations
+		t.removeEvents({evs[1].id})
+		self.assertEqual(t.getConditionsEvents(condB.id, flagOnlyIDs = True), set())
+		t.removeConditions({condA.id})
+		self.assertEqual(t.getEventsConditions(evs[0].id, flagOnlyIDs = True), set())
+
+
+	def test_methodAddEventColumns(self):
+		'''
+		Tests method :meth:`addEventColumns`.
+		'''
+		t = sm.data.smTimeline(length = 1000)
+		condA = sm.data.smTimelineCondition(tag = 'condA')
+		condB = sm.data.smTimelineCondition(tag = 'condB')
+		t.addConditions({condA, condB})
+		onsets = np.arange(0, 1000, 10, dtype = float)
+		conds = np.where(np.arange(100) % 2 == 0, condA.id, condB.id)
+		ids = t.addEventColumns(onsets + 0.2, durations = np.full(100, 2), \
+								conditions = conds)
+		self.assertEqual(len(ids), 100)
+		self.assertEqual(len(np.unique(ids)), 100)
+		self.assertEqual(t.getEventsID(), set(ids.tolist()))
+		self.assertEqual(t.getConditionsEvents(condA.id, flagOnlyIDs = True), \
+						 set(ids[::2].tolist()))
+		ev = t.getEvents({int(ids[3])}).pop()
+		self.assertEqual((ev.onset, ev.end), (30, 32))
+		#New events do not reuse the reserved ids
+		self.assertGreater(sm.data.smTimelineEvent().id, ids.max())
+		#Id collisions are discarded
+		with self.assertWarns(SyntaxWarning):
+			newIDs = t.addEventColumns([5, 6, 7], ends = [6, 7, 8], \
+									   ids = [int(ids[0]), -5, -5])
+		self.assertEqual(newIDs.tolist(), [-5])
+		self.assertEqual(t.getEvents({-5}).pop().duration, 1)
+		#Conflicting associations are not added
+		t.forbidOverlap({(condA.id, condB.id)})
+		with self.assertRaises(ValueError):
+			t.addEventColumns([1], [5], conditions = [condB.id])
+		self.assertEqual(len(t.getEventsID()), 101)
+		with self.assertRaises(ValueError):
+			t.addEventColumns([1, 2], [5])
+
+
+
+	def test_methodSortTimelineEvents(self):
+		'''
+		Tests methods :meth:`sortTimelineEventsById` and
+		:meth:`sortTimelineEventsByOnset`.
+		'''
+		evA = sm.data.smTimelineEvent(onset = 2, end = 3)
+		evB = sm.data.smTimelineEvent(onset = 1, end = 3)
+		evC = sm.data.smTimelineEvent(onset = 2, end = 2)
+		evD = sm.data.smTimelineEvent(onset = 2, end = 3)
+		tmp = sm.data.smTimeline.sortTimelineEventsByOnset([evD, evA, evB, evC])
+		self.assertEqual([ev.id for ev in tmp], [evB.id, evC.id, evA.id, evD.id])
+		tmp = sm.data.smTimeline.sortTimelineEventsById([evD, evA, evB, evC])
+		self.assertEqual([ev.id for ev in tmp], [evA.id, evB.id, evC.id, evD.id])
+		self.assertEqual(sm.data.smTimeline.sortTimelineEventsByOnset([]), [])
+		#Stability and permutation of the underlying utility
+		tmp, perm = sm.utils.multikey_sort(['b', 'a', 'c', 'a'], \
+							[lambda x: x == 'c'], return_permutation = True)
+		self.assertEqual(tmp, ['b', 'a', 'a', 'c'])
+		self.assertEqual(perm.tolist(), [0, 1, 3, 2])
+
+
+
+	def test_methodWouldConflict(self):
+		'''
+		Tests method :meth:`wouldConflict`.
+		'''
+		theTimeline = sm.data.smTimeline()
+		condA = sm.data.smTimelineCondition()
+		condB = sm.data.smTimelineCondition()
+		theTimeline.addConditions({condA, condB})
+		ids = theTimeline.addEventColumns([0, 10, 20], durations = [4, 4, 4], \
+							conditions = [condA.id, condB.id, condA.id])
+		ev = sm.data.smTimelineEvent(onset = 12, duration = 1)
+		self.assertEqual(theTimeline.wouldConflict(ev), [])
+		self.assertEqual(theTimeline.wouldConflict(ev, {condA.id}), \
+						 [(condA.id, condB.id, ev.id, int(ids[1]))])
+		self.assertEqual(theTimeline.wouldConflict(ev, {condB.id}), [])
+		#Moving an existing event keeps its associations
+		tmp = theTimeline.getEvents({int(ids[2])}).pop()
+		tmp.onset = 13
+		self.assertEqual(theTimeline.wouldConflict(tmp), \
+						 [(condA.id, condB.id, int(ids[2]), int(ids[1]))])
+		#The timeline is not modified
+		self.assertEqual(theTimeline.getEvents({int(ids[2])}).pop().onset, 20)
+		theTimeline.allowOverlap({(condA.id, condB.id)})
+		self.assertEqual(theTimeline.wouldConflict(tmp), [])
+
+
+	def test_incrementalOverlapCheck(self):
+		'''
+		Tests that modifying a few events checks them against their
+		neighbouring events.
+		'''
+		theTimeline = sm.data.smTimeline()
+		condA = sm.data.smTimelineCondition()
+		condB = sm.data.smTimelineCondition()
+		theTimeline.addConditions({condA, condB})
+		n = 100
+		ids = theTimeline.addEventColumns(np.arange(n) * 10, durations = np.full(n, 4), \
+							conditions = [condA.id, condB.id] * (n // 2))
+		#Move one event next to its neighbour
+		ev = theTimeline.getEvents({int(ids[50])}).pop()
+		ev.onset = 505
+		theTimeline.setEvents(ev.id, ev)
+		self.assertEqual(theTimeline.getEvents({ev.id}).pop().onset, 505)
+		#A rejected edit leaves the timeline unchanged
+		before = theTimeline.copy()
+		ev.onset = 512
+		with self.assertRaises(ValueError):
+			theTimeline.setEvents(ev.id, ev)
+		self.assertTrue(theTimeline.isEqual(before))
+		self.assertEqual(theTimeline.getOverlapConflicts(), [])
+		#...even if the id of the event was also changed
+		oldId = ev.id
+		ev.id = int(ids[-1]) + 1000
+		with self.assertRaises(ValueError):
+			theTimeline.setEvents(oldId, ev)
+		self.assertTrue(theTimeline.isEqual(before))
+		self.assertEqual(theTimeline.getConditionsID(), {condA.id, condB.id})
+		self.assertEqual(theTimeline.getEvents({oldId}).pop().onset, 505)
+		#Associating an event to both conditions conflicts with itself
+		with self.assertRaises(ValueError):
+			theTimeline.associateEvents([int(ids[0]), int(ids[1])], [condB.id])
+		self.assertTrue(theTimeline.isEqual(before))
+		self.assertEqual(theTimeline.getOverlapConflicts(), [])
+
+
+
+	def test_methodGetBoxcar(self):
+		'''
+		Tests method :meth:`getBoxcar`.
+		'''
+		theTimeline = sm.data.smTimeline()
+		theTimeline.samplingRate = 10
+		theTimeline.length = 20
+		condA = sm.data.smTimelineCondition()
+		condB = sm.data.smTimelineCondition()
+		theTimeline.addConditions({condA, condB})
+		theTimeline.allowOverlap({(condA.id, condB.id)})
+		theTimeline.addEventColumns([1, 5], durations = [2, 0], \
+							conditions = [condA.id, condA.id], infos = [2, None])
+		theTimeline.addEventColumns([0.3], durations = [0.2], unit = 'Second', \
+							conditions = [condB.id], infos = [0.5])
+		boxcar, condIDs = theTimeline.getBoxcar([condB, condA.id])
+		self.assertEqual(condIDs, [condB.id, condA.id])
+		self.assertEqual(boxcar.shape, (20, 2))
+		self.assertEqual(np.flatnonzero(boxcar[:,0]).tolist(), [3, 4])
+		#Instantaneous events cover their onset sample
+		self.assertEqual(np.flatnonzero(boxcar[:,1]).tolist(), [1, 2, 5])
+		self.assertTrue((boxcar[boxcar != 0] == 1).all())
+		weighted, _ = theTimeline.getBoxcar(flagWeightByInfo = True)
+		self.assertEqual(weighted[:,0].tolist()[:6], [0, 2, 2, 0, 0, 1])
+		self.assertEqual(weighted[3,1], 0.5)
+		sparse, _ = theTimeline.getBoxcar(flagSparse = True, flagWeightByInfo = True)
+		self.assertTrue(np.array_equal(sparse.toarray(), weighted))
+		with self.assertRaises(ValueError):
+			theTimeline.getBoxcar([-1])
+
+
+
+	def test_methodGetHRFKernel(self):
+		'''
+		Tests method :meth:`getHRFKernel`.
+		'''
+		kernel = sm.data.smTimeline.getHRFKernel(10)
+		self.assertEqual(len(kernel), 320)
+		self.assertAlmostEqual(kernel.sum(), 1)
+		self.assertAlmostEqual(np.argmax(kernel) / 10, 5)
+		self.assertFalse(kernel.flags.writeable)
+		#Kernels are cached
+		self.assertIs(sm.data.smTimeline.getHRFKernel(10.0), kernel)
+		tmp = sm.data.smTimeline.getHRFKernel(10, hrfParameters = {'peakDelay' : 5})
+		self.assertIsNot(tmp, kernel)
+		tmp = sm.data.smTimeline.getHRFKernel(2, hrf = np.exp, \
+								hrfParameters = {'kernelLength' : 2})
+		self.assertTrue(np.allclose(tmp, np.exp([0, 0.5, 1, 1.5])))
+		with self.assertRaises(ValueError):
+			sm.data.smTimeline.getHRFKernel(10, hrfParameters = {'unknown' : 1})
+		with self.assertRaises(ValueError):
+			sm.data.smTimeline.getHRFKernel(0)
+
+
+	def test_methodGetRegressors(self):
+		'''
+		Tests method :meth:`getRegressors`.
+		'''
+		theTimeline = sm.data.smTimeline()
+		theTimeline.samplingRate = 10
+		theTimeline.length = 600
+		condA = sm.data.smTimelineCondition()
+		condB = sm.data.smTimelineCondition()
+		theTimeline.addConditions({condA, condB})
+		theTimeline.addEventColumns([10, 200, 400], durations = [50, 50, 20], \
+							conditions = [condA.id, condB.id, condA.id])
+		regressors, condIDs = theTimeline.getRegressors()
+		self.assertEqual(regressors.shape, (600, 2))
+		boxcar, _ = theTimeline.getBoxcar()
+		kernel = sm.data.smTimeline.getHRFKernel(10)
+		for j in range(2):
+			expected = np.convolve(boxcar[:,j], kernel)[:600]
+			self.assertTrue(np.allclose(regressors[:,j], expected))
+		#Already sampled kernels
+		regressors, _ = theTimeline.getRegressors([condB], hrf = np.array([1., 1.]))
+		self.assertTrue(np.allclose(regressors[199:202,0], [0, 1, 2]))
+
+
+
+	def test_overlapConflictsByChunks(self):
+		'''
+		Tests that the conflicts found by :meth:`getOverlapConflicts`
+		do not depend on the size of the chunks of the sweep.
+		'''
+		theTimeline = sm.data.smTimeline()
+		theTimeline.length = 1000
+		conds = [sm.data.smTimelineCondition(tag = 'c' + str(k)) for k in range(3)]
+		theTimeline.addConditions(set(conds))
+		condIDs = sorted([cond.id for cond in conds])
+		theTimeline.allowOverlap({(condIDs[0], condIDs[1]), \
+						(condIDs[0], condIDs[2]), (condIDs[1], condIDs[2])})
+		durations = np.full(60, 10)
+		durations[3] = 150 #An event overlapping with many others
+		theTimeline.addEventColumns(np.arange(60) * 3, durations = durations, \
+						conditions = np.array(condIDs)[np.arange(60) % 3])
+		messages = list()
+		for chunkSize in [None, 2, 7]:
+			tmpTimeline = copy.deepcopy(theTimeline)
+			defaultChunkSize = sm.data.smTimeline._smTimeline__SWEEPCHUNKSIZE
+			if chunkSize is not None:
+				sm.data.smTimeline._smTimeline__SWEEPCHUNKSIZE = chunkSize
+			try:
+				with self.assertRaises(ValueError) as cm:
+					tmpTimeline.forbidOverlap({(condIDs[0], condIDs[2])})
+			finally:
+				sm.data.smTimeline._smTimeline__SWEEPCHUNKSIZE = defaultChunkSize
+			messages.append(str(cm.exception))
+		self.assertIn(' 55 conflicting pairs', messages[0])
+		self.assertEqual(messages[1], messages[0])
+		self.assertEqual(messages[2], messages[0])
+
+
+
+	def test_saveAndLoadInfos(self):
+		'''
+		Tests that :meth:`save` writes the events' information as JSON,
+		and that :meth:`load` rejects pickled information unless
+		explicitly allowed.
+		'''
+		class tamperedInfo():
+			def __reduce__(self):
+				return (exec, ('import builtins; builtins.smtlPayloadRun = True',))
+		
+		t = sm.data.smTimeline(length = 100)
+		evs = [sm.data.smTimelineEvent(onset = 5*i, duration = 2) for i in range(3)]
+		evs[0].info = {'trial': 1, 'response': [0.5, 'left']}
+		t.addEvents(evs)
+		with tempfile.TemporaryDirectory() as tmpDir:
+			filename = os.path.join(tmpDir, 'timeline.smtl')
+			t.save(filename)
+			with open(filename, 'rb') as f:
+				self.assertNotIn(b'"infos": {"dtype"', f.read()) #Not an array
+			t2 = sm.data.smTimeline.load(filename)
+			self.assertTrue(t.isEqual(t2))
+			self.assertEqual(t2.getEvents({evs[0].id}).pop().info, evs[0].info)
+			#Information that does not survive JSON is only pickled if allowed
+			t.setEvents([evs[1].id], [sm.data.smTimelineEvent(onset = 5, \
+							duration = 2, info = ('a', 1))])
+			with self.assertRaises(ValueError):
+				t.save(filename)
+			t.save(filename, allowPickle = True)
+			with self.assertRaises(ValueError):
+				sm.data.smTimeline.load(filename)
+			t2 = sm.data.smTimeline.load(filename, allowPickle = True)
+			self.assertTrue(t.isEqual(t2))
+			#A tampered pickle is rejected, and not unpickled
+			t.setEvents([evs[1].id], [sm.data.smTimelineEvent(onset = 5, \
+							duration = 2, info = ('a' * 200, 1))])
+			t.save(filename, allowPickle = True)
+			blob = pickle.dumps(t._smTimeline__events.infos.tolist())
+			payload = pickle.dumps(tamperedInfo())
+			with open(filename, 'rb') as f:
+				content = f.read()
+			self.assertIn(blob, content)
+			content = content.replace(blob, payload.ljust(len(blob), b'\x00'))
+			with open(filename, 'wb') as f:
+				f.write(content)
+			with self.assertRaises(ValueError):
+				sm.data.smTimeline.load(filename)
+			self.assertFalse(hasattr(builtins, 'smtlPayloadRun'))
+
+
+
+	def test_hrfCachesAreBounded(self):
+		'''
+		Tests that the caches of HRF kernels and of their FFTs are
+		bounded, and that kernels from user-supplied functions are not
+		cached.
+		'''
+		hrf = lambda t: np.exp(-t)
+		theRef = weakref.ref(hrf)
+		kernel = sm.data.smTimeline.getHRFKernel(10, hrf = hrf)
+		self.assertIsNot(sm.data.smTimeline.getHRFKernel(10, hrf = hrf), kernel)
+		theTimeline = sm.data.smTimeline()
+		theTimeline.samplingRate = 10
+		theTimeline.length = 50
+		condA = sm.data.smTimelineCondition()
+		theTimeline.addConditions(condA)
+		theTimeline.addEventColumns([10], durations = [5], conditions = [condA.id])
+		regressors, _ = theTimeline.getRegressors(hrf = hrf)
+		expected = np.convolve(theTimeline.getBoxcar()[0][:,0], kernel)[:50]
+		self.assertTrue(np.allclose(regressors[:,0], expected))
+		del hrf, kernel
+		gc.collect()
+		self.assertIsNone(theRef())
+		#Kernels and FFTs of many lengths
+		kernels = sm.data.smTimeline._smTimeline__hrfKernels
+		kernelFFTs = sm.data.smTimeline._smTimeline__hrfKernelFFTs
+		for samplingRate in range(1, 100):
+			sm.data.smTimeline.getHRFKernel(samplingRate)
+		for length in range(1, 20):
+			theTimeline.length = 2**length
+			theTimeline.getRegressors()
+		self.assertLessEqual(len(kernels), \
+				sm.data.smTimeline._smTimeline__HRFKERNELCACHESIZE)
+		self.assertLessEqual(len(kernelFFTs), \
+				sm.data.smTimeline._smTimeline__HRFFFTCACHESIZE)
+		#The most recently used are kept
+		self.assertIs(sm.data.smTimeline.getHRFKernel(99), \
+					  sm.data.smTimeline.getHRFKernel(99.0))
+
 
 
 	@staticmethod
@@ -30,6 +30,12 @@ Contains the tests for class :class:`scimeth.data.smTimelineEvent`
 |             |        |                                                      |
 |             |        | * `test_methodHasOverlap`                            |
 +-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - `test_messWithNextID` updated; events no longer    |
+|             |        |   admit new attributes on the fly (`__slots__`).     |
+|             |        | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_sharedUnits`                                 |
++-------------+--------+------------------------------------------------------+
 
 
 
@@ -192,10 +198,30 @@ class testSciMethDataSmTimelineEvent(unittest.TestCase):
 		#Departing from samples
 		theEvent = sm.data.smTimelineEvent()
 		tmpNextID = theEvent._smIdentifiable__nextID
-		theEvent.__nextID = -8 #This will create a new attribute on the fly,
-								#but it is NOT accesing the "real" __nextID
-		self.assertNotEqual(theEvent._smIdentifiable__nextID,theEvent.__nextID)
+		with self.assertRaises(AttributeError):
+			theEvent.__nextID = -8 #This would create a new attribute on the fly,
+								#but events do not admit new attributes.
+								#In any case, it is NOT accesing the "real" __nextID
 		self.assertEqual(theEvent._smIdentifiable__nextID,tmpNextID)
+
+
+	def test_sharedUnits(self):
+		'''
+		Tests that events share their units and that these are not
+		exposed.
+		'''
+		ev1 = sm.data.smTimelineEvent(unit = 'Second', onset = 3, unitMultiplier = -3)
+		ev2 = sm.data.smTimelineEvent(unit = 'Second', onset = 4, unitMultiplier = -3)
+		self.assertFalse(hasattr(ev1, '__dict__'))
+		self.assertIs(ev1._smTimelineEvent__unit, ev2._smTimelineEvent__unit)
+		self.assertTrue(ev1.unit.isInterned)
+		with self.assertRaises(ValueError):
+			ev1.unit.multiplier = 3
+		self.assertEqual(ev2.unit.multiplier, -3)
+		ev2.toSamples(samplingRate = 1000)
+		self.assertEqual(ev2.onset, 4)
+		self.assertTrue(ev2.isInSamples())
+		self.assertTrue(ev1.isInSeconds())
 		
 
 	def test_methodHasOverlap(self):
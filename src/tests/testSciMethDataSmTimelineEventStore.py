@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#
+#File: testSciMethDataSmTimelineEventStore.py
+#
+"""
+Created on Sun Oct 18 11:02:37 2026
+
+Module ***testSciMethDataSmTimelineEventStore***
+
+Contains the tests for class :class:`scimeth.data.smTimelineEventStore`
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Test module created                                |
+|             |        | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_ObjectConstructionDefaultCall`               |
+|             |        | * `test_methodAddEvents`                             |
+|             |        | * `test_methodRemove`                                |
+|             |        | * `test_methodMaterialise`                           |
+|             |        |                                                      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodHasID`                                 |
+|             |        | * `test_methodGetPositionsInWindow`                  |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodAttachColumns`                         |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_staleIntervalIndex`                          |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso:: None
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+"""
+
+import sys
+import time
+import unittest
+
+import numpy as np
+
+#Add paths
+if not sys.path[0] == '..':
+	sys.path.insert(0, '..')
+
+import scimeth as sm
+
+class testSciMethDataSmTimelineEventStore(unittest.TestCase):
+	'''A test suite for :class:`smTimelineEventStore <scimeth.data.smTimelineEventStore>`
+	'''
+
+
+	def test_ObjectConstructionDefaultCall(self):
+		'''
+		Tests object creation with a default call to constructor.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		self.assertIsInstance(theStore,sm.data.smTimelineEventStore,\
+		   'Test: Cannot construct object with default call to constructor.')
+		self.assertEqual(len(theStore), 0)
+		self.assertEqual(len(theStore.ids), 0)
+
+
+	def test_methodAddEvents(self):
+		'''
+		Tests method :meth:`addEvents`.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		evs = [sm.data.smTimelineEvent(onset = 3*i, duration = 2) for i in range(40)]
+		theStore.addEvents(evs)
+		self.assertEqual(len(theStore), 40)
+		self.assertGreaterEqual(theStore.capacity, 40)
+		self.assertEqual(theStore.ids.tolist(), [ev.id for ev in evs])
+		self.assertEqual(theStore.onsets.tolist(), [ev.onset for ev in evs])
+		self.assertEqual(theStore.ends.tolist(), [ev.end for ev in evs])
+		self.assertTrue((theStore.units == theStore.SAMPLE).all())
+		ev = sm.data.smTimelineEvent(unit = 'Second', onset = 1.5, \
+								duration = 0.5, unitMultiplier = -3)
+		theStore.addEvents([ev])
+		self.assertEqual(theStore.units[-1], theStore.SECOND)
+		self.assertEqual(theStore.multipliers[-1], -3)
+
+
+	def test_methodRemove(self):
+		'''
+		Tests method :meth:`remove`.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		evs = [sm.data.smTimelineEvent(onset = i, duration = 1) for i in range(10)]
+		theStore.addEvents(evs)
+		positions = theStore.getPositions([evs[2].id, evs[5].id, -1])
+		self.assertEqual(positions.tolist(), [2, 5])
+		theStore.remove(positions)
+		self.assertEqual(len(theStore), 8)
+		self.assertNotIn(evs[2].id, theStore.ids)
+		self.assertEqual(theStore.onsets.tolist(), [0, 1, 3, 4, 6, 7, 8, 9])
+
+
+	def test_methodMaterialise(self):
+		'''
+		Tests method :meth:`materialise`.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		ev = sm.data.smTimelineEvent(onset = 4, duration = 3, info = 'The info')
+		theStore.addEvents([ev])
+		tmp = theStore.materialise()
+		self.assertEqual(len(tmp), 1)
+		self.assertIsNot(tmp[0], ev)
+		self.assertTrue(tmp[0].isEqual(ev))
+		#Changes to the materialised event do not affect the store
+		tmp[0].onset = 1
+		self.assertEqual(theStore.onsets[0], 4)
+
+
+	def test_methodHasID(self):
+		'''
+		Tests method :meth:`hasID` and that the index of ids is kept
+		after removing and setting events.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		evs = [sm.data.smTimelineEvent(onset = i, duration = 1) for i in range(6)]
+		theStore.addEvents(evs)
+		self.assertTrue(theStore.hasID(evs[3].id))
+		theStore.remove(theStore.getPositions([evs[1].id]))
+		self.assertFalse(theStore.hasID(evs[1].id))
+		self.assertEqual(theStore.getPositions([evs[3].id]).tolist(), [2])
+		newEv = sm.data.smTimelineEvent(onset = 20, duration = 1)
+		theStore.setEvents(theStore.getPositions([evs[0].id]), [newEv])
+		self.assertFalse(theStore.hasID(evs[0].id))
+		self.assertEqual(theStore.getPositions([newEv.id]).tolist(), [0])
+
+
+	def test_methodGetPositionsInWindow(self):
+		'''
+		Tests method :meth:`getPositionsInWindow`.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		theStore.addColumns([1, 2, 3, 4], [30, 0, 10, 2], [5, 50, 2, 1])
+		self.assertEqual(theStore.getPositionsInWindow(11, 20, \
+						 theStore.SAMPLE).tolist(), [1, 2])
+		self.assertEqual(theStore.getPositionsInWindow(3, 3, \
+						 theStore.SAMPLE).tolist(), [1, 3])
+		self.assertEqual(theStore.getPositionsInWindow(3, 3, \
+						 theStore.SECOND).tolist(), [])
+		#Scaling of the multipliers
+		self.assertEqual(theStore.getPositionsInWindow(0.3, 0.3, \
+						 theStore.SAMPLE, multiplier = 1).tolist(), [1, 3])
+		#The index is rebuilt after modifications
+		theStore.setColumns([1], onsets = [100])
+		self.assertEqual(theStore.getPositionsInWindow(3, 3, \
+						 theStore.SAMPLE).tolist(), [3])
+
+
+	def test_methodAttachColumns(self):
+		'''
+		Tests method :meth:`attachColumns`.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		theStore.addColumns([7], [1], [1])
+		onsets = np.array([0., 10., 20.])
+		theStore.attachColumns(np.array([1, 2, 3]), onsets, np.ones(3), \
+							   onsets + 1, np.zeros(3, dtype = np.int8), np.zeros(3))
+		self.assertEqual(len(theStore), 3)
+		self.assertFalse(theStore.hasID(7))
+		self.assertEqual(theStore.getPositions([3]).tolist(), [2])
+		self.assertTrue(np.shares_memory(theStore.onsets, onsets))
+		with self.assertRaises(ValueError):
+			theStore.attachColumns(np.array([1.5]), np.zeros(1), np.zeros(1), \
+							   np.zeros(1), np.zeros(1, dtype = np.int8), np.zeros(1))
+
+
+
+	def test_staleIntervalIndex(self):
+		'''
+		Tests that window queries account for the events modified or
+		added after the interval index was built.
+		'''
+		theStore = sm.data.smTimelineEventStore()
+		theStore.addColumns(np.arange(10), np.arange(10) * 10, np.ones(10))
+		self.assertEqual(theStore.getPositionsInWindow(30, 30, \
+						 theStore.SAMPLE).tolist(), [3])
+		theStore.setColumns([3], onsets = [55])
+		theStore.setColumns([4], units = [theStore.SECOND])
+		theStore.addColumns([10], [31], [2])
+		self.assertEqual(theStore.getPositionsInWindow(30, 40, \
+						 theStore.SAMPLE).tolist(), [10])
+		self.assertEqual(theStore.getPositionsInWindow(50, 60, \
+						 theStore.SAMPLE).tolist(), [3, 5, 6])
+		self.assertEqual(theStore.getPositionsInWindow(40, 40, \
+						 theStore.SECOND).tolist(), [4])
+		#Removing events rebuilds the index
+		theStore.remove([0])
+		self.assertEqual(theStore.getPositionsInWindow(30, 40, \
+						 theStore.SAMPLE).tolist(), [9])
+
+
+
+	@staticmethod
+	def runTests():
+		'''
+		Class executable method
+		'''
+		print('TESTING smTimelineEventStore')
+		#The unittest is faster then the print above. Wait 1/2 sec to ensure messages are print "in order"
+		time.sleep(0.5)
+		t = unittest.TestLoader().loadTestsFromTestCase(testSciMethDataSmTimelineEventStore)
+		unittest.TextTestRunner(verbosity=2).run(t)
+		#unittest.main(verbosity=2)
+
+if __name__ == '__main__':
+	print(' ')
+	testSciMethDataSmTimelineEventStore.runTests()
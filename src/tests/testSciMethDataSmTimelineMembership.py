@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+#File: testSciMethDataSmTimelineMembership.py
+#
+"""
+Created on Sun Oct 18 19:05:48 2026
+
+Module ***testSciMethDataSmTimelineMembership***
+
+Contains the tests for class :class:`scimeth.data.smTimelineMembership`
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Test module created                                |
+|             |        | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_ObjectConstructionDefaultCall`               |
+|             |        | * `test_methodAssociate`                             |
+|             |        | * `test_methodDissociate`                            |
+|             |        | * `test_methodRemoveEvents`                          |
+|             |        | * `test_methodRenameEvent`                           |
+|             |        |                                                      |
++-------------+--------+------------------------------------------------------+
+| 18-Oct-2026 | FOE    | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_incrementalUpdates`                          |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso:: None
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+"""
+
+import sys
+import time
+import unittest
+
+import numpy as np
+
+#Add paths
+if not sys.path[0] == '..':
+	sys.path.insert(0, '..')
+
+import scimeth as sm
+
+class testSciMethDataSmTimelineMembership(unittest.TestCase):
+	'''A test suite for :class:`smTimelineMembership <scimeth.data.smTimelineMembership>`
+	'''
+
+
+	def test_ObjectConstructionDefaultCall(self):
+		'''
+		Tests object creation with a default call to constructor.
+		'''
+		theMembership = sm.data.smTimelineMembership()
+		self.assertIsInstance(theMembership,sm.data.smTimelineMembership,\
+		   'Test: Cannot construct object with default call to constructor.')
+		self.assertEqual(len(theMembership), 0)
+		self.assertEqual(theMembership.getEvents([1]).tolist(), [])
+
+
+	def test_methodAssociate(self):
+		'''
+		Tests method :meth:`associate` and the row and column extraction.
+		'''
+		theMembership = sm.data.smTimelineMembership()
+		theMembership.associate({2, 1}, [10, 11])
+		theMembership.associate([3], [11, 12])
+		theMembership.associate([1], [10]) #Repeated pairs are kept once
+		self.assertEqual(len(theMembership), 6)
+		self.assertEqual(theMembership.conditionIDs.tolist(), [1, 1, 2, 2, 3, 3])
+		self.assertEqual(theMembership.eventIDs.tolist(), [10, 11, 10, 11, 11, 12])
+		self.assertEqual(theMembership.getEvents([1, 3]).tolist(), [10, 11, 12])
+		self.assertEqual(theMembership.getEvents([4]).tolist(), [])
+		self.assertEqual(theMembership.getConditions([11]).tolist(), [1, 2, 3])
+		self.assertEqual(theMembership.getConditions([12, 13]).tolist(), [3])
+
+
+	def test_methodDissociate(self):
+		'''
+		Tests method :meth:`dissociate` and :meth:`removeConditions`.
+		'''
+		theMembership = sm.data.smTimelineMembership()
+		theMembership.associate([1, 2, 3], [10, 11, 12])
+		theMembership.dissociate([1, 2], [11, 12, 13])
+		self.assertEqual(theMembership.getEvents([1]).tolist(), [10])
+		self.assertEqual(theMembership.getConditions([11]).tolist(), [3])
+		theMembership.removeConditions([3])
+		self.assertEqual(theMembership.getConditions([11]).tolist(), [])
+		self.assertEqual(len(theMembership), 2)
+
+
+	def test_methodRemoveEvents(self):
+		'''
+		Tests method :meth:`removeEvents`.
+		'''
+		theMembership = sm.data.smTimelineMembership()
+		theMembership.associate(range(100), [10, 11])
+		theMembership.removeEvents([10])
+		self.assertEqual(len(theMembership), 100)
+		self.assertEqual(theMembership.getConditions([10]).tolist(), [])
+		self.assertEqual(theMembership.getEvents([50]).tolist(), [11])
+
+
+	def test_methodRenameEvent(self):
+		'''
+		Tests methods :meth:`renameEvent` and :meth:`renameCondition`.
+		'''
+		theMembership = sm.data.smTimelineMembership()
+		theMembership.associate([1, 2], [10])
+		theMembership.associate([2], [11])
+		theMembership.renameEvent(10, 20)
+		self.assertEqual(theMembership.getEvents([2]).tolist(), [11, 20])
+		theMembership.renameCondition(2, 0)
+		self.assertEqual(theMembership.conditionIDs.tolist(), [0, 0, 1])
+		self.assertEqual(theMembership.getConditions([20]).tolist(), [0, 1])
+
+
+
+	def test_incrementalUpdates(self):
+		'''
+		Tests that the pairs, and their copy sorted by event, are kept
+		sorted and without repetitions as the associations are modified.
+		'''
+		rng = np.random.default_rng(0)
+		theMembership = sm.data.smTimelineMembership()
+		theMembership.associate([1, 2], np.arange(0, 40, 2))
+		theMembership.getConditions([0]) #Builds the copy sorted by event
+		expected = set((c, e) for c in [1, 2] for e in range(0, 40, 2))
+		for k in range(30):
+			conds = rng.integers(0, 6, 2).tolist()
+			evs = rng.integers(0, 50, 3).tolist()
+			operation = k % 5
+			if operation == 0:
+				theMembership.associate(conds, evs)
+				expected |= set((c, e) for c in conds for e in evs)
+			elif operation == 1:
+				theMembership.addPairs(conds[:1] * 3, evs)
+				expected |= set((conds[0], e) for e in evs)
+			elif operation == 2:
+				theMembership.dissociate(conds, evs)
+				expected -= set((c, e) for c in conds for e in evs)
+			elif operation == 3:
+				theMembership.renameCondition(conds[0], conds[1])
+				expected = set(((conds[1] if c == conds[0] else c), e) for c, e in expected)
+			else:
+				theMembership.renameEvent(evs[0], evs[1])
+				expected = set((c, (evs[1] if e == evs[0] else e)) for c, e in expected)
+			pairs = sorted(expected)
+			self.assertEqual(list(zip(theMembership.conditionIDs.tolist(), \
+									  theMembership.eventIDs.tolist())), pairs)
+			byEvent, byEventConditions = theMembership.getEventPairs(range(50))
+			self.assertEqual(list(zip(byEvent.tolist(), byEventConditions.tolist())), \
+							 sorted((e, c) for c, e in pairs))
+
+
+
+	@staticmethod
+	def runTests():
+		'''
+		Class executable method
+		'''
+		print('TESTING smTimelineMembership')
+		#The unittest is faster then the print above. Wait 1/2 sec to ensure messages are print "in order"
+		time.sleep(0.5)
+		t = unittest.TestLoader().loadTestsFromTestCase(testSciMethDataSmTimelineMembership)
+		unittest.TextTestRunner(verbosity=2).run(t)
+		#unittest.main(verbosity=2)
+
+if __name__ == '__main__':
+	print(' ')
+	testSciMethDataSmTimelineMembership.runTests()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+#File: testSciMethGuiSmGuiConditionWidget.py
+#
+"""
+Created on Sun Oct 18 22:41:09 2026
+
+Module ***testSciMethGuiSmGuiConditionWidget***
+
+Contains the tests for class :class:`scimeth.gui.smGuiTimeline.smGuiConditionWidget`
+which do not need a display, e.g. the write back of the edited rows of
+the events treeview.
+
+:Log:
+
++-------------+--------+------------------------------------------------------+
+| Date        | Author | Description                                          |
++=============+========+======================================================+
+| 18-Oct-2026 | FOE    | - Test module created                                |
+|             |        | - Added tests:                                       |
+|             |        |                                                      |
+|             |        | * `test_methodUpdateRowValues`                       |
+|             |        | * `test_methodApplyRowValues`                        |
+|             |        |                                                      |
++-------------+--------+------------------------------------------------------+
+
+
+.. seealso:: None
+
+.. sectionauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+.. codeauthor:: Felipe Orihuela-Espina <f.orihuela-espina@inaoep.mx>
+
+"""
+
+import sys
+import time
+import unittest
+
+#Add paths
+if not sys.path[0] == '..':
+	sys.path.insert(0, '..')
+
+import scimeth as sm
+from scimeth.gui.smGuiTimeline import smGuiConditionWidget
+
+class testSciMethGuiSmGuiConditionWidget(unittest.TestCase):
+	'''A test suite for :class:`smGuiConditionWidget <scimeth.gui.smGuiTimeline.smGuiConditionWidget>`
+	'''
+
+
+	def test_methodUpdateRowValues(self):
+		'''
+		Tests method :meth:`_updateRowValues`.
+		'''
+		#Editing the duration moves the end
+		self.assertEqual(smGuiConditionWidget._updateRowValues( \
+							('10', '8', '15'), '#2'), ('10', '8', '18.0'))
+		#Editing the onset moves the event
+		self.assertEqual(smGuiConditionWidget._updateRowValues( \
+							(12, 5, 15), '#1'), ('12', '5', '17.0'))
+		#Editing the end changes the duration
+		self.assertEqual(smGuiConditionWidget._updateRowValues( \
+							('10', '5', '12'), '#3'), ('10', '2.0', '12'))
+		with self.assertRaises(ValueError):
+			smGuiConditionWidget._updateRowValues(('10', 'abc', '15'), '#2')
+
+
+	def test_methodApplyRowValues(self):
+		'''
+		Tests method :meth:`_applyRowValues`.
+		'''
+		for column, values, expected in [('#2', ('10', '8', '15'), (10, 8, 18)), \
+										 ('#1', ('12', '5', '15'), (12, 5, 17)), \
+										 ('#3', ('10', '5', '12'), (10, 2, 12))]:
+			ev = sm.data.smTimelineEvent(onset = 10, duration = 5)
+			values = smGuiConditionWidget._updateRowValues(values, column)
+			res = smGuiConditionWidget._applyRowValues(ev, values)
+			self.assertIs(res, ev)
+			self.assertEqual((ev.onset, ev.duration, ev.end), expected)
+
+
+
+	@staticmethod
+	def runTests():
+		'''
+		Class executable method
+		'''
+		print('TESTING smGuiConditionWidget')
+		#The unittest is faster then the print above. Wait 1/2 sec to ensure messages are print "in order"
+		time.sleep(0.5)
+		t = unittest.TestLoader().loadTestsFromTestCase(testSciMethGuiSmGuiConditionWidget)
+		unittest.TextTestRunner(verbosity=2).run(t)
+		#unittest.main(verbosity=2)
+
+if __name__ == '__main__':
+	print(' ')
+	testSciMethGuiSmGuiConditionWidget.runTests()
\ No newline at end of file